@@ -1,10 +1,13 @@
 """scrapli_cfg"""
 
 from scrapli_cfg.factory import AsyncScrapliCfg, ScrapliCfg
+from scrapli_cfg.fleet import AsyncScrapliCfgFleet, ScrapliCfgFleet
 
 __version__ = "2025.01.30"
 
 __all__ = (
     "AsyncScrapliCfg",
+    "AsyncScrapliCfgFleet",
     "ScrapliCfg",
+    "ScrapliCfgFleet",
 )
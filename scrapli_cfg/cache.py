@@ -0,0 +1,196 @@
+"""scrapli_cfg.cache"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from scrapli_cfg.response import ScrapliCfgResponse
+
+
+class ConfigCache:
+    def __init__(self, ttl: float = 300.0, max_entries: int = 8) -> None:
+        """
+        LRU cache of `get_config` results w/ a ttl
+
+        Pass an instance of this to a scrapli_cfg platform (`config_cache` argument) to have repeat
+        `get_config` calls served from the cache rather than the device. The platforms invalidate
+        the cache on `commit_config`, `abort_config` and `cleanup`; the ttl guards against changes
+        made to the device outside of scrapli_cfg. Entries are keyed by host, port and config
+        source, so a single (thread safe) cache can be shared by any number of platforms -- size
+        max_entries for the number of devices sharing it.
+
+        Args:
+            ttl: seconds a cached config is valid for
+            max_entries: maximum number of configs to cache, least recently used entries are evicted
+                first
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: if ttl or max_entries are not positive
+
+        """
+        if ttl <= 0 or max_entries <= 0:
+            raise ValueError("ttl and max_entries must be positive")
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        # ("host:port", source) -> (expiry time, response)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, ScrapliCfgResponse]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for ConfigCache class
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for class object
+
+        Raises:
+            N/A
+
+        """
+        return f"ConfigCache <ttl: {self.ttl}, entries: {len(self._entries)}/{self.max_entries}>"
+
+    def __len__(self) -> int:
+        """
+        Magic len method for ConfigCache class
+
+        Args:
+            N/A
+
+        Returns:
+            int: number of (possibly expired) entries in the cache
+
+        Raises:
+            N/A
+
+        """
+        return len(self._entries)
+
+    @staticmethod
+    def _device_key(host: str, port: int) -> str:
+        """
+        Return the key a device's configs are stored under
+
+        Args:
+            host: device host
+            port: device port
+
+        Returns:
+            str: device key
+
+        Raises:
+            N/A
+
+        """
+        return f"{host}:{port}"
+
+    def get(self, host: str, port: int, source: str) -> Optional[ScrapliCfgResponse]:
+        """
+        Get a cached config response
+
+        Args:
+            host: device host
+            port: device port
+            source: name of the config source, generally running|startup
+
+        Returns:
+            ScrapliCfgResponse: cached response, or None if not cached or expired
+
+        Raises:
+            N/A
+
+        """
+        key = (self._device_key(host=host, port=port), source)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expiry, response = entry
+            if time.monotonic() >= expiry:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, host: str, port: int, source: str, response: ScrapliCfgResponse) -> None:
+        """
+        Cache a config response
+
+        Args:
+            host: device host
+            port: device port
+            source: name of the config source, generally running|startup
+            response: get_config response to cache
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        key = (self._device_key(host=host, port=port), source)
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, host: str, port: int, source: Optional[str] = None) -> None:
+        """
+        Invalidate a single cached config or all cached configs of a device
+
+        Args:
+            host: device host
+            port: device port
+            source: config source to invalidate, if not provided all sources of the device are
+                invalidated
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        device_key = self._device_key(host=host, port=port)
+
+        with self._lock:
+            if source is not None:
+                self._entries.pop((device_key, source), None)
+                return
+
+            for key in [key for key in self._entries if key[0] == device_key]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Invalidate every cached config of every device
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        with self._lock:
+            self._entries.clear()
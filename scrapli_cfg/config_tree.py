@@ -0,0 +1,538 @@
+"""scrapli_cfg.config_tree"""
+
+import hashlib
+import re
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from scrapli_cfg.diff_backends import patience_opcodes
+
+# lines that only serve to visually separate sections in indentation based configs
+SEPARATOR_LINES = ("!",)
+# sections of indentation based configs where the order of the child lines is significant, i.e.
+# access list entries or the classes of a policy map
+ORDERED_SECTION_PATTERN = re.compile(
+    pattern=r"^(?:(?:ip|ipv4|ipv6|mac) access-list|policy-map|route-policy|"
+    r"(?:prefix|as-path|community|extcommunity-\S+|large-community)-set)\b",
+    flags=re.I,
+)
+# entries of ordered sections that carry a sequence number, the device puts those in place
+# regardless of the order they are configured in
+SEQUENCE_NUMBER_PATTERN = re.compile(pattern=r"^(?:seq(?:uence)?\s+)?\d+\s", flags=re.I)
+
+
+class ConfigNode:
+    __slots__ = ("line", "key", "children", "closing", "ordered", "match_moved", "digest")
+
+    def __init__(  # pylint: disable=R0917
+        self,
+        line: str,
+        key: str = "",
+        closing: str = "",
+        ordered: bool = True,
+        match_moved: bool = True,
+    ) -> None:
+        """
+        Config tree node -- a single config line and any child lines nested under it
+
+        Args:
+            line: the config line as it appeared in the config (including indentation)
+            key: key to identify this node amongst its siblings, if not provided uses the stripped
+                line
+            closing: closing line for the node, if any (i.e. junos "}" lines)
+            ordered: True if the order of the children of this node is significant
+            match_moved: for ordered nodes, True if children that moved position should still be
+                matched up by key (i.e. ios interfaces or top level lines), False if a moved child
+                is a change (i.e. access list entries)
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.line = line
+        self.key = key or line.strip()
+        self.closing = closing
+        self.ordered = ordered
+        self.match_moved = match_moved
+        self.children: List["ConfigNode"] = []
+        self.digest = b""
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for ConfigNode class
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for class object
+
+        Raises:
+            N/A
+
+        """
+        return f"ConfigNode <{self.key!r}, children: {len(self.children)}>"
+
+    def compute_digest(self) -> bytes:
+        """
+        Compute (and store) the digest of this node and all of its children
+
+        The digest covers the (stripped) line rather than the key so that any change to the line is
+        reflected. Unordered nodes sort the digests of their children so that sibling order does not
+        affect the digest of the node.
+
+        Args:
+            N/A
+
+        Returns:
+            bytes: digest of this node
+
+        Raises:
+            N/A
+
+        """
+        child_digests = [child.compute_digest() for child in self.children]
+        if not self.ordered:
+            child_digests.sort()
+
+        hasher = hashlib.blake2b(self.line.strip().encode(), digest_size=16)
+        for child_digest in child_digests:
+            hasher.update(child_digest)
+        self.digest = hasher.digest()
+
+        return self.digest
+
+    def lines(self) -> Iterator[str]:
+        """
+        Yield the config lines of this node and all of its children
+
+        Args:
+            N/A
+
+        Yields:
+            str: config lines
+
+        Raises:
+            N/A
+
+        """
+        yield self.line
+        for child in self.children:
+            yield from child.lines()
+        if self.closing:
+            yield self.closing
+
+
+ConfigParser = Callable[[str], ConfigNode]
+
+
+class SectionDiff:
+    __slots__ = ("path", "additions", "subtractions")
+
+    def __init__(
+        self, path: Tuple[str, ...], additions: List[str], subtractions: List[str]
+    ) -> None:
+        """
+        Lines added/removed directly beneath one section of a config
+
+        Args:
+            path: keys of the parent sections leading to the changed section, empty for top level
+            additions: lines added in the candidate config
+            subtractions: lines removed from the source config
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.path = path
+        self.additions = additions
+        self.subtractions = subtractions
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for SectionDiff class
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for class object
+
+        Raises:
+            N/A
+
+        """
+        return (
+            f"SectionDiff <{' > '.join(self.path) or 'top level'}, "
+            f"+{len(self.additions)}, -{len(self.subtractions)}>"
+        )
+
+
+def parse_indented_config(config: str) -> ConfigNode:
+    """
+    Parse an indentation based (ios-like) config into a tree of ConfigNodes
+
+    Lines are nested under the closest preceding line with less indentation. Separator ("!") and
+    blank lines are dropped as they carry no configuration. Children that moved are matched up by
+    key, except in the sections matching `ORDERED_SECTION_PATTERN` where a moved child is a change.
+
+    Args:
+        config: config to parse, should already be cleaned by the platform's `clean_config`
+
+    Returns:
+        ConfigNode: root node of the config tree
+
+    Raises:
+        N/A
+
+    """
+    root = ConfigNode(line="")
+    stack: List[Tuple[int, ConfigNode]] = [(-1, root)]
+
+    for line in config.splitlines():
+        stripped_line = line.strip()
+        if not stripped_line or stripped_line in SEPARATOR_LINES:
+            continue
+
+        indent = len(line) - len(line.lstrip())
+        while stack[-1][0] >= indent:
+            stack.pop()
+
+        node = ConfigNode(
+            line=line.rstrip(),
+            match_moved=not re.match(pattern=ORDERED_SECTION_PATTERN, string=stripped_line),
+        )
+        stack[-1][1].children.append(node)
+        stack.append((indent, node))
+
+    root.compute_digest()
+
+    return root
+
+
+def _match_children(
+    source: ConfigNode, candidate: ConfigNode
+) -> Tuple[List[Tuple[ConfigNode, ConfigNode]], List[ConfigNode], List[ConfigNode]]:
+    """
+    Match up the children of two nodes
+
+    Children are matched by key regardless of position -- i.e. a moved interface stanza or top
+    level line is still compared against itself -- w/ repeated keys matched in order of
+    appearance. Only the children of ordered nodes that do not allow moves (i.e. access list
+    entries) are aligned positionally, so a moved child is unmatched.
+
+    Args:
+        source: source node
+        candidate: candidate node
+
+    Returns:
+        tuple: list of matched (source, candidate) children, unmatched source children and
+            unmatched candidate children
+
+    Raises:
+        N/A
+
+    """
+    matched: List[Tuple[ConfigNode, ConfigNode]] = []
+    unmatched_source: List[ConfigNode] = []
+    unmatched_candidate: List[ConfigNode] = []
+
+    if source.ordered and not source.match_moved:
+        for tag, i1, i2, j1, j2 in patience_opcodes(
+            [child.key for child in source.children], [child.key for child in candidate.children]
+        ):
+            if tag == "equal":
+                matched.extend(zip(source.children[i1:i2], candidate.children[j1:j2]))
+            else:
+                unmatched_source.extend(source.children[i1:i2])
+                unmatched_candidate.extend(candidate.children[j1:j2])
+
+        return matched, unmatched_source, unmatched_candidate
+
+    candidates_by_key: Dict[str, List[ConfigNode]] = {}
+    for child in reversed(candidate.children):
+        candidates_by_key.setdefault(child.key, []).append(child)
+
+    for child in source.children:
+        key_candidates = candidates_by_key.get(child.key)
+        if key_candidates:
+            matched.append((child, key_candidates.pop()))
+        else:
+            unmatched_source.append(child)
+
+    # keep the matches in candidate order, so anything rendered from them follows the candidate
+    positions = {id(child): position for position, child in enumerate(candidate.children)}
+    matched.sort(key=lambda match: positions[id(match[1])])
+
+    matched_candidates = {id(candidate_child) for _, candidate_child in matched}
+    unmatched_candidate = [
+        child for child in candidate.children if id(child) not in matched_candidates
+    ]
+
+    return matched, unmatched_source, unmatched_candidate
+
+
+def diff_config_trees(source: ConfigNode, candidate: ConfigNode) -> List[SectionDiff]:
+    """
+    Diff two config trees section by section
+
+    Sections with identical digests are skipped entirely, so the cost of the diff scales with the
+    number of changed sections rather than the size of the config.
+
+    Args:
+        source: root node of the source config
+        candidate: root node of the candidate config
+
+    Returns:
+        list: list of SectionDiff objects, one for each section with changes directly beneath it
+
+    Raises:
+        N/A
+
+    """
+    section_diffs: List[SectionDiff] = []
+    pending: List[Tuple[Tuple[str, ...], ConfigNode, ConfigNode]] = [((), source, candidate)]
+
+    while pending:
+        path, source_node, candidate_node = pending.pop()
+        if source_node.digest == candidate_node.digest:
+            continue
+
+        matched, removed, added = _match_children(source=source_node, candidate=candidate_node)
+
+        additions = [line for node in added for line in node.lines()]
+        subtractions = [line for node in removed for line in node.lines()]
+        for source_child, candidate_child in matched:
+            # keys matched but the lines themselves differ -- i.e. junos "inactive:" sections
+            if source_child.line.strip() != candidate_child.line.strip():
+                additions.append(candidate_child.line)
+                subtractions.append(source_child.line)
+
+        if additions or subtractions:
+            section_diffs.append(
+                SectionDiff(path=path, additions=additions, subtractions=subtractions)
+            )
+
+        pending.extend(
+            (path + (source_child.key,), source_child, candidate_child)
+            for source_child, candidate_child in reversed(matched)
+            if source_child.digest != candidate_child.digest
+        )
+
+    return section_diffs
+
+
+def diff_configs(
+    source_config: str, candidate_config: str, config_parser: Optional[ConfigParser] = None
+) -> List[SectionDiff]:
+    """
+    Parse and diff two configs section by section
+
+    Args:
+        source_config: source config
+        candidate_config: candidate config
+        config_parser: callable to parse the configs into trees, defaults to the indentation parser
+
+    Returns:
+        list: list of SectionDiff objects
+
+    Raises:
+        N/A
+
+    """
+    config_parser = config_parser or parse_indented_config
+    return diff_config_trees(
+        source=config_parser(source_config), candidate=config_parser(candidate_config)
+    )
+
+
+def remediate_config_trees(
+    source: ConfigNode, candidate: ConfigNode, parents: Tuple[ConfigNode, ...] = ()
+) -> Iterator[
+    Tuple[
+        Tuple[ConfigNode, ...],
+        List[ConfigNode],
+        List[ConfigNode],
+        List[Tuple[ConfigNode, ConfigNode]],
+    ]
+]:
+    """
+    Yield the nodes removed from/added to/changed in each changed section of two config trees
+
+    Sections with identical digests are skipped entirely. Changed nodes are matched nodes whose
+    lines differ (i.e. junos "inactive:" sections), the children of changed nodes are yielded as
+    their own sections same as for unchanged nodes.
+
+    Args:
+        source: source node
+        candidate: candidate node
+        parents: candidate nodes leading to (and including) this section, empty for top level
+
+    Yields:
+        tuple: parent nodes, removed source nodes, added candidate nodes and changed (source,
+            candidate) nodes of a changed section
+
+    Raises:
+        N/A
+
+    """
+    if source.digest == candidate.digest:
+        return
+
+    matched, removed, added = _match_children(source=source, candidate=candidate)
+
+    changed = [
+        (source_child, candidate_child)
+        for source_child, candidate_child in matched
+        if source_child.line.strip() != candidate_child.line.strip()
+    ]
+
+    if removed or added or changed:
+        yield parents, removed, added, changed
+
+    for source_child, candidate_child in matched:
+        yield from remediate_config_trees(
+            source=source_child, candidate=candidate_child, parents=parents + (candidate_child,)
+        )
+
+
+def _negate(line: str, negation_prefix: str) -> str:
+    """
+    Negate an indentation based config line, keeping its indentation
+
+    Lines that are already negated have the negation prefix removed rather than added.
+
+    Args:
+        line: config line to negate
+        negation_prefix: prefix negating a config line
+
+    Returns:
+        str: negated config line
+
+    Raises:
+        N/A
+
+    """
+    indent = line[: len(line) - len(line.lstrip())]
+    statement = line.strip()
+    if statement.startswith(negation_prefix):
+        return f"{indent}{statement[len(negation_prefix) :]}"
+    return f"{indent}{negation_prefix}{statement}"
+
+
+def _needs_rerender(
+    section: ConfigNode, removed: List[ConfigNode], added: List[ConfigNode]
+) -> bool:
+    """
+    Check if a changed ordered section must be rendered in full to keep the candidate order
+
+    Added entries w/o a sequence number are appended to the end of the section by the device, so
+    unless every such entry is at the end of the candidate section, or an entry moved (meaning it
+    would have to be negated and added again), the section must be rendered in full.
+
+    Args:
+        section: candidate node of the changed section
+        removed: removed source nodes of the section
+        added: added candidate nodes of the section
+
+    Returns:
+        bool: True if the section must be rendered in full
+
+    Raises:
+        N/A
+
+    """
+    if not section.ordered or section.match_moved:
+        return False
+
+    unsequenced = [
+        node
+        for node in added
+        if not re.match(pattern=SEQUENCE_NUMBER_PATTERN, string=node.line.strip())
+    ]
+    if not unsequenced:
+        return False
+
+    candidate_keys = {child.key for child in section.children}
+    if any(node.key in candidate_keys for node in removed):
+        return True
+
+    added_ids = {id(node) for node in added}
+    last_retained = max(
+        (position for position, child in enumerate(section.children) if id(child) not in added_ids),
+        default=-1,
+    )
+    positions = {id(child): position for position, child in enumerate(section.children)}
+
+    return any(positions[id(node)] < last_retained for node in unsequenced)
+
+
+def render_indented_remediation(
+    source: ConfigNode, candidate: ConfigNode, negation_prefix: str = "no "
+) -> str:
+    """
+    Render the minimal indentation based config that turns the source config into the candidate
+
+    For every changed section the section's parent lines are repeated, followed by the negation of
+    any removed lines and then any added lines (w/ all lines nested under them) -- merging the
+    result into the source config results in the candidate config. Removed sections are negated
+    by their first line only, and lines that are already negated have the negation prefix removed
+    rather than added. Lines that are also in the candidate section are never negated.
+
+    Devices append entries added to an ordered section (i.e. an access list) w/o a sequence number
+    to the end of the section, so an ordered section where such entries are inserted or moved is
+    negated and rendered again in full instead.
+
+    Args:
+        source: root node of the source config
+        candidate: root node of the candidate config
+        negation_prefix: prefix negating a config line
+
+    Returns:
+        str: remediation config, an empty string if the configs do not differ
+
+    Raises:
+        N/A
+
+    """
+    remediation_lines: List[str] = []
+    rerendered: Set[int] = set()
+
+    for parents, removed, added, changed in remediate_config_trees(
+        source=source, candidate=candidate
+    ):
+        if any(id(parent) in rerendered for parent in parents):
+            continue
+
+        if parents and _needs_rerender(section=parents[-1], removed=removed, added=added):
+            rerendered.add(id(parents[-1]))
+            remediation_lines.extend(parent.line for parent in parents[:-1])
+            remediation_lines.append(
+                _negate(line=parents[-1].line, negation_prefix=negation_prefix)
+            )
+            remediation_lines.extend(parents[-1].lines())
+            continue
+
+        remediation_lines.extend(parent.line for parent in parents)
+
+        candidate_keys = {child.key for child in (parents[-1] if parents else candidate).children}
+        remediation_lines.extend(
+            _negate(line=node.line, negation_prefix=negation_prefix)
+            for node in removed
+            if node.key not in candidate_keys
+        )
+        remediation_lines.extend(
+            _negate(line=source_node.line, negation_prefix=negation_prefix)
+            for source_node, _ in changed
+        )
+
+        for node in added:
+            remediation_lines.extend(node.lines())
+        remediation_lines.extend(candidate_node.line for _, candidate_node in changed)
+
+    return "\n".join(remediation_lines)
@@ -1,9 +1,10 @@
 """scrapli_cfg.diff"""
 
-import difflib
 import shutil
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
+from scrapli_cfg.config_tree import ConfigParser, SectionDiff, diff_configs
+from scrapli_cfg.diff_backends import DiffBackend, patience_diff
 from scrapli_cfg.exceptions import DiffConfigError
 from scrapli_cfg.response import ScrapliCfgResponse
 
@@ -12,10 +13,66 @@ RED = "\033[91m"
 YELLOW = "\033[93m"
 END_COLOR = "\033[0m"
 
+# "full" diffs fetch the source config and diff it against the candidate locally, "device" diffs
+# are built from the device generated diff only (where the platform can produce one)
+DIFF_MODES = ("full", "device")
+
+
+def generate_difflines(
+    source_config: str, candidate_config: str, diff_backend: DiffBackend = patience_diff
+) -> List[str]:
+    """
+    Generate the ndiff style diff lines of a source vs candidate config
+
+    Module level (and only taking/returning plain strings) so that it can be shipped off to a
+    process pool executor as well as a thread pool executor.
+
+    Args:
+        source_config: source config
+        candidate_config: candidate config
+        diff_backend: diff backend to use, must be picklable (i.e. a module level function) if run
+            in a process pool
+
+    Returns:
+        list: list of diff lines
+
+    Raises:
+        N/A
+
+    """
+    return list(
+        diff_backend(
+            source_config.splitlines(keepends=True), candidate_config.splitlines(keepends=True)
+        )
+    )
+
 
 class ScrapliCfgDiffResponse(ScrapliCfgResponse):
-    def __init__(
-        self, host: str, source: str, colorize: bool = True, side_by_side_diff_width: int = 0
+    __slots__ = (
+        "colorize",
+        "side_by_side_diff_width",
+        "diff_backend",
+        "source",
+        "source_config",
+        "candidate_config",
+        "device_diff",
+        "config_parser",
+        "_difflines_cache",
+        "_additions",
+        "_subtractions",
+        "_section_diffs",
+        "_unified_diff",
+        "_side_by_side_diff",
+    )
+
+    def __init__(  # pylint: disable=R0917
+        self,
+        host: str,
+        source: str,
+        colorize: bool = True,
+        side_by_side_diff_width: int = 0,
+        diff_backend: Optional[DiffBackend] = None,
+        retain: str = "full",
     ) -> None:
         """
         Scrapli config diff object
@@ -26,6 +83,9 @@ class ScrapliCfgDiffResponse(ScrapliCfgResponse):
             colorize: True/False colorize diff output
             side_by_side_diff_width: width to use to generate the side-by-side diff, if not provided
                 will fetch the current terminal width
+            diff_backend: callable used to generate the diff lines, see `scrapli_cfg.diff_backends`;
+                if not provided uses patience diff
+            retain: "full" or "summary", see `ScrapliCfgResponse` and `summarize`
 
         Returns:
             N/A
@@ -34,22 +94,28 @@ class ScrapliCfgDiffResponse(ScrapliCfgResponse):
             N/A
 
         """
-        super().__init__(host=host, raise_for_status_exception=DiffConfigError)
+        super().__init__(host=host, raise_for_status_exception=DiffConfigError, retain=retain)
 
         self.colorize = colorize
         self.side_by_side_diff_width = side_by_side_diff_width
+        self.diff_backend: DiffBackend = diff_backend or patience_diff
 
         self.source = source
         self.source_config = ""
         self.candidate_config = ""
         self.device_diff = ""
+        self.config_parser: Optional[ConfigParser] = None
 
-        self._difflines: List[str] = []
-        self.additions = ""
-        self.subtractions = ""
+        # everything below is generated lazily on first access and then cached; a large majority of
+        # diffs are only ever checked for success/failure, so there is no point paying to diff and
+        # render them until (if ever) something actually asks for it
+        self._difflines_cache: Optional[List[str]] = None
+        self._additions: Optional[str] = None
+        self._subtractions: Optional[str] = None
+        self._section_diffs: Optional[List[SectionDiff]] = None
 
-        self._unified_diff = ""
-        self._side_by_side_diff = ""
+        self._unified_diff: Optional[str] = None
+        self._side_by_side_diff: Optional[str] = None
 
     def __repr__(self) -> str:
         """
@@ -83,8 +149,13 @@ class ScrapliCfgDiffResponse(ScrapliCfgResponse):
         """
         return f"ScrapliCfgDiffResponse <Success: {str(not self.failed)}>"
 
-    def record_diff_response(
-        self, source_config: str, candidate_config: str, device_diff: str
+    def record_diff_response(  # pylint: disable=R0917
+        self,
+        source_config: str,
+        candidate_config: str,
+        device_diff: str,
+        config_parser: Optional[ConfigParser] = None,
+        difflines: Optional[List[str]] = None,
     ) -> None:
         """
         Scrapli config diff object
@@ -93,6 +164,10 @@ class ScrapliCfgDiffResponse(ScrapliCfgResponse):
             source_config: the actual contents of the source config
             candidate_config: the scrapli_cfg candidate config
             device_diff: diff generated by the device itself (if applicable)
+            config_parser: callable to parse the configs into config trees for section diffs, if
+                not provided `section_diffs` will always be empty
+            difflines: ndiff style diff lines parsed from the device diff -- if provided these are
+                used as-is rather than diffing source vs candidate
 
         Returns:
             N/A
@@ -104,17 +179,135 @@ class ScrapliCfgDiffResponse(ScrapliCfgResponse):
         self.source_config = source_config
         self.candidate_config = candidate_config
         self.device_diff = device_diff
+        self.config_parser = config_parser
 
-        _differ = difflib.Differ()
-        self._difflines = list(
-            _differ.compare(
-                self.source_config.splitlines(keepends=True),
-                self.candidate_config.splitlines(keepends=True),
-            )
+        self._difflines_cache = difflines
+        self._additions = None
+        self._subtractions = None
+        self._section_diffs = None
+        self._unified_diff = None
+        self._side_by_side_diff = None
+
+    def summarize(self) -> None:
+        """
+        Summarize the diff response, only keeping the changed diff lines
+
+        The source/candidate configs and the unchanged diff lines are dropped, so additions,
+        subtractions and the rendered diffs only cover the changed lines from then on, and section
+        diffs are no longer available.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        changed_difflines = [line for line in self._difflines if line[:2] in ("+ ", "- ")]
+
+        super().summarize()
+
+        self.record_diff_response(
+            source_config="", candidate_config="", device_diff="", difflines=changed_difflines
         )
 
-        self.additions = "".join([line[2:] for line in self._difflines if line[:2] == "+ "])
-        self.subtractions = "".join([line[2:] for line in self._difflines if line[:2] == "- "])
+    @property
+    def _difflines(self) -> List[str]:
+        """
+        Generate (once) the ndiff style diff lines of source vs candidate
+
+        Args:
+            N/A
+
+        Returns:
+            list: list of diff lines
+
+        Raises:
+            N/A
+
+        """
+        if self._difflines_cache is None:
+            self._difflines_cache = generate_difflines(
+                source_config=self.source_config,
+                candidate_config=self.candidate_config,
+                diff_backend=self.diff_backend,
+            )
+
+        return self._difflines_cache
+
+    @property
+    def additions(self) -> str:
+        """
+        Lines added in the candidate config vs the source config
+
+        Args:
+            N/A
+
+        Returns:
+            str: joined added lines
+
+        Raises:
+            N/A
+
+        """
+        if self._additions is None:
+            self._additions = "".join([line[2:] for line in self._difflines if line[:2] == "+ "])
+
+        return self._additions
+
+    @property
+    def subtractions(self) -> str:
+        """
+        Lines removed from the source config in the candidate config
+
+        Args:
+            N/A
+
+        Returns:
+            str: joined removed lines
+
+        Raises:
+            N/A
+
+        """
+        if self._subtractions is None:
+            self._subtractions = "".join([line[2:] for line in self._difflines if line[:2] == "- "])
+
+        return self._subtractions
+
+    @property
+    def section_diffs(self) -> List[SectionDiff]:
+        """
+        Per section changes of source vs candidate
+
+        Sections are matched by their parent line, so moved sections are not treated as changed,
+        and unchanged sections are skipped without being line diffed.
+
+        Args:
+            N/A
+
+        Returns:
+            list: list of SectionDiff objects for each section with changes
+
+        Raises:
+            N/A
+
+        """
+        if self._section_diffs is None:
+            self._section_diffs = (
+                diff_configs(
+                    source_config=self.source_config,
+                    candidate_config=self.candidate_config,
+                    config_parser=self.config_parser,
+                )
+                if self.config_parser is not None
+                else []
+            )
+
+        return self._section_diffs
 
     def _generate_colors(self) -> Tuple[str, str, str, str]:
         """
@@ -151,7 +344,7 @@ class ScrapliCfgDiffResponse(ScrapliCfgResponse):
             N/A
 
         """
-        if self._side_by_side_diff:
+        if self._side_by_side_diff is not None:
             return self._side_by_side_diff
 
         yellow, red, green, end = self._generate_colors()
@@ -200,7 +393,7 @@ class ScrapliCfgDiffResponse(ScrapliCfgResponse):
             N/A
 
         """
-        if self._unified_diff:
+        if self._unified_diff is not None:
             return self._unified_diff
 
         yellow, red, green, end = self._generate_colors()
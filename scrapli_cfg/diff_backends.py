@@ -0,0 +1,684 @@
+"""scrapli_cfg.diff_backends"""
+
+import difflib
+from bisect import bisect_left
+from math import isqrt
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Sequence, Tuple
+
+# a diff backend accepts the source and candidate config lines (with line endings) and returns
+# "ndiff" style lines -- that is lines prefixed with "  ", "- ", "+ " or "? " exactly like the
+# output of `difflib.Differ().compare` (which means `difflib.ndiff` is itself a valid backend)
+DiffBackend = Callable[[Sequence[str], Sequence[str]], Iterable[str]]
+
+# (start in a, start in b, size) -- same shape as difflib `Match` objects
+MatchingBlock = Tuple[int, int, int]
+# (tag, i1, i2, j1, j2) -- same shape as difflib `get_opcodes` output
+Opcode = Tuple[str, int, int, int, int]
+
+# replace hunks with at most this many source * candidate line pairs get difflib style "? "
+# intraline hints; difflib fuzzy matches every line pair in a hunk so anything larger than this is
+# emitted as plain removals/additions to keep diffing linear-ish on large changes
+INTRALINE_HINT_MAX_PAIRS = 10_000
+
+# myers gives up on finding a minimal edit path through a region once the edit cost passes
+# max(this, sqrt(region size)) and splits the region at the furthest reaching path instead (the
+# same heuristic as git's xdiff), large heavily changed configs get a coarser diff rather than
+# taking O((N+M)D) time
+MYERS_MIN_COST_LIMIT = 256
+
+
+def _encode_lines(a: Sequence[Hashable], b: Sequence[Hashable]) -> Tuple[List[int], List[int]]:
+    """
+    Encode two sequences of lines to sequences of ints so comparisons are cheap
+
+    Args:
+        a: source sequence
+        b: candidate sequence
+
+    Returns:
+        tuple: tuple of int encoded source and candidate sequences
+
+    Raises:
+        N/A
+
+    """
+    line_ids: Dict[Hashable, int] = {}
+    encoded_a = [line_ids.setdefault(line, len(line_ids)) for line in a]
+    encoded_b = [line_ids.setdefault(line, len(line_ids)) for line in b]
+    return encoded_a, encoded_b
+
+
+def _trim_common(
+    a: Sequence[int], b: Sequence[int], region: Tuple[int, int, int, int]
+) -> Tuple[Tuple[int, int, int, int], List[MatchingBlock]]:
+    """
+    Trim the common prefix and suffix off of a region of the sequences
+
+    Args:
+        a: source sequence
+        b: candidate sequence
+        region: tuple of alo, ahi, blo, bhi indexes to trim
+
+    Returns:
+        tuple: the trimmed region and the matching blocks for the trimmed prefix/suffix
+
+    Raises:
+        N/A
+
+    """
+    alo, ahi, blo, bhi = region
+    blocks = []
+
+    prefix = 0
+    while alo + prefix < ahi and blo + prefix < bhi and a[alo + prefix] == b[blo + prefix]:
+        prefix += 1
+    if prefix:
+        blocks.append((alo, blo, prefix))
+        alo += prefix
+        blo += prefix
+
+    suffix = 0
+    while alo < ahi - suffix and blo < bhi - suffix and a[ahi - suffix - 1] == b[bhi - suffix - 1]:
+        suffix += 1
+    if suffix:
+        blocks.append((ahi - suffix, bhi - suffix, suffix))
+        ahi -= suffix
+        bhi -= suffix
+
+    return (alo, ahi, blo, bhi), blocks
+
+
+def _furthest_reaching(
+    v: List[int], v_offset: int, diagonals: Iterable[int], n: int, m: int
+) -> Tuple[int, int]:
+    """
+    Find the furthest reaching point of one direction of the myers search
+
+    Args:
+        v: furthest x reached per diagonal
+        v_offset: offset of diagonal zero in `v`
+        diagonals: diagonals searched in the last step
+        n: length of the region in the source sequence
+        m: length of the region in the candidate sequence
+
+    Returns:
+        tuple: x, y (region relative) of the point that has made the most progress, (0, 0) if
+            there is none
+
+    Raises:
+        N/A
+
+    """
+    best_x = best_y = 0
+
+    for k in diagonals:
+        x = v[v_offset + k]
+        y = x - k
+        if 0 <= x <= n and 0 <= y <= m and x + y > best_x + best_y:
+            best_x, best_y = x, y
+
+    return best_x, best_y
+
+
+def _myers_heuristic_split(
+    vectors: Tuple[List[int], List[int]],
+    v_offset: int,
+    diagonals: Tuple[Iterable[int], Iterable[int]],
+    n: int,
+    m: int,
+) -> Tuple[int, int]:
+    """
+    Pick a split point for a region whose edit cost passed the cost limit
+
+    Args:
+        vectors: tuple of the furthest x reached per diagonal walking forward and backward
+        v_offset: offset of diagonal zero in the vectors
+        diagonals: tuple of forward and backward diagonals searched in the last step
+        n: length of the region in the source sequence
+        m: length of the region in the candidate sequence
+
+    Returns:
+        tuple: x, y (region relative) to split the region at -- the furthest reaching point of
+            either direction, or the end of the region (so the whole region becomes one replace
+            block) if neither made usable progress
+
+    Raises:
+        N/A
+
+    """
+    x1, y1 = _furthest_reaching(v=vectors[0], v_offset=v_offset, diagonals=diagonals[0], n=n, m=m)
+    x2, y2 = _furthest_reaching(v=vectors[1], v_offset=v_offset, diagonals=diagonals[1], n=n, m=m)
+    if x2 + y2 > x1 + y1:
+        x1, y1 = n - x2, m - y2
+
+    if 0 < x1 + y1 < n + m:
+        return x1, y1
+    return n, m
+
+
+def _myers_split(  # pylint: disable=R0912,R0915
+    a: Sequence[int], b: Sequence[int], region: Tuple[int, int, int, int]
+) -> Tuple[int, int]:
+    """
+    Find a point on an optimal edit path through the region via the myers "middle snake"
+
+    Walks the edit graph from both ends at once and stops when the paths overlap, this is the
+    linear space variant of myers' algorithm so it runs in O((N+M)D) time and O(N+M) space. Once
+    the edit cost passes the cost limit (see `MYERS_MIN_COST_LIMIT`) the region is split at the
+    furthest reaching point of either direction instead, which bounds the time spent per split at
+    the cost of the diff no longer being minimal.
+
+    Args:
+        a: source sequence
+        b: candidate sequence
+        region: tuple of alo, ahi, blo, bhi indexes to split -- common prefix/suffix must be trimmed
+
+    Returns:
+        tuple: x, y (absolute) indexes in a and b to split the region at; if there is nothing in
+            common at all (or the cost limit was hit without making any progress) this will be the
+            end of the region
+
+    Raises:
+        N/A
+
+    """
+    alo, ahi, blo, bhi = region
+    n = ahi - alo
+    m = bhi - blo
+
+    max_d = (n + m + 1) // 2
+    cost_limit = max(MYERS_MIN_COST_LIMIT, isqrt(n + m))
+    v_offset = max_d
+    v_length = 2 * max_d + 2
+    forward = [-1] * v_length
+    backward = [-1] * v_length
+    forward[v_offset + 1] = 0
+    backward[v_offset + 1] = 0
+
+    delta = n - m
+    # if the delta is odd the paths will overlap on a forward step, otherwise on a reverse step
+    front = delta % 2 != 0
+
+    # trims for diagonals that have run off the edge of the edit graph
+    k1_start = k1_end = k2_start = k2_end = 0
+
+    for d in range(max_d):
+        for k1 in range(-d + k1_start, d + 1 - k1_end, 2):
+            k1_offset = v_offset + k1
+            if k1 == -d or (k1 != d and forward[k1_offset - 1] < forward[k1_offset + 1]):
+                x1 = forward[k1_offset + 1]
+            else:
+                x1 = forward[k1_offset - 1] + 1
+            y1 = x1 - k1
+            while x1 < n and y1 < m and a[alo + x1] == b[blo + y1]:
+                x1 += 1
+                y1 += 1
+            forward[k1_offset] = x1
+
+            if x1 > n:
+                k1_end += 2
+            elif y1 > m:
+                k1_start += 2
+            elif front:
+                k2_offset = v_offset + delta - k1
+                if 0 <= k2_offset < v_length and backward[k2_offset] != -1:
+                    if x1 >= n - backward[k2_offset]:
+                        return alo + x1, blo + y1
+
+        for k2 in range(-d + k2_start, d + 1 - k2_end, 2):
+            k2_offset = v_offset + k2
+            if k2 == -d or (k2 != d and backward[k2_offset - 1] < backward[k2_offset + 1]):
+                x2 = backward[k2_offset + 1]
+            else:
+                x2 = backward[k2_offset - 1] + 1
+            y2 = x2 - k2
+            while x2 < n and y2 < m and a[ahi - x2 - 1] == b[bhi - y2 - 1]:
+                x2 += 1
+                y2 += 1
+            backward[k2_offset] = x2
+
+            if x2 > n:
+                k2_end += 2
+            elif y2 > m:
+                k2_start += 2
+            elif not front:
+                k1_offset = v_offset + delta - k2
+                if 0 <= k1_offset < v_length and forward[k1_offset] != -1:
+                    x1 = forward[k1_offset]
+                    y1 = v_offset + x1 - k1_offset
+                    if x1 >= n - x2:
+                        return alo + x1, blo + y1
+
+        if d >= cost_limit:
+            x, y = _myers_heuristic_split(
+                vectors=(forward, backward),
+                v_offset=v_offset,
+                diagonals=(
+                    range(-d + k1_start, d + 1 - k1_end, 2),
+                    range(-d + k2_start, d + 1 - k2_end, 2),
+                ),
+                n=n,
+                m=m,
+            )
+            return alo + x, blo + y
+
+    return ahi, bhi
+
+
+def _myers_region_blocks(
+    a: Sequence[int], b: Sequence[int], region: Tuple[int, int, int, int]
+) -> List[MatchingBlock]:
+    """
+    Find (unsorted) matching blocks for a region of the sequences using myers' algorithm
+
+    Args:
+        a: source sequence
+        b: candidate sequence
+        region: tuple of alo, ahi, blo, bhi indexes to diff
+
+    Returns:
+        list: list of matching blocks found in the region, in no particular order
+
+    Raises:
+        N/A
+
+    """
+    blocks: List[MatchingBlock] = []
+    regions = [region]
+
+    while regions:
+        trimmed_region, trimmed_blocks = _trim_common(a=a, b=b, region=regions.pop())
+        blocks.extend(trimmed_blocks)
+
+        alo, ahi, blo, bhi = trimmed_region
+        if alo == ahi or blo == bhi:
+            continue
+
+        x, y = _myers_split(a=a, b=b, region=trimmed_region)
+        if (x, y) == (ahi, bhi):
+            # nothing in common in this region
+            continue
+
+        regions.append((alo, x, blo, y))
+        regions.append((x, ahi, y, bhi))
+
+    return blocks
+
+
+def _longest_increasing_anchors(anchors: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Return the longest run of anchors that are increasing in both sequences
+
+    Anchors must already be sorted by their index in the source sequence; this is the "patience
+    sorting" bit of patience diff.
+
+    Args:
+        anchors: list of (index in a, index in b) tuples sorted by index in a
+
+    Returns:
+        list: longest subset of anchors that is also sorted by index in b
+
+    Raises:
+        N/A
+
+    """
+    pile_tops: List[int] = []
+    pile_top_indexes: List[int] = []
+    predecessors: List[int] = []
+
+    for anchor_index, (_, b_index) in enumerate(anchors):
+        pile = bisect_left(pile_tops, b_index)
+        predecessors.append(pile_top_indexes[pile - 1] if pile else -1)
+        if pile == len(pile_tops):
+            pile_tops.append(b_index)
+            pile_top_indexes.append(anchor_index)
+        else:
+            pile_tops[pile] = b_index
+            pile_top_indexes[pile] = anchor_index
+
+    longest = []
+    anchor_index = pile_top_indexes[-1] if pile_top_indexes else -1
+    while anchor_index != -1:
+        longest.append(anchors[anchor_index])
+        anchor_index = predecessors[anchor_index]
+    longest.reverse()
+
+    return longest
+
+
+def _patience_region_anchors(
+    a: Sequence[int], b: Sequence[int], region: Tuple[int, int, int, int]
+) -> List[Tuple[int, int]]:
+    """
+    Find the lines that are unique to both sides of a region and appear in the same order
+
+    Args:
+        a: source sequence
+        b: candidate sequence
+        region: tuple of alo, ahi, blo, bhi indexes to search
+
+    Returns:
+        list: list of (index in a, index in b) anchor tuples
+
+    Raises:
+        N/A
+
+    """
+    alo, ahi, blo, bhi = region
+
+    # line -> [count in a, index in a, count in b, index in b]
+    line_counts: Dict[int, List[int]] = {}
+    for a_index in range(alo, ahi):
+        counts = line_counts.setdefault(a[a_index], [0, 0, 0, 0])
+        counts[0] += 1
+        counts[1] = a_index
+    for b_index in range(blo, bhi):
+        b_counts = line_counts.get(b[b_index])
+        if b_counts is None:
+            continue
+        b_counts[2] += 1
+        b_counts[3] = b_index
+
+    anchors = sorted(
+        (counts[1], counts[3])
+        for counts in line_counts.values()
+        if counts[0] == 1 and counts[2] == 1
+    )
+
+    return _longest_increasing_anchors(anchors=anchors)
+
+
+def _myers_matching_blocks(a: Sequence[int], b: Sequence[int]) -> List[MatchingBlock]:
+    """
+    Find matching blocks of two int encoded sequences using myers' algorithm
+
+    Args:
+        a: source sequence
+        b: candidate sequence
+
+    Returns:
+        list: sorted list of matching blocks
+
+    Raises:
+        N/A
+
+    """
+    return _normalize_blocks(_myers_region_blocks(a=a, b=b, region=(0, len(a), 0, len(b))))
+
+
+def _patience_matching_blocks(a: Sequence[int], b: Sequence[int]) -> List[MatchingBlock]:
+    """
+    Find matching blocks of two int encoded sequences using patience diff
+
+    Patience diff anchors on lines that appear exactly once on each side -- in configs these are
+    things like interface/router/vrf lines -- and then diffs between the anchors, falling back to
+    myers for any region that has no unique lines.
+
+    Args:
+        a: source sequence
+        b: candidate sequence
+
+    Returns:
+        list: sorted list of matching blocks
+
+    Raises:
+        N/A
+
+    """
+    blocks: List[MatchingBlock] = []
+    regions = [(0, len(a), 0, len(b))]
+
+    while regions:
+        region, trimmed_blocks = _trim_common(a=a, b=b, region=regions.pop())
+        blocks.extend(trimmed_blocks)
+
+        alo, ahi, blo, bhi = region
+        if alo == ahi or blo == bhi:
+            continue
+
+        anchors = _patience_region_anchors(a=a, b=b, region=region)
+        if not anchors:
+            blocks.extend(_myers_region_blocks(a=a, b=b, region=region))
+            continue
+
+        for a_index, b_index in anchors:
+            blocks.append((a_index, b_index, 1))
+            regions.append((alo, a_index, blo, b_index))
+            alo, blo = a_index + 1, b_index + 1
+        regions.append((alo, ahi, blo, bhi))
+
+    return _normalize_blocks(blocks)
+
+
+def _normalize_blocks(blocks: List[MatchingBlock]) -> List[MatchingBlock]:
+    """
+    Sort matching blocks and merge any that are adjacent
+
+    Args:
+        blocks: unsorted matching blocks
+
+    Returns:
+        list: sorted and merged matching blocks
+
+    Raises:
+        N/A
+
+    """
+    normalized: List[MatchingBlock] = []
+
+    for a_index, b_index, size in sorted(blocks):
+        if normalized:
+            last_a_index, last_b_index, last_size = normalized[-1]
+            if last_a_index + last_size == a_index and last_b_index + last_size == b_index:
+                normalized[-1] = (last_a_index, last_b_index, last_size + size)
+                continue
+        normalized.append((a_index, b_index, size))
+
+    return normalized
+
+
+def blocks_to_opcodes(blocks: List[MatchingBlock], a_length: int, b_length: int) -> List[Opcode]:
+    """
+    Convert sorted matching blocks into difflib style opcodes
+
+    Args:
+        blocks: sorted matching blocks
+        a_length: length of the source sequence
+        b_length: length of the candidate sequence
+
+    Returns:
+        list: list of (tag, i1, i2, j1, j2) opcodes
+
+    Raises:
+        N/A
+
+    """
+    opcodes: List[Opcode] = []
+    i = j = 0
+
+    for a_index, b_index, size in [*blocks, (a_length, b_length, 0)]:
+        if i < a_index and j < b_index:
+            opcodes.append(("replace", i, a_index, j, b_index))
+        elif i < a_index:
+            opcodes.append(("delete", i, a_index, j, b_index))
+        elif j < b_index:
+            opcodes.append(("insert", i, a_index, j, b_index))
+
+        i, j = a_index + size, b_index + size
+        if size:
+            opcodes.append(("equal", a_index, i, b_index, j))
+
+    return opcodes
+
+
+def patience_opcodes(a: Sequence[Hashable], b: Sequence[Hashable]) -> List[Opcode]:
+    """
+    Return difflib style opcodes for two sequences using patience diff
+
+    Args:
+        a: source sequence
+        b: candidate sequence
+
+    Returns:
+        list: list of (tag, i1, i2, j1, j2) opcodes
+
+    Raises:
+        N/A
+
+    """
+    encoded_a, encoded_b = _encode_lines(a=a, b=b)
+    blocks = _patience_matching_blocks(a=encoded_a, b=encoded_b)
+    return blocks_to_opcodes(blocks=blocks, a_length=len(a), b_length=len(b))
+
+
+def myers_opcodes(a: Sequence[Hashable], b: Sequence[Hashable]) -> List[Opcode]:
+    """
+    Return difflib style opcodes for two sequences using myers' algorithm
+
+    Args:
+        a: source sequence
+        b: candidate sequence
+
+    Returns:
+        list: list of (tag, i1, i2, j1, j2) opcodes
+
+    Raises:
+        N/A
+
+    """
+    encoded_a, encoded_b = _encode_lines(a=a, b=b)
+    blocks = _myers_matching_blocks(a=encoded_a, b=encoded_b)
+    return blocks_to_opcodes(blocks=blocks, a_length=len(a), b_length=len(b))
+
+
+def render_replace(source_lines: Sequence[str], candidate_lines: Sequence[str]) -> Iterator[str]:
+    """
+    Render a replaced hunk of lines as ndiff lines
+
+    Small hunks are handed to difflib so that they get the "? " intraline hints, larger hunks are
+    simply rendered as all removals followed by all additions.
+
+    Args:
+        source_lines: lines removed from the source
+        candidate_lines: lines added in the candidate
+
+    Yields:
+        str: ndiff lines for the hunk
+
+    Raises:
+        N/A
+
+    """
+    if len(source_lines) * len(candidate_lines) <= INTRALINE_HINT_MAX_PAIRS:
+        yield from difflib.Differ().compare(source_lines, candidate_lines)
+        return
+
+    for line in source_lines:
+        yield f"- {line}"
+    for line in candidate_lines:
+        yield f"+ {line}"
+
+
+def render_opcodes(
+    source_lines: Sequence[str], candidate_lines: Sequence[str], opcodes: Iterable[Opcode]
+) -> Iterator[str]:
+    """
+    Render opcodes as ndiff lines
+
+    Args:
+        source_lines: source config lines
+        candidate_lines: candidate config lines
+        opcodes: opcodes describing how to turn source into candidate
+
+    Yields:
+        str: ndiff lines
+
+    Raises:
+        N/A
+
+    """
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            for line in source_lines[i1:i2]:
+                yield f"  {line}"
+        elif tag == "delete":
+            for line in source_lines[i1:i2]:
+                yield f"- {line}"
+        elif tag == "insert":
+            for line in candidate_lines[j1:j2]:
+                yield f"+ {line}"
+        else:
+            yield from render_replace(
+                source_lines=source_lines[i1:i2], candidate_lines=candidate_lines[j1:j2]
+            )
+
+
+def myers_diff(source_lines: Sequence[str], candidate_lines: Sequence[str]) -> Iterator[str]:
+    """
+    Myers diff backend
+
+    Produces a minimal diff in O((N+M)D) time where D is the number of differing lines, heavily
+    changed regions get a coarser (non minimal) diff once the edit cost limit is hit.
+
+    Args:
+        source_lines: source config lines
+        candidate_lines: candidate config lines
+
+    Returns:
+        Iterator[str]: ndiff lines
+
+    Raises:
+        N/A
+
+    """
+    return render_opcodes(
+        source_lines=source_lines,
+        candidate_lines=candidate_lines,
+        opcodes=myers_opcodes(a=source_lines, b=candidate_lines),
+    )
+
+
+def patience_diff(source_lines: Sequence[str], candidate_lines: Sequence[str]) -> Iterator[str]:
+    """
+    Patience diff backend -- the default backend for scrapli_cfg diffs
+
+    Anchors the diff on lines that are unique on both sides and uses myers in between, this tends
+    to keep config stanzas aligned on their parent lines rather than on "!" or "exit" lines.
+
+    Args:
+        source_lines: source config lines
+        candidate_lines: candidate config lines
+
+    Returns:
+        Iterator[str]: ndiff lines
+
+    Raises:
+        N/A
+
+    """
+    return render_opcodes(
+        source_lines=source_lines,
+        candidate_lines=candidate_lines,
+        opcodes=patience_opcodes(a=source_lines, b=candidate_lines),
+    )
+
+
+def differ_diff(source_lines: Sequence[str], candidate_lines: Sequence[str]) -> Iterator[str]:
+    """
+    difflib.Differ diff backend -- this was the only diff behavior prior to diff backends existing
+
+    Note that this does fuzzy intraline matching over the whole config and can be extremely slow on
+    large configs with large changes.
+
+    Args:
+        source_lines: source config lines
+        candidate_lines: candidate config lines
+
+    Returns:
+        Iterator[str]: ndiff lines
+
+    Raises:
+        N/A
+
+    """
+    return difflib.Differ().compare(source_lines, candidate_lines)
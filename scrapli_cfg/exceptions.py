@@ -68,5 +68,17 @@ class CommitConfigError(ConfigError):
     """For errors committing a configuration"""
 
 
+class ApplyConfigError(ConfigError):
+    """For errors applying (loading, diffing and committing) a configuration"""
+
+
 class CleanupError(ScrapliCfgException):
     """For errors during cleanup (i.e. removing candidate config, etc.)"""
+
+
+class FileTransferError(ConfigError):
+    """For errors transferring a candidate config file to a device"""
+
+
+class FileTransferNotSupported(ScrapliCfgException):
+    """Underlying scrapli transport can not open file transfer channels (i.e. system transport)"""
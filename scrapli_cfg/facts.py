@@ -0,0 +1,312 @@
+"""scrapli_cfg.facts"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+# facts derived from the running config of a device, invalidated whenever the config changes
+CONFIG_FACTS = ["file_prompt_mode"]
+
+
+class FactsCache:
+    def __init__(self, ttl: float = 86400.0) -> None:
+        """
+        Cache of device facts (version string, iosxe file prompt mode, etc.) w/ a ttl
+
+        Pass an instance of this to a scrapli_cfg platform (`facts_cache` argument) to have
+        `prepare` and the platform helpers read facts from the cache rather than the device. Facts
+        are keyed by host and port, so a single cache can be shared by any number of platforms.
+        This cache lives in memory only, see `JSONFactsCache` for a cache that persists across
+        processes.
+
+        Args:
+            ttl: seconds a cached fact is valid for
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: if ttl is not positive
+
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.ttl = ttl
+
+        # "host:port" -> fact name -> (expiry time, value); wall clock time as the expiry may be
+        # persisted and read by another process
+        self._facts: Dict[str, Dict[str, Tuple[float, str]]] = {}
+        # guards `_facts`, a single cache may be shared by platforms operated on from many threads
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for FactsCache class
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for class object
+
+        Raises:
+            N/A
+
+        """
+        return f"{self.__class__.__name__} <ttl: {self.ttl}, devices: {len(self._facts)}>"
+
+    @staticmethod
+    def _device_key(host: str, port: int) -> str:
+        """
+        Return the key a device's facts are stored under
+
+        Args:
+            host: device host
+            port: device port
+
+        Returns:
+            str: device key
+
+        Raises:
+            N/A
+
+        """
+        return f"{host}:{port}"
+
+    def _persist(self) -> None:
+        """
+        Persist the facts after they changed, a no-op for the in memory cache
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+
+    def flush(self) -> None:
+        """
+        Write any changed facts that have not been persisted yet, a no-op for the in memory cache
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+
+    def get(self, host: str, port: int, fact: str) -> Optional[str]:
+        """
+        Get a cached device fact
+
+        Args:
+            host: device host
+            port: device port
+            fact: name of the fact, i.e. "version"
+
+        Returns:
+            str: cached fact, or None if not cached or expired
+
+        Raises:
+            N/A
+
+        """
+        with self._lock:
+            device_facts = self._facts.get(self._device_key(host=host, port=port), {})
+            entry = device_facts.get(fact)
+            if entry is None:
+                return None
+
+            expiry, value = entry
+            expired = time.time() >= expiry
+            if expired:
+                device_facts.pop(fact, None)
+
+        if expired:
+            # persisted outside of the lock, flushing takes the lock itself
+            self._persist()
+            return None
+
+        return value
+
+    def set(self, host: str, port: int, fact: str, value: str) -> None:
+        """
+        Cache a device fact
+
+        Args:
+            host: device host
+            port: device port
+            fact: name of the fact, i.e. "version"
+            value: value of the fact
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        with self._lock:
+            self._facts.setdefault(self._device_key(host=host, port=port), {})[fact] = (
+                time.time() + self.ttl,
+                value,
+            )
+        self._persist()
+
+    def invalidate(
+        self, host: str, port: int, fact: Optional[str] = None, facts: Optional[List[str]] = None
+    ) -> None:
+        """
+        Invalidate cached facts of a device
+
+        Args:
+            host: device host
+            port: device port
+            fact: name of a single fact to invalidate
+            facts: names of facts to invalidate, if neither fact nor facts are provided all facts of
+                the device are invalidated
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        device_key = self._device_key(host=host, port=port)
+        with self._lock:
+            if device_key not in self._facts:
+                return
+
+            if fact is None and facts is None:
+                del self._facts[device_key]
+            else:
+                for fact_name in [fact] if fact is not None else facts or []:
+                    self._facts[device_key].pop(fact_name, None)
+
+        self._persist()
+
+
+class JSONFactsCache(FactsCache):
+    def __init__(self, path: str, ttl: float = 86400.0, flush_interval: float = 5.0) -> None:
+        """
+        Cache of device facts persisted to a json file
+
+        Facts are loaded from the file (if it exists) when the cache is created and written back
+        (atomically, via a temporary file) after they change, so short lived jobs against the same
+        devices can skip re-discovering facts. Changes are written at most once per
+        `flush_interval` -- so preparing a large fleet does not rewrite the file for every fact --
+        call `flush` (or `close`) once done to write any remaining changes; the platforms flush
+        their facts cache on `cleanup`.
+
+        Args:
+            path: path of the json file to persist facts to
+            ttl: seconds a cached fact is valid for
+            flush_interval: minimum seconds between writes of the file, 0 to write on every change
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        super().__init__(ttl=ttl)
+
+        self.path = path
+        self.flush_interval = flush_interval
+
+        self._dirty = False
+        self._last_flush = float("-inf")
+        # serializes writes of the file, so an older snapshot never replaces a newer one
+        self._flush_lock = threading.Lock()
+
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self._facts = {
+                    device_key: {
+                        fact: (float(expiry), str(value))
+                        for fact, (expiry, value) in device_facts.items()
+                    }
+                    for device_key, device_facts in json.load(f).items()
+                }
+
+    def _persist(self) -> None:
+        """
+        Mark the facts as changed, writing them if the last write is over flush_interval ago
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        with self._lock:
+            self._dirty = True
+
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write the facts to the json file if they changed since the last write
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                snapshot = {
+                    device_key: dict(device_facts)
+                    for device_key, device_facts in self._facts.items()
+                }
+                self._dirty = False
+
+            self._last_flush = time.monotonic()
+
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".scrapli_cfg_facts")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, self.path)
+
+    def close(self) -> None:
+        """
+        Write any changed facts that have not been persisted yet
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.flush()
@@ -0,0 +1,851 @@
+"""scrapli_cfg.fleet"""
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from scrapli_cfg.exceptions import ScrapliCfgException
+from scrapli_cfg.logging import logger
+from scrapli_cfg.response import ScrapliCfgResponse
+from scrapli_cfg.timings import TimingStats
+
+if TYPE_CHECKING:
+    from scrapli_cfg.platform.base.async_platform import AsyncScrapliCfgPlatform  # pragma: no cover
+    from scrapli_cfg.platform.base.sync_platform import ScrapliCfgPlatform  # pragma: no cover
+
+FleetOperation = Callable[["AsyncScrapliCfgPlatform"], Awaitable[Optional[ScrapliCfgResponse]]]
+
+SyncFleetOperation = Callable[["ScrapliCfgPlatform"], Optional[ScrapliCfgResponse]]
+
+# (platform, site) key used to group fleet members that share the same concurrency limits
+_LimitKey = Tuple[str, str]
+
+
+def _failed_response(host: str, msg: str) -> ScrapliCfgResponse:
+    """
+    Create a failed response for a host whose fleet operation did not complete
+
+    Args:
+        host: host the operation was for
+        msg: reason the operation did not complete, stored as the `result` of the response
+
+    Returns:
+        ScrapliCfgResponse: failed response
+
+    Raises:
+        N/A
+
+    """
+    logger.critical(f"host {host} {msg}")
+    response = ScrapliCfgResponse(host=host)
+    response.result = msg
+    return response
+
+
+def _platform_name(cfg_conn: Any) -> str:
+    """
+    Return the platform name of a scrapli_cfg platform for the limits/timings of a fleet
+
+    Args:
+        cfg_conn: sync or async scrapli_cfg platform
+
+    Returns:
+        str: name of the package the platform lives in (i.e. "cisco_iosxe"), or the class name
+            for platforms that do not live in a package
+
+    Raises:
+        N/A
+
+    """
+    module_parts = type(cfg_conn).__module__.split(".")
+    if len(module_parts) > 1:
+        return module_parts[-2]
+    return type(cfg_conn).__name__
+
+
+class AsyncScrapliCfgFleet:
+    def __init__(
+        self,
+        max_concurrency: int = 100,
+        platform_limits: Optional[Mapping[str, int]] = None,
+        site_limits: Optional[Mapping[str, int]] = None,
+        host_timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Run scrapli_cfg operations against a fleet of async platforms w/ bounded concurrency
+
+        Operations are started as soon as the global, per-platform and per-site limits allow, and
+        the results are yielded as they complete. A host that raises an exception, or that exceeds
+        `host_timeout`, yields a failed `ScrapliCfgResponse` rather than stopping the fleet. The
+        phase timings of the responses of the most recent run are collected in `timings`, see
+        `TimingStats`.
+
+        Args:
+            max_concurrency: maximum number of hosts operated on at any one time
+            platform_limits: optional mapping of platform name (i.e. "cisco_iosxe", the name of the
+                scrapli_cfg core platform package) to the maximum number of hosts of that platform
+                operated on at any one time
+            site_limits: optional mapping of site name (see `add`) to the maximum number of hosts of
+                that site operated on at any one time
+            host_timeout: optional deadline in seconds for the operation against each host, the
+                deadline starts when the operation for the host starts (not while it is queued)
+
+        Returns:
+            None
+
+        Raises:
+            ScrapliCfgException: if any of the concurrency limits are not positive
+
+        """
+        self.max_concurrency = max_concurrency
+        self.platform_limits: Dict[str, int] = dict(platform_limits or {})
+        self.site_limits: Dict[str, int] = dict(site_limits or {})
+        self.host_timeout = host_timeout
+
+        if max_concurrency <= 0 or any(
+            limit <= 0 for limit in (*self.platform_limits.values(), *self.site_limits.values())
+        ):
+            raise ScrapliCfgException("fleet concurrency limits must be positive")
+
+        self.timings = TimingStats()
+
+        self._members: List[Tuple["AsyncScrapliCfgPlatform", str]] = []
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for AsyncScrapliCfgFleet class
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for class object
+
+        Raises:
+            N/A
+
+        """
+        return (
+            f"AsyncScrapliCfgFleet <hosts: {len(self._members)}, "
+            f"max_concurrency: {self.max_concurrency}>"
+        )
+
+    def __len__(self) -> int:
+        """
+        Magic len method for AsyncScrapliCfgFleet class
+
+        Args:
+            N/A
+
+        Returns:
+            int: number of platforms in the fleet
+
+        Raises:
+            N/A
+
+        """
+        return len(self._members)
+
+    def add(self, cfg_conn: "AsyncScrapliCfgPlatform", site: str = "") -> None:
+        """
+        Add an async scrapli_cfg platform to the fleet
+
+        Args:
+            cfg_conn: async scrapli_cfg platform, i.e. as returned by `AsyncScrapliCfg`
+            site: optional site the host belongs to, used for the `site_limits`
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._members.append((cfg_conn, site))
+
+    def _has_capacity(self, key: _LimitKey, running: Dict[_LimitKey, int]) -> bool:
+        """
+        Check if another host of the given platform/site can be started
+
+        Args:
+            key: (platform, site) of the host
+            running: number of hosts currently running for each (platform, site)
+
+        Returns:
+            bool: True if all limits applying to the host have spare capacity
+
+        Raises:
+            N/A
+
+        """
+        platform, site = key
+
+        platform_limit = self.platform_limits.get(platform)
+        if platform_limit is not None and platform_limit <= sum(
+            count
+            for (running_platform, _), count in running.items()
+            if running_platform == platform
+        ):
+            return False
+
+        site_limit = self.site_limits.get(site)
+        if site_limit is not None and site_limit <= sum(
+            count for (_, running_site), count in running.items() if running_site == site
+        ):
+            return False
+
+        return True
+
+    async def _run_host(
+        self, cfg_conn: "AsyncScrapliCfgPlatform", operation: FleetOperation
+    ) -> ScrapliCfgResponse:
+        """
+        Run an operation against a single host, converting failures to a failed response
+
+        Args:
+            cfg_conn: async scrapli_cfg platform to operate on
+            operation: operation to run
+
+        Returns:
+            ScrapliCfgResponse: response of the operation, a successful empty response if the
+                operation returns None, or a failed response if the operation raised or timed out
+
+        Raises:
+            N/A
+
+        """
+        host = cfg_conn.conn.host
+
+        try:
+            response = await asyncio.wait_for(operation(cfg_conn), timeout=self.host_timeout)
+        except asyncio.TimeoutError:
+            return _failed_response(
+                host=host, msg=f"operation exceeded host deadline of {self.host_timeout} seconds"
+            )
+        except Exception as exc:  # pylint: disable=W0703
+            return _failed_response(host=host, msg=f"operation failed, {type(exc).__name__}: {exc}")
+
+        if response is None:
+            response = ScrapliCfgResponse(host=host)
+            response.failed = False
+
+        return response
+
+    async def run(self, operation: FleetOperation) -> AsyncIterator[ScrapliCfgResponse]:
+        """
+        Run an operation against every host of the fleet, yielding responses as they complete
+
+        Hosts are queued per (platform, site) so a saturated platform or site never holds up hosts
+        that could otherwise be started. If the consumer stops iterating early any running
+        operations are cancelled.
+
+        Args:
+            operation: async callable accepting a scrapli_cfg platform, returning a
+                ScrapliCfgResponse (or None)
+
+        Yields:
+            ScrapliCfgResponse: response for each host in order of completion
+
+        Raises:
+            N/A
+
+        """
+        pending: Dict[_LimitKey, Deque["AsyncScrapliCfgPlatform"]] = {}
+        for cfg_conn, site in self._members:
+            pending.setdefault((_platform_name(cfg_conn), site), deque()).append(cfg_conn)
+
+        running: Dict[_LimitKey, int] = {}
+        tasks: Dict["asyncio.Task[ScrapliCfgResponse]", _LimitKey] = {}
+        self.timings.clear()
+
+        try:
+            while pending or tasks:
+                for key in list(pending):
+                    queue = pending[key]
+                    while (
+                        queue
+                        and len(tasks) < self.max_concurrency
+                        and self._has_capacity(key=key, running=running)
+                    ):
+                        task = asyncio.create_task(
+                            self._run_host(cfg_conn=queue.popleft(), operation=operation)
+                        )
+                        tasks[task] = key
+                        running[key] = running.get(key, 0) + 1
+                    if not queue:
+                        del pending[key]
+
+                done: Set["asyncio.Task[ScrapliCfgResponse]"]
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    key = tasks.pop(task)
+                    running[key] -= 1
+                    response = task.result()
+                    self.timings.record(platform=key[0], timings=response.timings)
+                    yield response
+        finally:
+            for task in tasks:
+                task.cancel()
+            # let the cancelled tasks unwind (and close their connections) before returning
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def prepare(self) -> AsyncIterator[ScrapliCfgResponse]:
+        """
+        Prepare every platform of the fleet
+
+        Args:
+            N/A
+
+        Returns:
+            AsyncIterator: async iterator of (empty) responses, failed if prepare raised
+
+        Raises:
+            N/A
+
+        """
+
+        async def _prepare(cfg_conn: "AsyncScrapliCfgPlatform") -> None:
+            await cfg_conn.prepare()
+
+        return self.run(operation=_prepare)
+
+    def cleanup(self) -> AsyncIterator[ScrapliCfgResponse]:
+        """
+        Cleanup every platform of the fleet
+
+        Args:
+            N/A
+
+        Returns:
+            AsyncIterator: async iterator of (empty) responses, failed if cleanup raised
+
+        Raises:
+            N/A
+
+        """
+
+        async def _cleanup(cfg_conn: "AsyncScrapliCfgPlatform") -> None:
+            await cfg_conn.cleanup()
+
+        return self.run(operation=_cleanup)
+
+    def load_config(
+        self, config: Union[str, Mapping[str, str]], replace: bool = False, **kwargs: Any
+    ) -> AsyncIterator[ScrapliCfgResponse]:
+        """
+        Load configuration to every platform of the fleet
+
+        Args:
+            config: config to load to every host, or a mapping of host to the config for that host
+                -- hosts missing from the mapping are skipped
+            replace: replace the configuration or not
+            kwargs: additional kwargs passed to each platform's `load_config`
+
+        Returns:
+            AsyncIterator: async iterator of load_config responses
+
+        Raises:
+            N/A
+
+        """
+
+        async def _load_config(cfg_conn: "AsyncScrapliCfgPlatform") -> ScrapliCfgResponse:
+            host_config = config if isinstance(config, str) else config.get(cfg_conn.conn.host)
+            if host_config is None:
+                return _failed_response(
+                    host=cfg_conn.conn.host, msg="no config provided for host, skipped"
+                )
+            return await cfg_conn.load_config(config=host_config, replace=replace, **kwargs)
+
+        return self.run(operation=_load_config)
+
+    def diff_config(
+        self, source: str = "running", mode: str = "full"
+    ) -> AsyncIterator[ScrapliCfgResponse]:
+        """
+        Diff the loaded candidate config of every platform of the fleet
+
+        Args:
+            source: config source to diff against
+            mode: diff mode, see the platform's `diff_config`
+
+        Returns:
+            AsyncIterator: async iterator of diff responses
+
+        Raises:
+            N/A
+
+        """
+
+        async def _diff_config(cfg_conn: "AsyncScrapliCfgPlatform") -> ScrapliCfgResponse:
+            return await cfg_conn.diff_config(source=source, mode=mode)
+
+        return self.run(operation=_diff_config)
+
+    def commit_config(self, source: str = "running") -> AsyncIterator[ScrapliCfgResponse]:
+        """
+        Commit the loaded candidate config of every platform of the fleet
+
+        Args:
+            source: config source to commit to
+
+        Returns:
+            AsyncIterator: async iterator of commit responses
+
+        Raises:
+            N/A
+
+        """
+
+        async def _commit_config(cfg_conn: "AsyncScrapliCfgPlatform") -> ScrapliCfgResponse:
+            return await cfg_conn.commit_config(source=source)
+
+        return self.run(operation=_commit_config)
+
+    def abort_config(self) -> AsyncIterator[ScrapliCfgResponse]:
+        """
+        Abort the loaded candidate config of every platform of the fleet
+
+        Args:
+            N/A
+
+        Returns:
+            AsyncIterator: async iterator of abort responses
+
+        Raises:
+            N/A
+
+        """
+
+        async def _abort_config(cfg_conn: "AsyncScrapliCfgPlatform") -> ScrapliCfgResponse:
+            return await cfg_conn.abort_config()
+
+        return self.run(operation=_abort_config)
+
+
+class ScrapliCfgFleet:
+    def __init__(self, max_workers: int = 10, host_timeout: Optional[float] = None) -> None:
+        """
+        Run scrapli_cfg operations against a fleet of sync platforms in a bounded thread pool
+
+        Each host's operation runs in a worker thread, results are yielded as they complete (or in
+        the order the hosts were added). A host that raises an exception, exceeds `host_timeout`,
+        or is cancelled before it started yields a failed `ScrapliCfgResponse` rather than
+        stopping the fleet. The phase timings of the responses of the most recent run are collected
+        in `timings`, see `TimingStats`.
+
+        Args:
+            max_workers: maximum number of hosts operated on at any one time
+            host_timeout: optional deadline in seconds for the operation against each host, the
+                deadline starts when the operation for the host starts (not while it is queued). A
+                thread cannot be interrupted, so a host that exceeds its deadline keeps its worker
+                thread until the underlying scrapli operation times out on its own
+
+        Returns:
+            None
+
+        Raises:
+            ScrapliCfgException: if max_workers is not positive
+
+        """
+        if max_workers <= 0:
+            raise ScrapliCfgException("fleet max_workers must be positive")
+
+        self.max_workers = max_workers
+        self.host_timeout = host_timeout
+
+        self.timings = TimingStats()
+
+        self._members: List["ScrapliCfgPlatform"] = []
+        self._futures: List["Future[ScrapliCfgResponse]"] = []
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for ScrapliCfgFleet class
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for class object
+
+        Raises:
+            N/A
+
+        """
+        return f"ScrapliCfgFleet <hosts: {len(self._members)}, max_workers: {self.max_workers}>"
+
+    def __len__(self) -> int:
+        """
+        Magic len method for ScrapliCfgFleet class
+
+        Args:
+            N/A
+
+        Returns:
+            int: number of platforms in the fleet
+
+        Raises:
+            N/A
+
+        """
+        return len(self._members)
+
+    def add(self, cfg_conn: "ScrapliCfgPlatform") -> None:
+        """
+        Add a sync scrapli_cfg platform to the fleet
+
+        Args:
+            cfg_conn: sync scrapli_cfg platform, i.e. as returned by `ScrapliCfg`
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._members.append(cfg_conn)
+
+    def cancel(self) -> None:
+        """
+        Cancel the fleet operation that is currently running
+
+        Hosts that have not started yet are not started (and yield a failed response), hosts that
+        are already running are left to finish. Safe to call from any thread, including from the
+        loop consuming the results.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        for future in self._futures:
+            future.cancel()
+
+    def _run_host(  # pylint: disable=R0917
+        self,
+        cfg_conn: "ScrapliCfgPlatform",
+        operation: SyncFleetOperation,
+        session: bool,
+        started: Dict[int, float],
+        index: int,
+    ) -> ScrapliCfgResponse:
+        """
+        Run an operation against a single host in a worker thread
+
+        Args:
+            cfg_conn: sync scrapli_cfg platform to operate on
+            operation: operation to run
+            session: prepare the platform before, and always cleanup after, the operation
+            started: mapping of host index to the (monotonic) time the host started
+            index: index of the host in the fleet
+
+        Returns:
+            ScrapliCfgResponse: response of the operation, a successful empty response if the
+                operation returns None, or a failed response if the operation raised
+
+        Raises:
+            N/A
+
+        """
+        started[index] = time.monotonic()
+        host = cfg_conn.conn.host
+
+        try:
+            try:
+                if session:
+                    cfg_conn.prepare()
+                response = operation(cfg_conn)
+            finally:
+                if session:
+                    cfg_conn.cleanup()
+        except Exception as exc:  # pylint: disable=W0703
+            return _failed_response(host=host, msg=f"operation failed, {type(exc).__name__}: {exc}")
+
+        if response is None:
+            response = ScrapliCfgResponse(host=host)
+            response.failed = False
+
+        return response
+
+    def _wait_timeout(
+        self, futures: Dict["Future[ScrapliCfgResponse]", int], started: Dict[int, float]
+    ) -> Optional[float]:
+        """
+        Return how long to wait for the next result before host deadlines must be checked
+
+        Args:
+            futures: mapping of outstanding futures to host index
+            started: mapping of host index to the (monotonic) time the host started
+
+        Returns:
+            float: seconds to wait, or None to wait indefinitely if there is no host timeout
+
+        Raises:
+            N/A
+
+        """
+        if self.host_timeout is None:
+            return None
+
+        deadlines = [
+            started[index] + self.host_timeout for index in futures.values() if index in started
+        ]
+        if not deadlines:
+            return self.host_timeout
+
+        return max(min(deadlines) - time.monotonic(), 0.0)
+
+    def run(
+        self, operation: SyncFleetOperation, ordered: bool = False, session: bool = False
+    ) -> Iterator[ScrapliCfgResponse]:
+        """
+        Run an operation against every host of the fleet, yielding responses per host
+
+        With `session` each worker prepares the platform, runs the operation and then always
+        cleans up the platform -- this is the safe way to run a whole workflow (i.e. load, diff
+        and commit) against platforms w/ `dedicated_connection`, as the connection is opened and
+        closed by the same worker regardless of the outcome of the operation.
+
+        Args:
+            operation: callable accepting a scrapli_cfg platform, returning a ScrapliCfgResponse
+                (or None)
+            ordered: yield responses in the order hosts were added rather than as they complete
+            session: prepare the platform before, and always cleanup after, the operation
+
+        Yields:
+            ScrapliCfgResponse: response for each host
+
+        Raises:
+            N/A
+
+        """
+        members = list(self._members)
+        started: Dict[int, float] = {}
+        results: Dict[int, ScrapliCfgResponse] = {}
+        next_index = 0
+        self.timings.clear()
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="scrapli_cfg_fleet"
+        )
+        futures = {
+            executor.submit(
+                self._run_host,
+                cfg_conn=cfg_conn,
+                operation=operation,
+                session=session,
+                started=started,
+                index=index,
+            ): index
+            for index, cfg_conn in enumerate(members)
+        }
+        self._futures = list(futures)
+
+        try:
+            while futures:
+                done, _ = wait(
+                    futures,
+                    timeout=self._wait_timeout(futures=futures, started=started),
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    index = futures.pop(future)
+                    if future.cancelled():
+                        results[index] = _failed_response(
+                            host=members[index].conn.host, msg="operation cancelled"
+                        )
+                    else:
+                        results[index] = future.result()
+                        self.timings.record(
+                            platform=_platform_name(members[index]),
+                            timings=results[index].timings,
+                        )
+
+                if self.host_timeout is not None:
+                    now = time.monotonic()
+                    for future, index in list(futures.items()):
+                        if index in started and now - started[index] >= self.host_timeout:
+                            del futures[future]
+                            results[index] = _failed_response(
+                                host=members[index].conn.host,
+                                msg=f"operation exceeded host deadline of {self.host_timeout} "
+                                "seconds",
+                            )
+
+                if not ordered:
+                    for index in list(results):
+                        yield results.pop(index)
+                    continue
+
+                while next_index in results:
+                    yield results.pop(next_index)
+                    next_index += 1
+        finally:
+            self._futures = []
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def prepare(self, ordered: bool = False) -> Iterator[ScrapliCfgResponse]:
+        """
+        Prepare every platform of the fleet
+
+        Args:
+            ordered: yield responses in the order hosts were added rather than as they complete
+
+        Returns:
+            Iterator: iterator of (empty) responses, failed if prepare raised
+
+        Raises:
+            N/A
+
+        """
+
+        def _prepare(cfg_conn: "ScrapliCfgPlatform") -> None:
+            cfg_conn.prepare()
+
+        return self.run(operation=_prepare, ordered=ordered)
+
+    def cleanup(self, ordered: bool = False) -> Iterator[ScrapliCfgResponse]:
+        """
+        Cleanup every platform of the fleet
+
+        Args:
+            ordered: yield responses in the order hosts were added rather than as they complete
+
+        Returns:
+            Iterator: iterator of (empty) responses, failed if cleanup raised
+
+        Raises:
+            N/A
+
+        """
+
+        def _cleanup(cfg_conn: "ScrapliCfgPlatform") -> None:
+            cfg_conn.cleanup()
+
+        return self.run(operation=_cleanup, ordered=ordered)
+
+    def load_config(
+        self,
+        config: Union[str, Mapping[str, str]],
+        replace: bool = False,
+        ordered: bool = False,
+        **kwargs: Any,
+    ) -> Iterator[ScrapliCfgResponse]:
+        """
+        Load configuration to every platform of the fleet
+
+        Args:
+            config: config to load to every host, or a mapping of host to the config for that host
+                -- hosts missing from the mapping are skipped
+            replace: replace the configuration or not
+            ordered: yield responses in the order hosts were added rather than as they complete
+            kwargs: additional kwargs passed to each platform's `load_config`
+
+        Returns:
+            Iterator: iterator of load_config responses
+
+        Raises:
+            N/A
+
+        """
+
+        def _load_config(cfg_conn: "ScrapliCfgPlatform") -> ScrapliCfgResponse:
+            host_config = config if isinstance(config, str) else config.get(cfg_conn.conn.host)
+            if host_config is None:
+                return _failed_response(
+                    host=cfg_conn.conn.host, msg="no config provided for host, skipped"
+                )
+            return cfg_conn.load_config(config=host_config, replace=replace, **kwargs)
+
+        return self.run(operation=_load_config, ordered=ordered)
+
+    def diff_config(
+        self, source: str = "running", mode: str = "full", ordered: bool = False
+    ) -> Iterator[ScrapliCfgResponse]:
+        """
+        Diff the loaded candidate config of every platform of the fleet
+
+        Args:
+            source: config source to diff against
+            mode: diff mode, see the platform's `diff_config`
+            ordered: yield responses in the order hosts were added rather than as they complete
+
+        Returns:
+            Iterator: iterator of diff responses
+
+        Raises:
+            N/A
+
+        """
+
+        def _diff_config(cfg_conn: "ScrapliCfgPlatform") -> ScrapliCfgResponse:
+            return cfg_conn.diff_config(source=source, mode=mode)
+
+        return self.run(operation=_diff_config, ordered=ordered)
+
+    def commit_config(
+        self, source: str = "running", ordered: bool = False
+    ) -> Iterator[ScrapliCfgResponse]:
+        """
+        Commit the loaded candidate config of every platform of the fleet
+
+        Args:
+            source: config source to commit to
+            ordered: yield responses in the order hosts were added rather than as they complete
+
+        Returns:
+            Iterator: iterator of commit responses
+
+        Raises:
+            N/A
+
+        """
+
+        def _commit_config(cfg_conn: "ScrapliCfgPlatform") -> ScrapliCfgResponse:
+            return cfg_conn.commit_config(source=source)
+
+        return self.run(operation=_commit_config, ordered=ordered)
+
+    def abort_config(self, ordered: bool = False) -> Iterator[ScrapliCfgResponse]:
+        """
+        Abort the loaded candidate config of every platform of the fleet
+
+        Args:
+            ordered: yield responses in the order hosts were added rather than as they complete
+
+        Returns:
+            Iterator: iterator of abort responses
+
+        Raises:
+            N/A
+
+        """
+
+        def _abort_config(cfg_conn: "ScrapliCfgPlatform") -> ScrapliCfgResponse:
+            return cfg_conn.abort_config()
+
+        return self.run(operation=_abort_config, ordered=ordered)
@@ -1,5 +1,7 @@
 """scrapli_cfg.helper"""
 
+from typing import List
+
 
 def strip_blank_lines(config: str) -> str:
     """
@@ -16,3 +18,35 @@ def strip_blank_lines(config: str) -> str:
 
     """
     return "\n".join(line for line in config.splitlines() if line)
+
+
+def split_config_blocks(config: str, block_size: int) -> List[str]:
+    """
+    Group config lines into newline terminated blocks of at most `block_size` bytes
+
+    A line that is longer than the block size on its own is returned as its own block.
+
+    Args:
+        config: config to split into blocks
+        block_size: max bytes per block
+
+    Returns:
+        list: blocks of config lines
+
+    Raises:
+        N/A
+
+    """
+    blocks: List[str] = []
+    block = ""
+
+    for line in config.splitlines():
+        if block and len(block) + len(line) + 1 > block_size:
+            blocks.append(block)
+            block = ""
+        block += f"{line}\n"
+
+    if block:
+        blocks.append(block)
+
+    return blocks
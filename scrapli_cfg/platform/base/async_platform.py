@@ -1,17 +1,78 @@
 """scrapli_cfg.platform.async_platform"""
 
+import asyncio
+import re
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor
 from types import TracebackType
-from typing import Any, Callable, List, Optional, Pattern, Tuple, Type
+from typing import Any, Callable, List, Optional, Pattern, Tuple, Type, TypeVar
 
+from scrapli.channel import AsyncChannel
+from scrapli.decorators import timeout_wrapper
 from scrapli.driver import AsyncNetworkDriver
-from scrapli_cfg.diff import ScrapliCfgDiffResponse
-from scrapli_cfg.exceptions import ScrapliCfgException
+from scrapli.response import Response
+from scrapli_cfg.cache import ConfigCache
+from scrapli_cfg.config_tree import ConfigParser
+from scrapli_cfg.diff import ScrapliCfgDiffResponse, generate_difflines
+from scrapli_cfg.exceptions import AbortConfigError, GetConfigError, ScrapliCfgException
+from scrapli_cfg.facts import FactsCache
 from scrapli_cfg.platform.base.base_platform import ScrapliCfgBase
-from scrapli_cfg.response import ScrapliCfgResponse
+from scrapli_cfg.response import ScrapliCfgApplyResponse, ScrapliCfgResponse
+from scrapli_cfg.tracing import traced
+
+T = TypeVar("T")
+
+
+@timeout_wrapper
+async def _fast_load_exchange(
+    channel: AsyncChannel, blocks: List[Tuple[str, str]], prompt_pattern: Pattern[bytes]
+) -> bytes:
+    """
+    Write the blocks of a pipelined config, reading until the device echoed each of them
+
+    Wrapped w/ the scrapli timeout wrapper, so bound by the `timeout_ops` of the channel -- a
+    device that never echoes a sync marker raises `ScrapliTimeout` rather than hanging forever.
+
+    Args:
+        channel: scrapli channel of the connection
+        blocks: (block, sync marker line) tuples as returned by `_fast_load_blocks`
+        prompt_pattern: prompt pattern of the connection
+
+    Returns:
+        bytes: raw output read from the channel
+
+    Raises:
+        N/A
+
+    """
+    buf = b""
+    marker_position = 0
+
+    for block, sync_marker in blocks:
+        block_start = len(buf)
+        marker_id = sync_marker.split()[-1].encode()
+
+        channel.write(channel_input=block)
+        channel.write(channel_input=sync_marker)
+        channel.send_return()
+
+        while marker_id not in buf[block_start:]:
+            buf += await channel.read()
+        marker_position = buf.rindex(marker_id)
+
+    # the echo of the last marker is followed by the prompt once the device is done w/ the config
+    while not re.search(pattern=prompt_pattern, string=buf[marker_position:].partition(b"\n")[2]):
+        buf += await channel.read()
+
+    return buf
 
 
 class AsyncScrapliCfgPlatform(ABC, ScrapliCfgBase):
+    # provided by the platform mixins, annotated only so they do not shadow the mixin methods
+    clean_config: Callable[[str], str]
+    _render_remediation_config: Callable[[str, str], str]
+
     def __init__(  # pylint: disable=R0917
         self,
         conn: AsyncNetworkDriver,
@@ -19,6 +80,8 @@ class AsyncScrapliCfgPlatform(ABC, ScrapliCfgBase):
         on_prepare: Optional[Callable[..., Any]],
         dedicated_connection: bool,
         ignore_version: bool,
+        config_cache: Optional[ConfigCache] = None,
+        facts_cache: Optional[FactsCache] = None,
     ) -> None:
         """
         Scrapli Config async base class
@@ -38,6 +101,10 @@ class AsyncScrapliCfgPlatform(ABC, ScrapliCfgBase):
                 target device. For example, for EOS devices we need > 4.14 to load configs; so if a
                 device is encountered at 4.13 the version check would raise an exception rather than
                 just failing in a potentially awkward fashion.
+            config_cache: optional `ConfigCache` to cache `get_config` results in, the cache is
+                invalidated on commit, abort and cleanup
+            facts_cache: optional `FactsCache` to cache device facts (version string, etc.) in, so
+                that `prepare` and the platform helpers can skip fetching them from the device
 
         Returns:
             None
@@ -51,7 +118,17 @@ class AsyncScrapliCfgPlatform(ABC, ScrapliCfgBase):
 
         self.on_prepare = on_prepare
 
-        super().__init__(config_sources=config_sources, ignore_version=ignore_version)
+        super().__init__(
+            config_sources=config_sources,
+            ignore_version=ignore_version,
+            config_cache=config_cache,
+            facts_cache=facts_cache,
+        )
+
+        # optional executor (thread or process pool) that the cpu heavy stages of `diff_config`
+        # (config cleaning and diff generation) run in, keeping the event loop free to service
+        # other connections while big configs are diffed
+        self.cpu_executor: Optional[Executor] = None
 
     async def __aenter__(self) -> "AsyncScrapliCfgPlatform":
         """
@@ -158,7 +235,7 @@ class AsyncScrapliCfgPlatform(ABC, ScrapliCfgBase):
 
         await self._open()
 
-        if self.ignore_version is False:
+        if self.ignore_version is False and not self._set_cached_version():
             self.logger.debug("ignore_version is False, fetching device version")
             version_response = await self.get_version()
             self._validate_and_set_version(version_response=version_response)
@@ -196,6 +273,12 @@ class AsyncScrapliCfgPlatform(ABC, ScrapliCfgBase):
         self._version_string = ""
         self._prepared = False
 
+        self._invalidate_config_cache()
+        self._session_facts = {}
+
+        if self.facts_cache is not None:
+            self.facts_cache.flush()
+
         # this has *probably* been reset already, but reset it just in case user re-opens connection
         # we can have a clean slate to work with
         try:
@@ -221,12 +304,18 @@ class AsyncScrapliCfgPlatform(ABC, ScrapliCfgBase):
         """
 
     @abstractmethod
-    async def get_config(self, source: str = "running") -> ScrapliCfgResponse:
+    async def get_config(
+        self, source: str = "running", sections: Optional[List[str]] = None
+    ) -> ScrapliCfgResponse:
         """
         Get device configuration
 
         Args:
             source: name of the config source, generally running|startup
+            sections: optional list of config sections to fetch rather than the whole config, i.e.
+                ["interface Management1"] -- sections are filtered on the device (ios-like
+                platforms use "| section", iosxr/junos show the section directly) and the results
+                are joined w/ newlines
 
         Returns:
             ScrapliCfgResponse: response object containing string of the target config source as the
@@ -237,6 +326,114 @@ class AsyncScrapliCfgPlatform(ABC, ScrapliCfgBase):
 
         """
 
+    @abstractmethod
+    async def get_config_fingerprint(self, source: str = "running") -> ScrapliCfgResponse:
+        """
+        Get a cheap fingerprint of the device configuration
+
+        Uses the cheapest mechanism the platform offers (checksum, last change timestamp, last
+        commit id) so that config changes can be detected without fetching the whole config
+
+        Args:
+            source: name of the config source, generally running|startup
+
+        Returns:
+            ScrapliCfgResponse: response object containing the fingerprint of the target config
+                source as the `result` attribute
+
+        Raises:
+            N/A
+
+        """
+
+    async def config_changed(self, source: str = "running", fingerprint: str = "") -> bool:
+        """
+        Check if the device configuration changed by way of the config fingerprint
+
+        Compares the current config fingerprint against the provided fingerprint (or the last
+        fingerprint seen for the source); if it changed, any cached config for the source is
+        invalidated so the next `get_config` fetches the config from the device.
+
+        Args:
+            source: name of the config source, generally running|startup
+            fingerprint: fingerprint to compare against, if not provided the last fingerprint seen
+                for the source is used
+
+        Returns:
+            bool: True if the config changed (or the fingerprint could not be fetched), otherwise
+                False; always True the first time a source is checked w/out a fingerprint
+
+        Raises:
+            N/A
+
+        """
+        response = await self.get_config_fingerprint(source=source)
+        return self._config_fingerprint_changed(
+            source=source, response=response, fingerprint=fingerprint
+        )
+
+    async def _send_config_fast_load(self, config: str, privilege_level: str) -> Response:
+        """
+        Pipeline a config into a configuration session/candidate
+
+        Rather than waiting for the prompt after every line (as `send_config` does) the config is
+        written in blocks of `fast_load_block_size` bytes, each followed by a comment line w/ a
+        unique id; the echo of that id is read before writing the next block (so neither end of
+        the session stalls on full buffers), and once the echo of the last id and the prompt after
+        it are read the device has consumed the whole config. The whole exchange is bound by the
+        `timeout_ops` of the connection. Only use this where the device does not validate lines
+        until commit (eos config sessions, iosxr candidates) -- any per line errors are only found
+        afterwards in the output (and so fail the response), the session diff or the device error
+        log.
+
+        Args:
+            config: configuration to load
+            privilege_level: configuration privilege level to load the config in
+
+        Returns:
+            Response: scrapli response object of the whole load, the result holds the output w/o
+                the echoed config
+
+        Raises:
+            N/A
+
+        """
+        await self.conn.acquire_priv(desired_priv=privilege_level)
+
+        blocks = self._fast_load_blocks(config=config)
+        prompt_pattern = self._fast_load_prompt_pattern()
+
+        response = Response(
+            host=self.conn.host,
+            channel_input=config,
+            failed_when_contains=self.conn.failed_when_contains,
+        )
+
+        with traced(
+            exporters=self.trace_exporters,
+            operation="send_config_fast_load",
+            host=self.conn.host,
+            channel_inputs=config.splitlines(),
+        ) as trace_event:
+            # channel must be passed positionally, the timeout wrapper finds it as the first arg
+            raw_output = await _fast_load_exchange(self.conn.channel, blocks, prompt_pattern)
+
+            response.record_response(
+                result=self._process_fast_load_output(
+                    output=raw_output,
+                    channel_inputs=[
+                        line
+                        for block, sync_marker in blocks
+                        for line in (*block.splitlines(), sync_marker)
+                    ],
+                    prompt_pattern=prompt_pattern,
+                )
+            )
+            response.raw_result = raw_output
+            trace_event.record_result(response)
+
+        return response
+
     @abstractmethod
     async def load_config(
         self, config: str, replace: bool = False, **kwargs: Any
@@ -292,7 +489,9 @@ class AsyncScrapliCfgPlatform(ABC, ScrapliCfgBase):
         """
 
     @abstractmethod
-    async def diff_config(self, source: str = "running") -> ScrapliCfgDiffResponse:
+    async def diff_config(
+        self, source: str = "running", mode: str = "full"
+    ) -> ScrapliCfgDiffResponse:
         """
         Diff a loaded configuration against the source config store
 
@@ -300,6 +499,11 @@ class AsyncScrapliCfgPlatform(ABC, ScrapliCfgBase):
             source: name of the config source to diff against, generally running|startup -- device
                 diffs will generally not care about this argument, but the built in scrapli differ
                 will
+            mode: "full" to fetch the source config and diff it against the candidate config, or
+                "device" to build the diff from the device generated diff only, skipping fetching
+                the (possibly very large) source config. platforms that cannot generate a device
+                diff for the loaded config (or device diffs that cannot be parsed) fall back to
+                "full" diffs
 
         Returns:
             ScrapliCfgDiffResponse: scrapli cfg diff object
@@ -309,11 +513,220 @@ class AsyncScrapliCfgPlatform(ABC, ScrapliCfgBase):
 
         """
 
+    async def _run_cpu_bound(self, func: Callable[..., T], *args: Any, clean: bool = False) -> T:
+        """
+        Run a cpu bound callable, in the `cpu_executor` if there is one
+
+        Args:
+            func: callable to run
+            *args: positional args for the callable
+            clean: True if the callable is a (bound) clean method -- these cannot be pickled, so
+                are run in the event loop's default thread pool if the cpu executor is a process
+                pool
+
+        Returns:
+            T: result of the callable
+
+        Raises:
+            N/A
+
+        """
+        if self.cpu_executor is None:
+            return func(*args)
+
+        executor: Optional[Executor] = self.cpu_executor
+        if clean and isinstance(executor, ProcessPoolExecutor):
+            executor = None
+
+        return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+    async def _post_diff_config_offloaded(  # pylint: disable=R0917
+        self,
+        diff_response: ScrapliCfgDiffResponse,
+        scrapli_responses: List[Response],
+        source_config: str,
+        candidate_config: str,
+        device_diff: str,
+        config_parser: Optional[ConfigParser] = None,
+        device_difflines: Optional[List[str]] = None,
+    ) -> ScrapliCfgDiffResponse:
+        """
+        Clean the configs and finish the diff response w/out blocking the event loop
+
+        When a `cpu_executor` is set the configs are cleaned and the diff lines are generated in
+        the executor, otherwise this is the same as cleaning the configs and calling
+        `_post_diff_config` directly (with the diff lines generated lazily by the response).
+
+        Args:
+            diff_response: response object to update
+            scrapli_responses: list of scrapli response objects from diffing the config
+            source_config: previous (uncleaned) source config from the device
+            candidate_config: (uncleaned) user provided configuration
+            device_diff: diff generated from the device itself
+            config_parser: callable to parse configs into config trees for section diffs
+            device_difflines: ndiff style diff lines parsed from the device diff
+
+        Returns:
+            ScrapliCfgDiffResponse: diff object for diff operation
+
+        Raises:
+            N/A
+
+        """
+        source_config = await self._run_cpu_bound(self.clean_config, source_config, clean=True)
+        candidate_config = await self._run_cpu_bound(
+            self.clean_config, candidate_config, clean=True
+        )
+
+        difflines = None
+        if self.cpu_executor is not None and device_difflines is None:
+            normalized_source_config, normalized_candidate_config = self._normalize_diff_configs(
+                source_config=source_config, candidate_config=candidate_config
+            )
+            # identical configs are short-circuited by `_post_diff_config`, only offload real diffs
+            if normalized_source_config != normalized_candidate_config:
+                difflines = await self._run_cpu_bound(
+                    generate_difflines,
+                    normalized_source_config,
+                    normalized_candidate_config,
+                    self.diff_backend,
+                )
+
+        return self._post_diff_config(
+            diff_response=diff_response,
+            scrapli_responses=scrapli_responses,
+            source_config=source_config,
+            candidate_config=candidate_config,
+            device_diff=device_diff,
+            config_parser=config_parser,
+            device_difflines=device_difflines,
+            difflines=difflines,
+        )
+
+    async def apply(
+        self,
+        config: str,
+        replace: bool = False,
+        commit_if: Optional[Callable[[ScrapliCfgDiffResponse], bool]] = None,
+        diff_mode: str = "full",
+        **kwargs: Any,
+    ) -> ScrapliCfgApplyResponse:
+        """
+        Load, diff and (if anything changed) commit a configuration in one go
+
+        Device facts are memoized for the duration of the apply so each is only fetched from the
+        device once, and the running config fetched for the diff doubles as the no-op check -- a
+        candidate that matches the running config is aborted rather than committed (and saved).
+        If loading or diffing fails the candidate is aborted as well, and if `commit_if` or the
+        commit itself raises the candidate is aborted before the exception is re-raised.
+
+        Args:
+            config: string of the configuration to apply
+            replace: replace the configuration or not, if false configuration will be loaded as a
+                merge operation
+            commit_if: optional callable receiving the diff response, the candidate config is only
+                committed if it returns True
+            diff_mode: "full" or "device", passed on to `diff_config` -- "device" skips fetching the
+                source config again where the platform can build the diff from the device diff
+            kwargs: additional kwargs passed on to `load_config`, see your specific platform
+
+        Returns:
+            ScrapliCfgApplyResponse: aggregated response w/ the response, timing and device round
+                trips of each phase
+
+        Raises:
+            Exception: re-raised after aborting the candidate config if `commit_if` or the commit
+                raises
+
+        """
+        response = self._pre_apply()
+
+        memoize_facts = self.memoize_facts
+        self.memoize_facts = True
+        committed = False
+
+        try:
+            phase_start = time.perf_counter()
+            load_response = await self.load_config(config=config, replace=replace, **kwargs)
+            response.record_phase(
+                phase="load",
+                response=load_response,
+                elapsed_time=time.perf_counter() - phase_start,
+            )
+
+            diff_response = None
+            if not load_response.failed:
+                phase_start = time.perf_counter()
+                diff_response = await self.diff_config(mode=diff_mode)
+                response.record_phase(
+                    phase="diff",
+                    response=diff_response,
+                    elapsed_time=time.perf_counter() - phase_start,
+                )
+
+            phase_start = time.perf_counter()
+            should_commit = False
+            try:
+                should_commit = (
+                    diff_response is not None
+                    and not diff_response.failed
+                    and self._apply_should_commit(diff_response=diff_response, commit_if=commit_if)
+                )
+                if should_commit:
+                    commit_response = await self.commit_config()
+                    committed = not commit_response.failed
+                    response.record_phase(
+                        phase="commit",
+                        response=commit_response,
+                        elapsed_time=time.perf_counter() - phase_start,
+                    )
+            except Exception:
+                # never leave the loaded candidate behind on the device
+                await self._abort_apply(response=response, phase_start=phase_start)
+                raise
+
+            if not should_commit:
+                await self._abort_apply(response=response, phase_start=phase_start)
+        finally:
+            self.memoize_facts = memoize_facts
+            if not memoize_facts:
+                self._session_facts = {}
+
+        return self._post_apply(response=response, committed=committed)
+
+    async def _abort_apply(self, response: ScrapliCfgApplyResponse, phase_start: float) -> None:
+        """
+        Abort the candidate config of an apply and record the abort phase
+
+        Args:
+            response: apply response to record the abort phase in
+            phase_start: perf counter value the abort phase started at
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        try:
+            abort_response = await self.abort_config()
+        except AbortConfigError:
+            # nothing was loaded, so there is nothing to abort
+            return
+
+        response.record_phase(
+            phase="abort",
+            response=abort_response,
+            elapsed_time=time.perf_counter() - phase_start,
+        )
+
     async def render_substituted_config(
         self,
         config_template: str,
         substitutes: List[Tuple[str, Pattern[str]]],
         source: str = "running",
+        sections: Optional[List[str]] = None,
     ) -> str:
         """
         Render a substituted configuration file
@@ -329,6 +742,9 @@ class AsyncScrapliCfgPlatform(ABC, ScrapliCfgBase):
                 the config_template file, and pattern is a compiled regular expression pattern to be
                 used to fetch that section from the source config
             source: config source to use for the substitution efforts, typically running|startup
+            sections: optional list of config sections to fetch from the source, if the
+                substitutes only need a few sections of the config this avoids fetching the
+                whole config
 
         Returns:
             str: substituted/rendered config
@@ -339,9 +755,41 @@ class AsyncScrapliCfgPlatform(ABC, ScrapliCfgBase):
         """
         self.logger.info("fetching configuration and replacing with provided substitutes")
 
-        source_config = await self.get_config(source=source)
+        source_config = await self.get_config(source=source, sections=sections)
         return self._render_substituted_config(
             config_template=config_template,
             substitutes=substitutes,
             source_config=source_config.result,
         )
+
+    async def render_remediation_config(self, config: str, source: str = "running") -> str:
+        """
+        Render the minimal config to merge into a device to end up w/ the given candidate config
+
+        Rather than merging the full candidate config, only the lines that differ from the source
+        config are rendered -- changed sections w/ their added lines and negations of removed
+        lines (`no` lines for ios-like platforms, `delete` statements for junos). Load the result
+        (w/ `replace=False`, and the `set` kwarg for junos) to push only what actually changed.
+
+        Args:
+            config: candidate config
+            source: config source to remediate against, typically running|startup
+
+        Returns:
+            str: remediation config, an empty string if the source config already matches
+
+        Raises:
+            GetConfigError: if fetching the source config fails
+
+        """
+        self.logger.info("fetching configuration and rendering remediation config")
+
+        source_config = await self.get_config(source=source)
+        if source_config.failed:
+            msg = "failed fetching source config for remediation"
+            self.logger.critical(msg)
+            raise GetConfigError(msg)
+
+        return await self._run_cpu_bound(
+            self._render_remediation_config, source_config.result, config, clean=True
+        )
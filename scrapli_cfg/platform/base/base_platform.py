@@ -1,12 +1,18 @@
 """scrapli_cfg.platforms.base_platform"""
 
+# pylint: disable=C0302
+
 import re
-from typing import List, Pattern, Tuple, Union
+from typing import Callable, Dict, List, Optional, Pattern, Tuple, Union, cast
+from uuid import uuid4
 
 from scrapli.driver import AsyncNetworkDriver, NetworkDriver
 from scrapli.logging import get_instance_logger
 from scrapli.response import MultiResponse, Response
-from scrapli_cfg.diff import ScrapliCfgDiffResponse
+from scrapli_cfg.cache import ConfigCache
+from scrapli_cfg.config_tree import ConfigParser
+from scrapli_cfg.diff import DIFF_MODES, ScrapliCfgDiffResponse
+from scrapli_cfg.diff_backends import DiffBackend, patience_diff
 from scrapli_cfg.exceptions import (
     AbortConfigError,
     CommitConfigError,
@@ -18,19 +24,37 @@ from scrapli_cfg.exceptions import (
     TemplateError,
     VersionError,
 )
-from scrapli_cfg.response import ScrapliCfgResponse
+from scrapli_cfg.facts import CONFIG_FACTS, FactsCache
+from scrapli_cfg.helper import split_config_blocks
+from scrapli_cfg.response import ScrapliCfgApplyResponse, ScrapliCfgResponse
+from scrapli_cfg.section_index import SectionIndex, render_template
+from scrapli_cfg.tracing import TracedConnection, TraceExporter
+
+# max bytes of config written to the channel at once when pipelining ("fast load") a config
+FAST_LOAD_BLOCK_SIZE = 16384
+# comment line sent after each block of a pipelined config, suffixed w/ a unique id; the echo of the
+# id marks the device having consumed the block
+FAST_LOAD_SYNC_MARKER = "! scrapli_cfg fast load sync"
 
 
 class ScrapliCfgBase:
     conn: Union[NetworkDriver, AsyncNetworkDriver]
 
-    def __init__(self, config_sources: List[str], ignore_version: bool = False) -> None:
+    def __init__(
+        self,
+        config_sources: List[str],
+        ignore_version: bool = False,
+        config_cache: Optional[ConfigCache] = None,
+        facts_cache: Optional[FactsCache] = None,
+    ) -> None:
         """
         Base class for all CFG platforms
 
         Args:
             config_sources: list of allowed config sources
             ignore_version: ignore platform version check or not
+            config_cache: optional cache for `get_config` results
+            facts_cache: optional cache for device facts such as the version string
 
         Returns:
             None
@@ -53,6 +77,89 @@ class ScrapliCfgBase:
         # bool indicated if a `on_prepare` callable has been executed or not
         self._prepared = False
 
+        self.config_cache = config_cache
+        self.facts_cache = facts_cache
+
+        # per-session memo of device facts, only used if `memoize_facts` is True; reset on cleanup
+        self.memoize_facts = False
+        self._session_facts: Dict[str, str] = {}
+
+        # last seen fingerprint of each config source, see `get_config_fingerprint`
+        self.config_fingerprints: Dict[str, str] = {}
+
+        # callable used to generate diffs in `diff_config`, can be swapped for any of the backends
+        # in `scrapli_cfg.diff_backends` (or any callable w/ the same signature as `difflib.ndiff`)
+        self.diff_backend: DiffBackend = patience_diff
+
+        # index of the last source config substitutes were rendered against, reused as long as
+        # the source config is unchanged
+        self._section_index: Optional[SectionIndex] = None
+
+        # max bytes written per block when pipelining ("fast load") configs into a session
+        self.fast_load_block_size = FAST_LOAD_BLOCK_SIZE
+
+        # "full" or "summary" -- how much of the scrapli responses (and diffs) the responses of
+        # this platform hold on to, see `ScrapliCfgResponse`
+        self.retain = "full"
+
+        # skip (abort rather than commit) candidates a `diff_config` against the running config
+        # found identical to it; `_candidate_unchanged` is reset on every load
+        self.skip_noop_commits = False
+        self._candidate_unchanged = False
+
+        # exporters every device interaction is traced to, see `add_trace_exporter`
+        self.trace_exporters: List[TraceExporter] = []
+
+    def add_trace_exporter(self, exporter: TraceExporter) -> None:
+        """
+        Trace every device interaction of the platform to an exporter
+
+        The first exporter added wraps the scrapli connection in a `TracedConnection`, which emits
+        a start and end event for every `send_command(s)`, `send_config(s)`, `send_interactive`
+        and `acquire_priv` the platform does. Exporters can also be removed from (or added to) the
+        `trace_exporters` list directly at any time.
+
+        Args:
+            exporter: exporter to pass the events to, i.e. an `InMemoryExporter`
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.trace_exporters.append(exporter)
+
+        if not isinstance(self.conn, TracedConnection):
+            self.conn = cast(
+                Union[NetworkDriver, AsyncNetworkDriver],
+                TracedConnection(conn=self.conn, exporters=self.trace_exporters),
+            )
+
+    def _get_section_index(self, source_config: str) -> SectionIndex:
+        """
+        Return the section index for a source config, reusing the last index if possible
+
+        Args:
+            source_config: source config to index
+
+        Returns:
+            SectionIndex: section index for the source config
+
+        Raises:
+            N/A
+
+        """
+        if self._section_index is None or (
+            self._section_index.config is not source_config
+            and self._section_index.config != source_config
+        ):
+            self.logger.debug("indexing source config sections")
+            self._section_index = SectionIndex(config=source_config)
+
+        return self._section_index
+
     def _render_substituted_config(
         self, config_template: str, substitutes: List[Tuple[str, Pattern[str]]], source_config: str
     ) -> str:
@@ -92,15 +199,12 @@ class ScrapliCfgBase:
             self.logger.critical(msg)
             raise TemplateError(msg)
 
-        replace_sections = [
-            (name, re.search(pattern=pattern, string=source_config))
-            for name, pattern in substitutes
-        ]
-
-        rendered_config = config_template
+        section_index = self._get_section_index(source_config=source_config)
 
-        for name, replace_section in replace_sections:
-            if not replace_section:
+        replacements = {}
+        for name, pattern in substitutes:
+            replace_content = section_index.resolve(pattern=pattern)
+            if replace_content is None:
                 msg = (
                     f"substitution pattern {name} was unable to find a match in the target config"
                     " source"
@@ -108,17 +212,11 @@ class ScrapliCfgBase:
                 self.logger.critical(msg)
                 raise TemplateError(msg)
 
-            groups = replace_section.groups()
-            if not groups:
-                replace_content = replace_section.group()
-            else:
-                replace_content = groups[0]
+            replacements[name] = replace_content
 
-            rendered_config = rendered_config.replace(f"{{{{ {name} }}}}", replace_content)
-
-        # remove any totally empty lines (from bad regex, or just device spitting out lines w/
-        # nothing on it
-        rendered_config = "\n".join(line for line in rendered_config.splitlines() if line)
+        rendered_config = render_template(
+            config_template=config_template, replacements=replacements
+        )
 
         self.logger.debug("rendering substituted config complete")
 
@@ -148,6 +246,140 @@ class ScrapliCfgBase:
             raise VersionError(msg)
         self._version_string = version_response.result
 
+    def _get_fact(self, fact: str) -> Optional[str]:
+        """
+        Return a memoized or cached device fact if there is one
+
+        Args:
+            fact: name of the fact, i.e. "version"
+
+        Returns:
+            str: memoized/cached fact, or None if memoizing and caching are disabled or nothing is
+                memoized/cached
+
+        Raises:
+            N/A
+
+        """
+        if self.memoize_facts and fact in self._session_facts:
+            return self._session_facts[fact]
+
+        if self.facts_cache is None:
+            return None
+
+        value = self.facts_cache.get(host=self.conn.host, port=self.conn.port, fact=fact)
+        if value is not None:
+            self.logger.debug(f"using cached {fact} fact")
+            if self.memoize_facts:
+                self._session_facts[fact] = value
+
+        return value
+
+    def _set_fact(self, fact: str, value: str, persist: bool = True) -> None:
+        """
+        Memoize and cache a device fact
+
+        Args:
+            fact: name of the fact, i.e. "version"
+            value: value of the fact
+            persist: store the fact in the facts cache (if any) too, or only memoize it for the
+                session -- volatile facts like filesystem space available should not outlive the
+                session
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        if self.memoize_facts:
+            self._session_facts[fact] = value
+
+        if self.facts_cache is None or not persist:
+            return
+
+        self.facts_cache.set(host=self.conn.host, port=self.conn.port, fact=fact, value=value)
+
+    def _invalidate_facts(self, facts: Optional[List[str]] = None) -> None:
+        """
+        Invalidate memoized and cached device facts
+
+        Args:
+            facts: names of the facts to invalidate, if not provided all facts are invalidated
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        if facts is None:
+            self._session_facts = {}
+        else:
+            for fact in facts:
+                self._session_facts.pop(fact, None)
+
+        if self.facts_cache is None:
+            return
+
+        self.logger.debug("invalidating device facts")
+        self.facts_cache.invalidate(host=self.conn.host, port=self.conn.port, facts=facts)
+
+    def _adjust_filesystem_space_available(self, delta: int, failed: bool = False) -> None:
+        """
+        Adjust the memoized filesystem space available after writing or deleting a candidate config
+
+        Keeps the memoized value close enough to reality that the next `load_config` in the session
+        does not need to ask the device again. If the write/delete failed there is no telling how
+        much of the file made it to (or was removed from) the filesystem, so the memoized value is
+        dropped instead and the next `load_config` asks the device.
+
+        Args:
+            delta: bytes to add to (or, if negative, subtract from) the space available
+            failed: True if the write/delete of the candidate config failed
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        if failed:
+            self._session_facts.pop("filesystem_space_available", None)
+            return
+
+        filesystem_bytes_available = self._session_facts.get("filesystem_space_available")
+        if filesystem_bytes_available is None:
+            return
+
+        self._session_facts["filesystem_space_available"] = str(
+            int(filesystem_bytes_available) + delta
+        )
+
+    def _set_cached_version(self) -> bool:
+        """
+        Set the internal version attribute from the facts cache if possible
+
+        Args:
+            N/A
+
+        Returns:
+            bool: True if the version was set from the facts cache, otherwise False
+
+        Raises:
+            N/A
+
+        """
+        version_string = self._get_fact(fact="version")
+        if not version_string:
+            return False
+
+        self._version_string = version_string
+        return True
+
     def _prepare_ok(self) -> None:
         """
         Determine if prepare is "OK" for a given operation
@@ -235,7 +467,9 @@ class ScrapliCfgBase:
         """
         self.logger.info("get_version requested")
 
-        response = ScrapliCfgResponse(host=self.conn.host, raise_for_status_exception=VersionError)
+        response = ScrapliCfgResponse(
+            host=self.conn.host, raise_for_status_exception=VersionError, retain=self.retain
+        )
 
         return response
 
@@ -266,15 +500,70 @@ class ScrapliCfgBase:
         if response.failed:
             msg = "failed to get version from device"
             self.logger.critical(msg)
+        elif result:
+            cached_version = self._get_fact(fact="version")
+            if cached_version is not None and cached_version != result:
+                # the device disagrees w/ the cached version, if the device was upgraded/replaced
+                # any other cached facts are suspect too
+                self._invalidate_facts()
+            self._set_fact(fact="version", value=result)
 
         return response
 
-    def _pre_get_config(self, source: str) -> ScrapliCfgResponse:
+    def _get_cached_config(self, source: str) -> Optional[ScrapliCfgResponse]:
+        """
+        Return the cached `get_config` response for a source if there is one
+
+        Args:
+            source: name of the config source, generally running|startup
+
+        Returns:
+            ScrapliCfgResponse: cached response, or None if caching is disabled or nothing is cached
+
+        Raises:
+            N/A
+
+        """
+        if self.config_cache is None:
+            return None
+
+        cached_response = self.config_cache.get(
+            host=self.conn.host, port=self.conn.port, source=source
+        )
+        if cached_response is not None:
+            self.logger.debug(f"returning cached {source} config")
+
+        return cached_response
+
+    def _invalidate_config_cache(self, source: Optional[str] = None) -> None:
+        """
+        Invalidate cached `get_config` responses of this device
+
+        Args:
+            source: config source to invalidate, if not provided all sources are invalidated
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        if self.config_cache is None:
+            return
+
+        self.logger.debug("invalidating config cache")
+        self.config_cache.invalidate(host=self.conn.host, port=self.conn.port, source=source)
+
+    def _pre_get_config(
+        self, source: str, sections: Optional[List[str]] = None
+    ) -> ScrapliCfgResponse:
         """
         Handle pre "get_config" operations for parity between sync and async
 
         Args:
             source: name of the config source, generally running|startup
+            sections: optional list of config sections requested
 
         Returns:
             ScrapliCfgResponse: new response object to update w/ get results
@@ -284,6 +573,8 @@ class ScrapliCfgBase:
 
         """
         self.logger.info(f"get_config for config source '{source}' requested")
+        if sections:
+            self.logger.debug(f"get_config limited to sections {sections}")
 
         self._operation_ok()
 
@@ -295,17 +586,19 @@ class ScrapliCfgBase:
             raise InvalidConfigTarget(msg)
 
         response = ScrapliCfgResponse(
-            host=self.conn.host, raise_for_status_exception=GetConfigError
+            host=self.conn.host, raise_for_status_exception=GetConfigError, retain=self.retain
         )
 
         return response
 
-    def _post_get_config(
+    def _post_get_config(  # pylint: disable=R0917
         self,
         response: ScrapliCfgResponse,
         source: str,
         scrapli_responses: List[Union[Response, MultiResponse]],
         result: str,
+        sections: Optional[List[str]] = None,
+        cache: bool = True,
     ) -> ScrapliCfgResponse:
         """
         Handle post "get_config" operations for parity between sync and async
@@ -315,6 +608,9 @@ class ScrapliCfgBase:
             source: name of the config source, generally running|startup
             scrapli_responses: list of scrapli response objects from fetching the config
             result: final string of the "get_config" result
+            sections: optional list of config sections requested, partial configs are never cached
+            cache: store the response in the config cache (if any), False for results that are not
+                the plain config of the source (i.e. the nxos checkpoint file)
 
         Returns:
             ScrapliCfgResponse: response object containing string of the target config source as the
@@ -329,9 +625,122 @@ class ScrapliCfgBase:
         if response.failed:
             msg = f"failed to get {source} config"
             self.logger.critical(msg)
+        elif self.config_cache is not None and cache and not sections:
+            self.config_cache.set(
+                host=self.conn.host, port=self.conn.port, source=source, response=response
+            )
+
+        return response
+
+    def _pre_get_config_fingerprint(self, source: str) -> ScrapliCfgResponse:
+        """
+        Handle pre "get_config_fingerprint" operations for parity between sync and async
+
+        Args:
+            source: name of the config source, generally running|startup
+
+        Returns:
+            ScrapliCfgResponse: new response object to update w/ fingerprint results
+
+        Raises:
+            InvalidConfigTarget: if the requested config source is not valid
+
+        """
+        self.logger.info(f"get_config_fingerprint for config source '{source}' requested")
+
+        self._operation_ok()
+
+        if source not in self.config_sources:
+            msg = (
+                f"provided config source '{source}' not valid, must be one of {self.config_sources}"
+            )
+            self.logger.critical(msg)
+            raise InvalidConfigTarget(msg)
+
+        response = ScrapliCfgResponse(
+            host=self.conn.host, raise_for_status_exception=GetConfigError, retain=self.retain
+        )
+
+        return response
+
+    def _post_get_config_fingerprint(
+        self,
+        response: ScrapliCfgResponse,
+        source: str,
+        scrapli_responses: List[Union[Response, MultiResponse]],
+        result: str,
+    ) -> ScrapliCfgResponse:
+        """
+        Handle post "get_config_fingerprint" operations for parity between sync and async
+
+        Args:
+            response: response object to update
+            source: name of the config source, generally running|startup
+            scrapli_responses: list of scrapli response objects from fetching the fingerprint
+            result: fingerprint parsed from the device output
+
+        Returns:
+            ScrapliCfgResponse: response object containing the fingerprint of the target config
+                source as the `result` attribute
+
+        Raises:
+            N/A
+
+        """
+        response.record_response(scrapli_responses=scrapli_responses, result=result)
+
+        if not result:
+            # the command "worked" but there was nothing we could use as a fingerprint
+            response.failed = True
+
+        if response.failed:
+            msg = f"failed to get {source} config fingerprint"
+            self.logger.critical(msg)
 
         return response
 
+    def _config_fingerprint_changed(
+        self, source: str, response: ScrapliCfgResponse, fingerprint: str = ""
+    ) -> bool:
+        """
+        Compare a freshly fetched config fingerprint against a known fingerprint
+
+        The fresh fingerprint is stored as the known fingerprint for the source; if it changed any
+        cached config for the source is invalidated so the next `get_config` goes to the device.
+        A failed fingerprint response is always treated as a change.
+
+        Args:
+            source: name of the config source, generally running|startup
+            response: response object from `get_config_fingerprint`
+            fingerprint: fingerprint to compare against, if not provided the last fingerprint seen
+                for the source is used
+
+        Returns:
+            bool: True if the config (may have) changed, otherwise False
+
+        Raises:
+            N/A
+
+        """
+        if response.failed:
+            self.config_fingerprints.pop(source, None)
+            self._invalidate_config_cache(source=source)
+            self._invalidate_facts(facts=CONFIG_FACTS)
+            return True
+
+        known_fingerprint = fingerprint or self.config_fingerprints.get(source, "")
+        self.config_fingerprints[source] = response.result
+
+        if known_fingerprint == response.result:
+            self.logger.debug(f"{source} config fingerprint unchanged")
+            return False
+
+        self.logger.debug(f"{source} config fingerprint changed")
+        self._invalidate_config_cache(source=source)
+        self._invalidate_facts(facts=CONFIG_FACTS)
+
+        return True
+
     def _pre_load_config(self, config: str) -> ScrapliCfgResponse:
         """
         Handle pre "load_config" operations for parity between sync and async
@@ -351,13 +760,93 @@ class ScrapliCfgBase:
         self._operation_ok()
 
         self.candidate_config = config
+        self._candidate_unchanged = False
 
         response = ScrapliCfgResponse(
-            host=self.conn.host, raise_for_status_exception=LoadConfigError
+            host=self.conn.host, raise_for_status_exception=LoadConfigError, retain=self.retain
         )
 
         return response
 
+    def _fast_load_blocks(self, config: str) -> List[Tuple[str, str]]:
+        """
+        Split a config into the blocks to pipeline it in, each w/ its own unique sync marker
+
+        Args:
+            config: configuration to load
+
+        Returns:
+            list: (block, sync marker line) tuples, the unique id is the last word of the marker
+
+        Raises:
+            N/A
+
+        """
+        return [
+            (block, f"{FAST_LOAD_SYNC_MARKER} {uuid4().hex}")
+            for block in split_config_blocks(config=config, block_size=self.fast_load_block_size)
+        ]
+
+    def _fast_load_prompt_pattern(self) -> Pattern[bytes]:
+        """
+        Return the prompt pattern of the connection, compiled the way scrapli matches prompts
+
+        Args:
+            N/A
+
+        Returns:
+            Pattern: compiled prompt pattern
+
+        Raises:
+            N/A
+
+        """
+        return re.compile(pattern=self.conn.comms_prompt_pattern.encode(), flags=re.M | re.I)
+
+    @staticmethod
+    def _process_fast_load_output(
+        output: bytes, channel_inputs: List[str], prompt_pattern: Pattern[bytes]
+    ) -> bytes:
+        """
+        Strip the echoed input and prompts from the output of a pipelined config
+
+        The echo of each input line is found in order (w/ or w/o the prompt in front of it), so
+        what is left is only what the device itself had to say -- i.e. errors -- and failures can
+        be checked w/o the config text itself matching `failed_when_contains`.
+
+        Args:
+            output: raw output read while pipelining the config
+            channel_inputs: lines written to the channel, in order
+            prompt_pattern: prompt pattern of the connection
+
+        Returns:
+            bytes: processed output
+
+        Raises:
+            N/A
+
+        """
+        expected_echoes = [
+            channel_input.strip().encode()
+            for channel_input in channel_inputs
+            if channel_input.strip()
+        ]
+        echo_index = 0
+        output_lines = []
+
+        for line in output.splitlines():
+            stripped_line = line.strip()
+            if not stripped_line or re.match(pattern=prompt_pattern, string=stripped_line):
+                continue
+            if echo_index < len(expected_echoes) and stripped_line.endswith(
+                expected_echoes[echo_index]
+            ):
+                echo_index += 1
+                continue
+            output_lines.append(line.rstrip())
+
+        return b"\n".join(output_lines)
+
     def _post_load_config(
         self,
         response: ScrapliCfgResponse,
@@ -383,6 +872,9 @@ class ScrapliCfgBase:
             msg = "failed to load candidate config"
             self.logger.critical(msg)
 
+        if self.retain == "summary":
+            response.summarize()
+
         return response
 
     def _pre_abort_config(self, session_or_config_file: bool) -> ScrapliCfgResponse:
@@ -405,6 +897,8 @@ class ScrapliCfgBase:
 
         self._operation_ok()
 
+        self._invalidate_config_cache()
+
         if session_or_config_file is False:
             msg = (
                 "no configuration session or candidate configuration file exists, you must load a "
@@ -414,7 +908,7 @@ class ScrapliCfgBase:
             raise AbortConfigError(msg)
 
         response = ScrapliCfgResponse(
-            host=self.conn.host, raise_for_status_exception=AbortConfigError
+            host=self.conn.host, raise_for_status_exception=AbortConfigError, retain=self.retain
         )
 
         return response
@@ -444,6 +938,9 @@ class ScrapliCfgBase:
             msg = "failed to abort config"
             self.logger.critical(msg)
 
+        if self.retain == "summary":
+            response.summarize()
+
         return response
 
     def _pre_commit_config(self, source: str, session_or_config_file: bool) -> ScrapliCfgResponse:
@@ -467,6 +964,9 @@ class ScrapliCfgBase:
 
         self._operation_ok()
 
+        # running (and for most platforms startup) config is about to change
+        self._invalidate_config_cache()
+
         if source not in self.config_sources:
             msg = (
                 f"provided config source '{source}' not valid, must be one of {self.config_sources}"
@@ -483,11 +983,31 @@ class ScrapliCfgBase:
             raise CommitConfigError(msg)
 
         response = ScrapliCfgResponse(
-            host=self.conn.host, raise_for_status_exception=CommitConfigError
+            host=self.conn.host, raise_for_status_exception=CommitConfigError, retain=self.retain
         )
 
         return response
 
+    def _commit_is_noop(self) -> bool:
+        """
+        Check if a commit can be skipped as the candidate config matches the running config
+
+        Args:
+            N/A
+
+        Returns:
+            bool: True if `skip_noop_commits` is set and the candidate is unchanged from running
+
+        Raises:
+            N/A
+
+        """
+        if self.skip_noop_commits and self._candidate_unchanged:
+            self.logger.info("candidate config matches the running config, skipping commit")
+            return True
+
+        return False
+
     def _post_commit_config(
         self,
         response: ScrapliCfgResponse,
@@ -513,15 +1033,98 @@ class ScrapliCfgBase:
             msg = "failed to commit config"
             self.logger.critical(msg)
 
+        if self.retain == "summary":
+            response.summarize()
+
+        return response
+
+    def _pre_apply(self) -> ScrapliCfgApplyResponse:
+        """
+        Handle pre "apply" operations for parity between sync and async
+
+        Args:
+            N/A
+
+        Returns:
+            ScrapliCfgApplyResponse: new response object for apply operation
+
+        Raises:
+            N/A
+
+        """
+        self.logger.info("apply requested")
+
+        self._operation_ok()
+
+        return ScrapliCfgApplyResponse(host=self.conn.host, retain=self.retain)
+
+    def _apply_should_commit(
+        self,
+        diff_response: ScrapliCfgDiffResponse,
+        commit_if: Optional[Callable[[ScrapliCfgDiffResponse], bool]],
+    ) -> bool:
+        """
+        Decide if an applied candidate config should be committed or aborted
+
+        Args:
+            diff_response: diff of the candidate vs the running config
+            commit_if: optional callable receiving the diff response, commit only if it returns True
+
+        Returns:
+            bool: True if the candidate config should be committed
+
+        Raises:
+            N/A
+
+        """
+        if self._candidate_unchanged:
+            self.logger.info("candidate config matches the running config, not committing")
+            return False
+
+        if commit_if is not None and not commit_if(diff_response):
+            self.logger.info("commit_if rejected the candidate config, not committing")
+            return False
+
+        return True
+
+    def _post_apply(
+        self, response: ScrapliCfgApplyResponse, committed: bool
+    ) -> ScrapliCfgApplyResponse:
+        """
+        Handle post "apply" operations for parity between sync and async
+
+        Args:
+            response: response object to update
+            committed: True if the candidate config was committed
+
+        Returns:
+            ScrapliCfgApplyResponse: response object
+
+        Raises:
+            N/A
+
+        """
+        response.record_apply_response(committed=committed)
+
+        if response.failed:
+            msg = "failed to apply config"
+            self.logger.critical(msg)
+
+        if self.retain == "summary":
+            response.summarize()
+
         return response
 
-    def _pre_diff_config(self, source: str, session_or_config_file: bool) -> ScrapliCfgDiffResponse:
+    def _pre_diff_config(
+        self, source: str, session_or_config_file: bool, mode: str = "full"
+    ) -> ScrapliCfgDiffResponse:
         """
         Handle pre "diff_config" operations for parity between sync and async
 
         Args:
             source: config source to diff against
             session_or_config_file: bool of config_session_name or candidate_config_filename
+            mode: diff mode, one of "full" or "device"
 
         Returns:
             ScrapliCfgDiffResponse: diff object for diff operation
@@ -530,12 +1133,18 @@ class ScrapliCfgBase:
             InvalidConfigTarget: if trying to diff against an invalid config target
             DiffConfigError: if no config session or config file exists then we have no config to
                 diff!
+            DiffConfigError: if an invalid diff mode is provided
 
         """
         self.logger.info("diff_config requested")
 
         self._operation_ok()
 
+        if mode not in DIFF_MODES:
+            msg = f"provided diff mode '{mode}' not valid, must be one of {DIFF_MODES}"
+            self.logger.critical(msg)
+            raise DiffConfigError(msg)
+
         if source not in self.config_sources:
             msg = (
                 f"provided config source '{source}' not valid, must be one of {self.config_sources}"
@@ -551,10 +1160,31 @@ class ScrapliCfgBase:
             self.logger.critical(msg)
             raise DiffConfigError(msg)
 
-        diff_response = ScrapliCfgDiffResponse(host=self.conn.host, source=source)
+        diff_response = ScrapliCfgDiffResponse(
+            host=self.conn.host, source=source, diff_backend=self.diff_backend, retain=self.retain
+        )
 
         return diff_response
 
+    @staticmethod
+    def _normalize_diff_configs(source_config: str, candidate_config: str) -> Tuple[str, str]:
+        """
+        Normalize (cleaned) source and candidate configs before they are diffed
+
+        Args:
+            source_config: cleaned source config
+            candidate_config: cleaned candidate config
+
+        Returns:
+            tuple: normalized source and candidate configs
+
+        Raises:
+            N/A
+
+        """
+        # ensure the last line of each config ends w/ a newline so diff lines render consistently
+        return source_config + "\n", candidate_config + "\n"
+
     def _post_diff_config(  # pylint: disable=R0917
         self,
         diff_response: ScrapliCfgDiffResponse,
@@ -562,6 +1192,9 @@ class ScrapliCfgBase:
         source_config: str,
         candidate_config: str,
         device_diff: str,
+        config_parser: Optional[ConfigParser] = None,
+        device_difflines: Optional[List[str]] = None,
+        difflines: Optional[List[str]] = None,
     ) -> ScrapliCfgDiffResponse:
         """
         Handle post "diff_config" operations for parity between sync and async
@@ -572,6 +1205,12 @@ class ScrapliCfgBase:
             source_config: previous source config from the device
             candidate_config: user provided configuration
             device_diff: diff generated from the device itself
+            config_parser: callable to parse configs into config trees for section diffs
+            device_difflines: ndiff style diff lines parsed from the device diff, if provided (i.e.
+                "device" mode diffs) the source config is not diffed against the candidate
+            difflines: already generated diff lines of the source vs candidate config (as returned
+                by `_normalize_diff_configs` + `generate_difflines`), otherwise they are generated
+                lazily by the diff response
 
         Returns:
             ScrapliCfgDiffResponse: diff object for diff operation
@@ -581,14 +1220,35 @@ class ScrapliCfgBase:
 
         """
         diff_response.record_response(scrapli_responses=scrapli_responses)
+        source_config, candidate_config = self._normalize_diff_configs(
+            source_config=source_config, candidate_config=candidate_config
+        )
+
+        if device_difflines is not None:
+            unchanged = not any(line[:2] in ("+ ", "- ") for line in device_difflines)
+        else:
+            # compared exactly as they are diffed -- blank lines or whitespace in i.e. banners are
+            # real changes, anything short of identical goes through the differ
+            unchanged = source_config == candidate_config
+            if unchanged and difflines is None:
+                # identical configs, no need to run the differ at all
+                difflines = [f"  {line}" for line in candidate_config.splitlines(keepends=True)]
+
+        if diff_response.source == "running" and not diff_response.failed:
+            self._candidate_unchanged = unchanged
         diff_response.record_diff_response(
-            source_config=source_config + "\n",
-            candidate_config=candidate_config + "\n",
+            source_config=source_config,
+            candidate_config=candidate_config,
             device_diff=device_diff,
+            config_parser=config_parser if device_difflines is None else None,
+            difflines=device_difflines if device_difflines is not None else difflines,
         )
 
         if diff_response.failed:
             msg = "failed to diff config"
             self.logger.critical(msg)
 
+        if self.retain == "summary":
+            diff_response.summarize()
+
         return diff_response
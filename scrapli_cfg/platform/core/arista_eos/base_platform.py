@@ -4,14 +4,17 @@ import json
 import re
 from datetime import datetime
 from logging import Logger, LoggerAdapter
-from typing import TYPE_CHECKING, Iterable, List, Tuple, Union
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple, Union
 
 from scrapli.driver import AsyncNetworkDriver, NetworkDriver
 from scrapli.response import Response
+from scrapli_cfg.config_tree import parse_indented_config, render_indented_remediation
 from scrapli_cfg.exceptions import ScrapliCfgException
 from scrapli_cfg.helper import strip_blank_lines
 from scrapli_cfg.platform.core.arista_eos.patterns import (
     BANNER_PATTERN,
+    CONFIG_FINGERPRINT_PATTERN,
+    DEVICE_DIFF_ERROR_PATTERN,
     END_PATTERN,
     GLOBAL_COMMENT_LINE_PATTERN,
     VERSION_PATTERN,
@@ -35,6 +38,7 @@ class ScrapliCfgEOSBase:
     logger: LoggerAdapterT
     config_sources: List[str]
     config_session_name: str
+    retain: str = "full"
     candidate_config: str
 
     @staticmethod
@@ -60,6 +64,50 @@ class ScrapliCfgEOSBase:
         version_string = version_string_search.group(0) or ""
         return version_string
 
+    @staticmethod
+    def _get_config_fingerprint_command(source: str) -> str:
+        """
+        Return command to use to fetch a fingerprint of the provided config source
+
+        The fingerprint is an md5 of the config file computed on box -- eos offers no cheaper on box
+        change indicator so this requires bash access for the user.
+
+        Args:
+            source: name of the config source, generally running|startup
+
+        Returns:
+            str: command to use to fetch the config fingerprint
+
+        Raises:
+            N/A
+
+        """
+        if source == "running":
+            return 'bash timeout 10 FastCli -p 15 -c "show running-config" | md5sum'
+        return "bash timeout 10 md5sum /mnt/flash/startup-config"
+
+    @staticmethod
+    def _parse_config_fingerprint(device_output: str) -> str:
+        """
+        Parse config fingerprint out of device output
+
+        Args:
+            device_output: output from the config fingerprint command
+
+        Returns:
+            str: config fingerprint, or an empty string if no fingerprint could be found
+
+        Raises:
+            N/A
+
+        """
+        fingerprint_search = re.search(pattern=CONFIG_FINGERPRINT_PATTERN, string=device_output)
+
+        if not fingerprint_search:
+            return ""
+
+        return fingerprint_search.group("fingerprint").strip()
+
     @staticmethod
     def _parse_config_sessions(device_output: str) -> List[str]:
         """
@@ -84,12 +132,14 @@ class ScrapliCfgEOSBase:
         return sessions
 
     @staticmethod
-    def _get_config_command(source: str) -> str:
+    def _get_config_command(source: str, section: str = "") -> str:
         """
         Return command to use to get config based on the provided source
 
         Args:
             source: name of the config source, generally running|startup
+            section: optional section of the config to fetch, i.e. "interface Management1", the
+                section filtering is done on the device so only the section is sent back
 
         Returns:
             str: command to use to fetch the requested config
@@ -98,9 +148,10 @@ class ScrapliCfgEOSBase:
             N/A
 
         """
-        if source == "running":
-            return "show running-config"
-        return "show startup-config"
+        command = "show running-config" if source == "running" else "show startup-config"
+        if section:
+            command = f"{command} | section {section}"
+        return command
 
     @staticmethod
     def _prepare_config_payloads(config: str) -> Tuple[str, str]:
@@ -205,6 +256,56 @@ class ScrapliCfgEOSBase:
             config=re.sub(pattern=GLOBAL_COMMENT_LINE_PATTERN, string=config, repl="")
         )
 
+    def _render_remediation_config(self, source_config: str, candidate_config: str) -> str:
+        """
+        Render the minimal config that merged into the source config results in the candidate
+
+        Args:
+            source_config: source config
+            candidate_config: candidate config
+
+        Returns:
+            str: remediation config, lines no longer in the candidate are negated w/ "no"
+
+        Raises:
+            N/A
+
+        """
+        return render_indented_remediation(
+            source=parse_indented_config(self.clean_config(source_config)),
+            candidate=parse_indented_config(self.clean_config(candidate_config)),
+        )
+
+    def _parse_device_diff(self, device_diff: str) -> Optional[List[str]]:
+        """
+        Parse the device generated (unified) session diff into ndiff style diff lines
+
+        Args:
+            device_diff: output of the device diff command
+
+        Returns:
+            list: ndiff style diff lines, or None if the device diff could not be parsed
+
+        Raises:
+            N/A
+
+        """
+        if re.search(pattern=DEVICE_DIFF_ERROR_PATTERN, string=device_diff):
+            self.logger.warning("device diff contains errors, cannot parse device diff")
+            return None
+
+        difflines = []
+        for line in device_diff.splitlines():
+            if not line or line.startswith(("--- ", "+++ ", "@@ ")):
+                continue
+
+            if line[0] in ("+", "-"):
+                difflines.append(f"{line[0]} {line[1:]}\n")
+            else:
+                difflines.append(f"  {line[1:]}\n")
+
+        return difflines
+
     def _pre_clear_config_sessions(self) -> ScrapliCfgResponse:
         """
         Handle pre "clear_config_sessions" operations for parity between sync and async
@@ -222,7 +323,7 @@ class ScrapliCfgEOSBase:
         self.logger.info("clear_config_sessions requested")
 
         response = ScrapliCfgResponse(
-            host=self.conn.host, raise_for_status_exception=ScrapliCfgException
+            host=self.conn.host, raise_for_status_exception=ScrapliCfgException, retain=self.retain
         )
 
         return response
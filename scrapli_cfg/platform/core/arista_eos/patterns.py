@@ -17,3 +17,5 @@ ETHERNET_INTERFACES = re.compile(
 MANAGEMENT_ONE_INTERFACE = re.compile(
     pattern=r"^interface management1$(?:\n^\s{3}.*$)*\n!", flags=re.I | re.M
 )
+DEVICE_DIFF_ERROR_PATTERN = re.compile(pattern=r"^%\s?", flags=re.M)
+CONFIG_FINGERPRINT_PATTERN = re.compile(pattern=r"^(?P<fingerprint>[a-f0-9]{32})\b", flags=re.M)
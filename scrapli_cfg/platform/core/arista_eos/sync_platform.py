@@ -4,8 +4,11 @@ from typing import Any, Callable, List, Optional
 
 from scrapli.driver.core import EOSDriver
 from scrapli.response import MultiResponse, Response
+from scrapli_cfg.cache import ConfigCache
+from scrapli_cfg.config_tree import parse_indented_config
 from scrapli_cfg.diff import ScrapliCfgDiffResponse
 from scrapli_cfg.exceptions import DiffConfigError, LoadConfigError, ScrapliCfgException
+from scrapli_cfg.facts import FactsCache
 from scrapli_cfg.platform.base.sync_platform import ScrapliCfgPlatform
 from scrapli_cfg.platform.core.arista_eos.base_platform import CONFIG_SOURCES, ScrapliCfgEOSBase
 from scrapli_cfg.response import ScrapliCfgResponse
@@ -20,6 +23,8 @@ class ScrapliCfgEOS(ScrapliCfgPlatform, ScrapliCfgEOSBase):
         on_prepare: Optional[Callable[..., Any]] = None,
         dedicated_connection: bool = False,
         ignore_version: bool = False,
+        config_cache: Optional[ConfigCache] = None,
+        facts_cache: Optional[FactsCache] = None,
     ) -> None:
         if config_sources is None:
             config_sources = CONFIG_SOURCES
@@ -30,6 +35,8 @@ class ScrapliCfgEOS(ScrapliCfgPlatform, ScrapliCfgEOSBase):
             on_prepare=on_prepare,
             dedicated_connection=dedicated_connection,
             ignore_version=ignore_version,
+            config_cache=config_cache,
+            facts_cache=facts_cache,
         )
 
         self.conn: EOSDriver
@@ -121,8 +128,28 @@ class ScrapliCfgEOS(ScrapliCfgPlatform, ScrapliCfgEOSBase):
             result=self._parse_version(device_output=version_result.result),
         )
 
-    def get_config(self, source: str = "running") -> ScrapliCfgResponse:
-        response = self._pre_get_config(source=source)
+    def get_config(
+        self, source: str = "running", sections: Optional[List[str]] = None
+    ) -> ScrapliCfgResponse:
+        response = self._pre_get_config(source=source, sections=sections)
+
+        if sections:
+            section_commands = [
+                self._get_config_command(source=source, section=section) for section in sections
+            ]
+            sections_result = self.conn.send_commands(commands=section_commands)
+
+            return self._post_get_config(
+                response=response,
+                source=source,
+                scrapli_responses=[sections_result],
+                result="\n".join(section_result.result for section_result in sections_result),
+                sections=sections,
+            )
+
+        cached_response = self._get_cached_config(source=source)
+        if cached_response is not None:
+            return cached_response
 
         config_result = self.conn.send_command(command=self._get_config_command(source=source))
 
@@ -133,12 +160,27 @@ class ScrapliCfgEOS(ScrapliCfgPlatform, ScrapliCfgEOSBase):
             result=config_result.result,
         )
 
+    def get_config_fingerprint(self, source: str = "running") -> ScrapliCfgResponse:
+        response = self._pre_get_config_fingerprint(source=source)
+
+        fingerprint_result = self.conn.send_command(
+            command=self._get_config_fingerprint_command(source=source)
+        )
+
+        return self._post_get_config_fingerprint(
+            response=response,
+            source=source,
+            scrapli_responses=[fingerprint_result],
+            result=self._parse_config_fingerprint(device_output=fingerprint_result.result),
+        )
+
     def load_config(self, config: str, replace: bool = False, **kwargs: Any) -> ScrapliCfgResponse:
         """
         Load configuration to a device
 
         Supported kwargs:
-            N/A
+            fast_load: True/False pipeline the config into the config session rather than
+                waiting for the prompt after each line, see `_send_config_fast_load`
 
         Args:
             config: string of the configuration to load
@@ -156,6 +198,8 @@ class ScrapliCfgEOS(ScrapliCfgPlatform, ScrapliCfgEOSBase):
         """
         scrapli_responses = []
         response = self._pre_load_config(config=config)
+
+        fast_load = kwargs.get("fast_load", False)
         (
             config,
             eager_config,
@@ -170,18 +214,25 @@ class ScrapliCfgEOS(ScrapliCfgPlatform, ScrapliCfgEOSBase):
         try:
             if replace:
                 # default the config session - we only need to do this if we are doing a REPLACE
-                rollback_clean_config_result = self.conn.send_config(
-                    config="rollback clean-config", privilege_level=self.config_session_name
-                )
+                with response.timed(phase="rollback"):
+                    rollback_clean_config_result = self.conn.send_config(
+                        config="rollback clean-config", privilege_level=self.config_session_name
+                    )
                 scrapli_responses.append(rollback_clean_config_result)
                 if rollback_clean_config_result.failed:
                     msg = "failed to load clean config in configuration session"
                     self.logger.critical(msg)
                     raise LoadConfigError(msg)
 
-            config_result = self.conn.send_config(
-                config=config, privilege_level=self.config_session_name
-            )
+            with response.timed(phase="transfer"):
+                if fast_load:
+                    config_result = self._send_config_fast_load(
+                        config=config, privilege_level=self.config_session_name
+                    )
+                else:
+                    config_result = self.conn.send_config(
+                        config=config, privilege_level=self.config_session_name
+                    )
             scrapli_responses.append(config_result)
             if config_result.failed:
                 msg = "failed to load the candidate config into the config session"
@@ -190,9 +241,10 @@ class ScrapliCfgEOS(ScrapliCfgPlatform, ScrapliCfgEOSBase):
 
             # eager cuz banners and such; perhaps if no banner/macro we can disable eager though....
             if eager_config:
-                eager_config_result = self.conn.send_config(
-                    config=eager_config, privilege_level=self.config_session_name, eager=True
-                )
+                with response.timed(phase="transfer"):
+                    eager_config_result = self.conn.send_config(
+                        config=eager_config, privilege_level=self.config_session_name, eager=True
+                    )
                 scrapli_responses.append(eager_config_result)
                 if eager_config_result.failed:
                     msg = "failed to load the candidate config into the config session"
@@ -224,23 +276,32 @@ class ScrapliCfgEOS(ScrapliCfgPlatform, ScrapliCfgEOSBase):
             source=source, session_or_config_file=bool(self.config_session_name)
         )
 
-        commit_results = self.conn.send_commands(
-            commands=[
-                f"configure session {self.config_session_name} commit",
-                "copy running-config startup-config",
-            ]
-        )
+        if self._commit_is_noop():
+            # the candidate matches the running config, discard it rather than commit (and save) it
+            abort_result = self.abort_config()
+            return self._post_commit_config(
+                response=response, scrapli_responses=[*abort_result.scrapli_responses]
+            )
+
+        with response.timed(phase="commit"):
+            commit_results = self.conn.send_commands(
+                commands=[
+                    f"configure session {self.config_session_name} commit",
+                    "copy running-config startup-config",
+                ]
+            )
         self._reset_config_session()
 
         return self._post_commit_config(response=response, scrapli_responses=[commit_results])
 
-    def diff_config(self, source: str = "running") -> ScrapliCfgDiffResponse:
+    def diff_config(self, source: str = "running", mode: str = "full") -> ScrapliCfgDiffResponse:
         scrapli_responses = []
         device_diff = ""
+        device_difflines: Optional[List[str]] = None
         source_config = ""
 
         diff_response = self._pre_diff_config(
-            source=source, session_or_config_file=bool(self.config_session_name)
+            source=source, session_or_config_file=bool(self.config_session_name), mode=mode
         )
 
         try:
@@ -255,18 +316,22 @@ class ScrapliCfgEOS(ScrapliCfgPlatform, ScrapliCfgEOSBase):
 
             device_diff = diff_result.result
 
-            source_config_result = self.get_config(source=source)
-            source_config = source_config_result.result
+            if mode == "device":
+                device_difflines = self._parse_device_diff(device_diff=device_diff)
 
-            if isinstance(source_config_result.scrapli_responses, MultiResponse):
-                # in this case this will always be a multiresponse or nothing (failure) but mypy
-                # doesnt know that, hence the isinstance check
-                scrapli_responses.extend(source_config_result.scrapli_responses)
+            if device_difflines is None:
+                source_config_result = self.get_config(source=source)
+                source_config = source_config_result.result
 
-            if source_config_result.failed:
-                msg = "failed fetching source config for diff comparison"
-                self.logger.critical(msg)
-                raise DiffConfigError(msg)
+                if isinstance(source_config_result.scrapli_responses, MultiResponse):
+                    # in this case this will always be a multiresponse or nothing (failure) but mypy
+                    # doesnt know that, hence the isinstance check
+                    scrapli_responses.extend(source_config_result.scrapli_responses)
+
+                if source_config_result.failed:
+                    msg = "failed fetching source config for diff comparison"
+                    self.logger.critical(msg)
+                    raise DiffConfigError(msg)
 
         except DiffConfigError:
             pass
@@ -277,4 +342,6 @@ class ScrapliCfgEOS(ScrapliCfgPlatform, ScrapliCfgEOSBase):
             source_config=self.clean_config(source_config),
             candidate_config=self.clean_config(self.candidate_config),
             device_diff=device_diff,
+            device_difflines=device_difflines,
+            config_parser=parse_indented_config,
         )
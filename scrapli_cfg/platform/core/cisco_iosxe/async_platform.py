@@ -1,18 +1,23 @@
 """scrapli_cfg.platform.core.cisco_iosxe.async_platform"""
 
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, List, Optional, Union
 
 from scrapli.driver import AsyncNetworkDriver
 from scrapli.response import Response
+from scrapli_cfg.cache import ConfigCache
+from scrapli_cfg.config_tree import parse_indented_config
 from scrapli_cfg.diff import ScrapliCfgDiffResponse
 from scrapli_cfg.exceptions import DiffConfigError, FailedToDetermineDeviceState
+from scrapli_cfg.facts import FactsCache
 from scrapli_cfg.platform.base.async_platform import AsyncScrapliCfgPlatform
 from scrapli_cfg.platform.core.cisco_iosxe.base_platform import (
     CONFIG_SOURCES,
+    PULL_FAILED_WHEN_CONTAINS,
     FilePromptMode,
     ScrapliCfgIOSXEBase,
 )
 from scrapli_cfg.response import ScrapliCfgResponse
+from scrapli_cfg.transfer import AsyncFileTransfer, PullTransfer
 
 
 class AsyncScrapliCfgIOSXE(AsyncScrapliCfgPlatform, ScrapliCfgIOSXEBase):
@@ -26,6 +31,10 @@ class AsyncScrapliCfgIOSXE(AsyncScrapliCfgPlatform, ScrapliCfgIOSXEBase):
         cleanup_post_commit: bool = True,
         dedicated_connection: bool = False,
         ignore_version: bool = False,
+        config_cache: Optional[ConfigCache] = None,
+        facts_cache: Optional[FactsCache] = None,
+        memoize_facts: bool = False,
+        transfer: Optional[Union[AsyncFileTransfer, PullTransfer]] = None,
     ) -> None:
         if config_sources is None:
             config_sources = CONFIG_SOURCES
@@ -36,8 +45,14 @@ class AsyncScrapliCfgIOSXE(AsyncScrapliCfgPlatform, ScrapliCfgIOSXEBase):
             on_prepare=on_prepare,
             dedicated_connection=dedicated_connection,
             ignore_version=ignore_version,
+            config_cache=config_cache,
+            facts_cache=facts_cache,
         )
 
+        self.memoize_facts = memoize_facts
+
+        self.transfer = transfer
+
         self.filesystem = filesystem
         self._filesystem_space_available_buffer_perc = 10
 
@@ -61,13 +76,24 @@ class AsyncScrapliCfgIOSXE(AsyncScrapliCfgPlatform, ScrapliCfgIOSXEBase):
             FailedToDetermineDeviceState: if unable to fetch file filesystem bytes available
 
         """
+        memoized_bytes_available = self._get_fact(fact="filesystem_space_available")
+        if memoized_bytes_available is not None:
+            return int(memoized_bytes_available)
+
         filesystem_size_result = await self.conn.send_command(
             command=f"dir {self.filesystem} | i bytes"
         )
         if filesystem_size_result.failed:
             raise FailedToDetermineDeviceState("failed to determine space available on filesystem")
 
-        return self._post_get_filesystem_space_available(output=filesystem_size_result.result)
+        filesystem_bytes_available = self._post_get_filesystem_space_available(
+            output=filesystem_size_result.result
+        )
+        self._set_fact(
+            fact="filesystem_space_available", value=str(filesystem_bytes_available), persist=False
+        )
+
+        return filesystem_bytes_available
 
     async def _determine_file_prompt_mode(self) -> FilePromptMode:
         """
@@ -83,11 +109,41 @@ class AsyncScrapliCfgIOSXE(AsyncScrapliCfgPlatform, ScrapliCfgIOSXEBase):
             FailedToDetermineDeviceState: if unable to fetch file prompt mode
 
         """
+        cached_file_prompt_mode = self._get_fact(fact="file_prompt_mode")
+        if cached_file_prompt_mode is not None:
+            return FilePromptMode(cached_file_prompt_mode)
+
         file_prompt_mode_result = await self.conn.send_command(command="show run | i file prompt")
         if file_prompt_mode_result.failed:
             raise FailedToDetermineDeviceState("failed to determine file prompt mode")
 
-        return self._post_determine_file_prompt_mode(output=file_prompt_mode_result.result)
+        file_prompt_mode = self._post_determine_file_prompt_mode(
+            output=file_prompt_mode_result.result
+        )
+        self._set_fact(fact="file_prompt_mode", value=file_prompt_mode.value)
+
+        return file_prompt_mode
+
+    async def _pull_candidate_config(self, url: str) -> Response:
+        """
+        Have the device copy the candidate config file from the file server
+
+        Args:
+            url: url of the candidate config file
+
+        Returns:
+            Response: response from copying the candidate config
+
+        Raises:
+            N/A
+
+        """
+        file_prompt_mode = await self._determine_file_prompt_mode()
+        pull_result = await self.conn.send_interactive(
+            interact_events=self._get_pull_events(url=url, file_prompt_mode=file_prompt_mode),
+            failed_when_contains=PULL_FAILED_WHEN_CONTAINS,
+        )
+        return pull_result
 
     async def _delete_candidate_config(self) -> Response:
         """
@@ -103,7 +159,8 @@ class AsyncScrapliCfgIOSXE(AsyncScrapliCfgPlatform, ScrapliCfgIOSXEBase):
             N/A
 
         """
-        # have to check again because the candidate config may have changed this!
+        # have to check again because the candidate config may have changed this! (a memoized
+        # file prompt mode is invalidated by `commit_config` if that is possible)
         file_prompt_mode = await self._determine_file_prompt_mode()
         if file_prompt_mode in (FilePromptMode.ALERT, FilePromptMode.NOISY):
             delete_events = [
@@ -123,6 +180,9 @@ class AsyncScrapliCfgIOSXE(AsyncScrapliCfgPlatform, ScrapliCfgIOSXEBase):
                 ("", ""),
             ]
         delete_result = await self.conn.send_interactive(interact_events=delete_events)
+        self._adjust_filesystem_space_available(
+            delta=len(self.candidate_config), failed=delete_result.failed
+        )
         return delete_result
 
     async def get_version(self) -> ScrapliCfgResponse:
@@ -136,8 +196,28 @@ class AsyncScrapliCfgIOSXE(AsyncScrapliCfgPlatform, ScrapliCfgIOSXEBase):
             result=self._parse_version(device_output=version_result.result),
         )
 
-    async def get_config(self, source: str = "running") -> ScrapliCfgResponse:
-        response = self._pre_get_config(source=source)
+    async def get_config(
+        self, source: str = "running", sections: Optional[List[str]] = None
+    ) -> ScrapliCfgResponse:
+        response = self._pre_get_config(source=source, sections=sections)
+
+        if sections:
+            section_commands = [
+                self._get_config_command(source=source, section=section) for section in sections
+            ]
+            sections_result = await self.conn.send_commands(commands=section_commands)
+
+            return self._post_get_config(
+                response=response,
+                source=source,
+                scrapli_responses=[sections_result],
+                result="\n".join(section_result.result for section_result in sections_result),
+                sections=sections,
+            )
+
+        cached_response = self._get_cached_config(source=source)
+        if cached_response is not None:
+            return cached_response
 
         config_result = await self.conn.send_command(
             command=self._get_config_command(source=source)
@@ -150,6 +230,20 @@ class AsyncScrapliCfgIOSXE(AsyncScrapliCfgPlatform, ScrapliCfgIOSXEBase):
             result=config_result.result,
         )
 
+    async def get_config_fingerprint(self, source: str = "running") -> ScrapliCfgResponse:
+        response = self._pre_get_config_fingerprint(source=source)
+
+        fingerprint_result = await self.conn.send_command(
+            command=self._get_config_fingerprint_command(source=source)
+        )
+
+        return self._post_get_config_fingerprint(
+            response=response,
+            source=source,
+            scrapli_responses=[fingerprint_result],
+            result=self._parse_config_fingerprint(device_output=fingerprint_result.result),
+        )
+
     async def load_config(
         self, config: str, replace: bool = False, **kwargs: Any
     ) -> ScrapliCfgResponse:
@@ -177,23 +271,48 @@ class AsyncScrapliCfgIOSXE(AsyncScrapliCfgPlatform, ScrapliCfgIOSXEBase):
 
         config = self._prepare_load_config(config=config, replace=replace)
 
-        filesystem_bytes_available = await self._get_filesystem_space_available()
-        self._space_available(filesystem_bytes_available=filesystem_bytes_available)
-
-        # when in tcl command mode or whatever it is, tcl wants \r for return char, so stash the
-        # original return char and sub in \r for a bit
-        original_return_char = self.conn.comms_return_char
-        tcl_comms_return_char = "\r"
-
-        # pop into tclsh before swapping the return char just to be safe -- \r or \n should both be
-        # fine for up to here but who knows... :)
-        await self.conn.acquire_priv(desired_priv="tclsh")
-        self.conn.comms_return_char = tcl_comms_return_char
-        config_result = await self.conn.send_config(config=config, privilege_level="tclsh")
-
-        # reset the return char to the "normal" one and drop into whatever is the "default" priv
-        await self.conn.acquire_priv(desired_priv=self.conn.default_desired_privilege_level)
-        self.conn.comms_return_char = original_return_char
+        with response.timed(phase="space_check"):
+            filesystem_bytes_available = await self._get_filesystem_space_available()
+            self._space_available(filesystem_bytes_available=filesystem_bytes_available)
+
+        if isinstance(self.transfer, PullTransfer):
+            url = self.transfer.url(config=f"{self.candidate_config}\n")
+            try:
+                with response.timed(phase="transfer"):
+                    config_result = await self._pull_candidate_config(url=url)
+            finally:
+                # copy finished or failed, either way the device is done w/ the file
+                self.transfer.discard(url=url)
+        elif self.transfer is not None:
+            with response.timed(phase="transfer"):
+                config_result = await self.transfer.put(
+                    conn=self.conn,
+                    config=f"{self.candidate_config}\n",
+                    remote_path=f"{self.filesystem}{self.candidate_config_filename}",
+                )
+        else:
+            # when in tcl command mode or whatever it is, tcl wants \r for return char, so stash
+            # the original return char and sub in \r for a bit
+            original_return_char = self.conn.comms_return_char
+            tcl_comms_return_char = "\r"
+
+            # pop into tclsh before swapping the return char just to be safe -- \r or \n should
+            # both be fine for up to here but who knows... :)
+            with response.timed(phase="tclsh"):
+                await self.conn.acquire_priv(desired_priv="tclsh")
+            self.conn.comms_return_char = tcl_comms_return_char
+            with response.timed(phase="transfer"):
+                config_result = await self.conn.send_config(config=config, privilege_level="tclsh")
+
+            # reset the return char to the "normal" one and drop into whatever is the "default"
+            # priv
+            with response.timed(phase="priv"):
+                await self.conn.acquire_priv(desired_priv=self.conn.default_desired_privilege_level)
+            self.conn.comms_return_char = original_return_char
+
+        self._adjust_filesystem_space_available(
+            delta=-len(self.candidate_config), failed=config_result.failed
+        )
 
         return self._post_load_config(
             response=response,
@@ -224,7 +343,10 @@ class AsyncScrapliCfgIOSXE(AsyncScrapliCfgPlatform, ScrapliCfgIOSXEBase):
             N/A
 
         """
-        # we always re-check file prompt mode because it could have changed!
+        self._invalidate_config_cache(source="startup")
+
+        # we always re-check file prompt mode because it could have changed! (a memoized file
+        # prompt mode is invalidated by `commit_config` if that is possible)
         file_prompt_mode = await self._determine_file_prompt_mode()
 
         if file_prompt_mode == FilePromptMode.ALERT:
@@ -307,23 +429,36 @@ class AsyncScrapliCfgIOSXE(AsyncScrapliCfgPlatform, ScrapliCfgIOSXEBase):
             source=source, session_or_config_file=bool(self.candidate_config_filename)
         )
 
+        if self._commit_is_noop():
+            # the candidate matches the running config, discard it rather than commit (and save) it
+            abort_result = await self.abort_config()
+            return self._post_commit_config(
+                response=response, scrapli_responses=[*abort_result.scrapli_responses]
+            )
+
         file_prompt_mode = await self._determine_file_prompt_mode()
 
-        if self._replace is True:
-            replace_command = (
-                f"configure replace {self.filesystem}{self.candidate_config_filename} force"
-            )
-            commit_result = await self.conn.send_command(command=replace_command)
-        else:
-            commit_result = await self._commit_config_merge(file_prompt_mode=file_prompt_mode)
+        with response.timed(phase="commit"):
+            if self._replace is True:
+                replace_command = (
+                    f"configure replace {self.filesystem}{self.candidate_config_filename} force"
+                )
+                commit_result = await self.conn.send_command(command=replace_command)
+            else:
+                commit_result = await self._commit_config_merge(file_prompt_mode=file_prompt_mode)
 
         scrapli_responses.append(commit_result)
 
-        save_config_result = await self.save_config()
+        if self._file_prompt_mode_may_change():
+            self._invalidate_facts(facts=["file_prompt_mode"])
+
+        with response.timed(phase="save"):
+            save_config_result = await self.save_config()
         scrapli_responses.append(save_config_result)
 
         if self.cleanup_post_commit:
-            cleanup_result = await self._delete_candidate_config()
+            with response.timed(phase="cleanup"):
+                cleanup_result = await self._delete_candidate_config()
             scrapli_responses.append(cleanup_result)
 
         self._reset_config_session()
@@ -333,13 +468,16 @@ class AsyncScrapliCfgIOSXE(AsyncScrapliCfgPlatform, ScrapliCfgIOSXEBase):
             scrapli_responses=scrapli_responses,
         )
 
-    async def diff_config(self, source: str = "running") -> ScrapliCfgDiffResponse:
+    async def diff_config(
+        self, source: str = "running", mode: str = "full"
+    ) -> ScrapliCfgDiffResponse:
         scrapli_responses = []
         device_diff = ""
+        device_difflines: Optional[List[str]] = None
         source_config = ""
 
         diff_response = self._pre_diff_config(
-            source=source, session_or_config_file=bool(self.candidate_config_filename)
+            source=source, session_or_config_file=bool(self.candidate_config_filename), mode=mode
         )
 
         try:
@@ -354,24 +492,30 @@ class AsyncScrapliCfgIOSXE(AsyncScrapliCfgPlatform, ScrapliCfgIOSXEBase):
 
             device_diff = diff_result.result
 
-            source_config_result = await self.get_config(source=source)
-            source_config = source_config_result.result
+            if mode == "device":
+                device_difflines = self._parse_device_diff(device_diff=device_diff)
 
-            if isinstance(source_config_result.scrapli_responses, list):
-                scrapli_responses.extend(source_config_result.scrapli_responses)
+            if device_difflines is None:
+                source_config_result = await self.get_config(source=source)
+                source_config = source_config_result.result
 
-            if source_config_result.failed:
-                msg = "failed fetching source config for diff comparison"
-                self.logger.critical(msg)
-                raise DiffConfigError(msg)
+                if isinstance(source_config_result.scrapli_responses, list):
+                    scrapli_responses.extend(source_config_result.scrapli_responses)
+
+                if source_config_result.failed:
+                    msg = "failed fetching source config for diff comparison"
+                    self.logger.critical(msg)
+                    raise DiffConfigError(msg)
 
         except DiffConfigError:
             pass
 
-        return self._post_diff_config(
+        return await self._post_diff_config_offloaded(
             diff_response=diff_response,
             scrapli_responses=scrapli_responses,
-            source_config=self.clean_config(source_config),
-            candidate_config=self.clean_config(self.candidate_config),
+            source_config=source_config,
+            candidate_config=self.candidate_config,
             device_diff=device_diff,
+            device_difflines=device_difflines,
+            config_parser=parse_indented_config,
         )
@@ -4,12 +4,15 @@ import re
 from datetime import datetime
 from enum import Enum
 from logging import Logger, LoggerAdapter
-from typing import TYPE_CHECKING, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
+from scrapli_cfg.config_tree import parse_indented_config, render_indented_remediation
 from scrapli_cfg.exceptions import FailedToFetchSpaceAvailable, InsufficientSpaceAvailable
 from scrapli_cfg.helper import strip_blank_lines
 from scrapli_cfg.platform.core.cisco_iosxe.patterns import (
     BYTES_FREE,
+    CONFIG_FINGERPRINT_PATTERN,
+    DEVICE_DIFF_ERROR_PATTERN,
     FILE_PROMPT_MODE,
     OUTPUT_HEADER_PATTERN,
     VERSION_PATTERN,
@@ -26,6 +29,9 @@ CONFIG_SOURCES = [
     "startup",
 ]
 
+# output indicating the device failed to pull the candidate config file from the file server
+PULL_FAILED_WHEN_CONTAINS = ["%Error"]
+
 
 class FilePromptMode(Enum):
     """Enum representing file prompt modes"""
@@ -119,6 +125,22 @@ class ScrapliCfgIOSXEBase:
             return FilePromptMode.NOISY
         return FilePromptMode.QUIET
 
+    def _file_prompt_mode_may_change(self) -> bool:
+        """
+        Determine if committing the candidate config may change the device file prompt mode
+
+        Args:
+            N/A
+
+        Returns:
+            bool: True if the candidate config is a replace or touches the file prompt setting
+
+        Raises:
+            N/A
+
+        """
+        return self._replace or "file prompt" in self.candidate_config
+
     @staticmethod
     def _parse_version(device_output: str) -> str:
         """
@@ -142,6 +164,49 @@ class ScrapliCfgIOSXEBase:
         version_string = version_string_search.group(0) or ""
         return version_string
 
+    @staticmethod
+    def _get_config_fingerprint_command(source: str) -> str:
+        """
+        Return command to use to fetch a fingerprint of the provided config source
+
+        The fingerprint is the on-box md5 of the config file, so the config never leaves the device.
+
+        Args:
+            source: name of the config source, generally running|startup
+
+        Returns:
+            str: command to use to fetch the config fingerprint
+
+        Raises:
+            N/A
+
+        """
+        if source == "running":
+            return "verify /md5 system:running-config"
+        return "verify /md5 nvram:startup-config"
+
+    @staticmethod
+    def _parse_config_fingerprint(device_output: str) -> str:
+        """
+        Parse config fingerprint out of device output
+
+        Args:
+            device_output: output from the config fingerprint command
+
+        Returns:
+            str: config fingerprint, or an empty string if no fingerprint could be found
+
+        Raises:
+            N/A
+
+        """
+        fingerprint_search = re.search(pattern=CONFIG_FINGERPRINT_PATTERN, string=device_output)
+
+        if not fingerprint_search:
+            return ""
+
+        return fingerprint_search.group("fingerprint").strip()
+
     def clean_config(self, config: str) -> str:
         """
         Clean a configuration file of unwanted lines
@@ -164,6 +229,26 @@ class ScrapliCfgIOSXEBase:
             config=re.sub(pattern=OUTPUT_HEADER_PATTERN, string=config, repl="", count=1)
         )
 
+    def _render_remediation_config(self, source_config: str, candidate_config: str) -> str:
+        """
+        Render the minimal config that merged into the source config results in the candidate
+
+        Args:
+            source_config: source config
+            candidate_config: candidate config
+
+        Returns:
+            str: remediation config, lines no longer in the candidate are negated w/ "no"
+
+        Raises:
+            N/A
+
+        """
+        return render_indented_remediation(
+            source=parse_indented_config(self.clean_config(source_config)),
+            candidate=parse_indented_config(self.clean_config(candidate_config)),
+        )
+
     def _reset_config_session(self) -> None:
         """
         Reset config session info
@@ -186,12 +271,14 @@ class ScrapliCfgIOSXEBase:
         self.candidate_config_filename = ""
 
     @staticmethod
-    def _get_config_command(source: str) -> str:
+    def _get_config_command(source: str, section: str = "") -> str:
         """
         Return command to use to get config based on the provided source
 
         Args:
             source: name of the config source, generally running|startup
+            section: optional section of the config to fetch, i.e. "interface Management1", the
+                section filtering is done on the device so only the section is sent back
 
         Returns:
             str: command to use to fetch the requested config
@@ -200,9 +287,10 @@ class ScrapliCfgIOSXEBase:
             N/A
 
         """
-        if source == "running":
-            return "show running-config"
-        return "show startup-config"
+        command = "show running-config" if source == "running" else "show startup-config"
+        if section:
+            command = f"{command} | section {section}"
+        return command
 
     def _get_diff_command(self, source: str) -> str:
         """
@@ -228,6 +316,74 @@ class ScrapliCfgIOSXEBase:
             f"{self.candidate_config_filename} ignorecase"
         )
 
+    def _parse_device_diff(self, device_diff: str) -> Optional[List[str]]:
+        """
+        Parse the device generated diff into ndiff style diff lines
+
+        Replace diffs (archive config differences) prefix added/removed lines w/ "+"/"-" after the
+        indentation and include parent lines as context; merge diffs (archive config
+        incremental-diffs) are simply the list of commands that will be applied, so are all
+        additions.
+
+        Args:
+            device_diff: output of the device diff command
+
+        Returns:
+            list: ndiff style diff lines, or None if the device diff could not be parsed
+
+        Raises:
+            N/A
+
+        """
+        if re.search(pattern=DEVICE_DIFF_ERROR_PATTERN, string=device_diff):
+            self.logger.warning("device diff contains errors, cannot parse device diff")
+            return None
+
+        difflines = []
+        for line in device_diff.splitlines():
+            stripped_line = line.lstrip()
+            if not stripped_line or stripped_line.startswith("!"):
+                continue
+
+            indent = line[: len(line) - len(stripped_line)]
+            if self._replace:
+                if stripped_line[0] in ("+", "-"):
+                    difflines.append(f"{stripped_line[0]} {indent}{stripped_line[1:]}\n")
+                else:
+                    difflines.append(f"  {line}\n")
+            elif stripped_line != "end":
+                difflines.append(f"+ {line}\n")
+
+        return difflines
+
+    def _get_pull_events(self, url: str, file_prompt_mode: FilePromptMode) -> List[Tuple[str, str]]:
+        """
+        Build the interact events to copy the candidate config file from a file server
+
+        Args:
+            url: url of the candidate config file
+            file_prompt_mode: device file prompt mode
+
+        Returns:
+            list: interact events for `send_interactive`
+
+        Raises:
+            N/A
+
+        """
+        pull_command = f"copy {url} {self.filesystem}{self.candidate_config_filename}"
+
+        if file_prompt_mode == FilePromptMode.ALERT:
+            return [(pull_command, "Destination filename"), ("", "")]
+        if file_prompt_mode == FilePromptMode.NOISY:
+            return [
+                (pull_command, "Address or name of remote host"),
+                ("", "Source filename"),
+                ("", "Destination filename"),
+                ("", ""),
+            ]
+        return [(pull_command, "")]
+
     def _prepare_config_payloads(self, config: str) -> str:
         """
         Prepare a configuration so it can be nicely sent to the device via scrapli
@@ -10,3 +10,5 @@ OUTPUT_HEADER_PATTERN = re.compile(
     pattern=r".*(?=(version \d+\.\d+))",
     flags=re.I | re.S,
 )
+DEVICE_DIFF_ERROR_PATTERN = re.compile(pattern=r"^%\s?error", flags=re.M | re.I)
+CONFIG_FINGERPRINT_PATTERN = re.compile(pattern=r"=\s*(?P<fingerprint>[a-f0-9]{32})\b", flags=re.I)
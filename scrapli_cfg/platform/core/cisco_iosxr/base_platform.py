@@ -2,11 +2,14 @@
 
 import re
 from logging import Logger, LoggerAdapter
-from typing import TYPE_CHECKING, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
+from scrapli_cfg.config_tree import parse_indented_config, render_indented_remediation
 from scrapli_cfg.helper import strip_blank_lines
 from scrapli_cfg.platform.core.cisco_iosxr.patterns import (
     BANNER_PATTERN,
+    CONFIG_FINGERPRINT_PATTERN,
+    DEVICE_DIFF_ERROR_PATTERN,
     END_PATTERN,
     OUTPUT_HEADER_PATTERN,
     VERSION_PATTERN,
@@ -53,6 +56,70 @@ class ScrapliCfgIOSXRBase:
         version_string = version_string_search.group(0) or ""
         return version_string
 
+    @staticmethod
+    def _get_config_command(source: str, section: str = "") -> str:
+        """
+        Return command to use to get config based on the provided source
+
+        Args:
+            source: name of the config source, only running is supported
+            section: optional section of the config to fetch, i.e. "interface MgmtEth0/RP0/CPU0/0",
+                the section filtering is done on the device so only the section is sent back
+
+        Returns:
+            str: command to use to fetch the requested config
+
+        Raises:
+            N/A
+
+        """
+        _ = source
+        if section:
+            return f"show running-config {section}"
+        return "show running-config"
+
+    @staticmethod
+    def _get_config_fingerprint_command(source: str) -> str:
+        """
+        Return command to use to fetch a fingerprint of the provided config source
+
+        The fingerprint is the id of the most recent commit.
+
+        Args:
+            source: name of the config source, generally running|startup
+
+        Returns:
+            str: command to use to fetch the config fingerprint
+
+        Raises:
+            N/A
+
+        """
+        _ = source
+        return "show configuration commit list 1"
+
+    @staticmethod
+    def _parse_config_fingerprint(device_output: str) -> str:
+        """
+        Parse config fingerprint out of device output
+
+        Args:
+            device_output: output from the config fingerprint command
+
+        Returns:
+            str: config fingerprint, or an empty string if no fingerprint could be found
+
+        Raises:
+            N/A
+
+        """
+        fingerprint_search = re.search(pattern=CONFIG_FINGERPRINT_PATTERN, string=device_output)
+
+        if not fingerprint_search:
+            return ""
+
+        return fingerprint_search.group("fingerprint").strip()
+
     @staticmethod
     def _prepare_config_payloads(config: str) -> Tuple[str, str]:
         """
@@ -158,6 +225,45 @@ class ScrapliCfgIOSXRBase:
             return "show configuration changes diff"
         return "show commit changes diff"
 
+    def _parse_device_diff(self, device_diff: str) -> Optional[List[str]]:
+        """
+        Parse the device generated diff into ndiff style diff lines
+
+        The first column of iosxr diffs is a marker -- "+" for added lines, "-" for removed lines
+        and "#" or " " for (unchanged) context lines, the config line follows after two spaces.
+
+        Args:
+            device_diff: output of the device diff command
+
+        Returns:
+            list: ndiff style diff lines, or None if the device diff could not be parsed
+
+        Raises:
+            N/A
+
+        """
+        if re.search(pattern=DEVICE_DIFF_ERROR_PATTERN, string=device_diff):
+            self.logger.warning("device diff contains errors, cannot parse device diff")
+            return None
+
+        device_diff = re.sub(pattern=OUTPUT_HEADER_PATTERN, string=device_diff, repl="")
+
+        difflines = []
+        for line in device_diff.splitlines():
+            if not line.strip() or line.strip() == "end":
+                continue
+
+            marker, config_line = line[0], line[1:]
+            if config_line.startswith("  "):
+                config_line = config_line[2:]
+
+            if marker in ("+", "-"):
+                difflines.append(f"{marker} {config_line}\n")
+            else:
+                difflines.append(f"  {config_line}\n")
+
+        return difflines
+
     def clean_config(self, config: str) -> str:
         """
         Clean a configuration file of unwanted lines
@@ -180,3 +286,23 @@ class ScrapliCfgIOSXRBase:
         return strip_blank_lines(
             config=re.sub(pattern=OUTPUT_HEADER_PATTERN, string=config, repl="")
         )
+
+    def _render_remediation_config(self, source_config: str, candidate_config: str) -> str:
+        """
+        Render the minimal config that merged into the source config results in the candidate
+
+        Args:
+            source_config: source config
+            candidate_config: candidate config
+
+        Returns:
+            str: remediation config, lines no longer in the candidate are negated w/ "no"
+
+        Raises:
+            N/A
+
+        """
+        return render_indented_remediation(
+            source=parse_indented_config(self.clean_config(source_config)),
+            candidate=parse_indented_config(self.clean_config(candidate_config)),
+        )
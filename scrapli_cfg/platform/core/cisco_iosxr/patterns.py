@@ -40,3 +40,5 @@ ETHERNET_INTERFACES = re.compile(
 MANAGEMENT_ONE_INTERFACE = re.compile(
     pattern=r"^^interface mgmteth(?:[a-z0-9\/]+)(?:\n^\s.*$)*\n!", flags=re.I | re.M
 )
+DEVICE_DIFF_ERROR_PATTERN = re.compile(pattern=r"^%\s?", flags=re.M)
+CONFIG_FINGERPRINT_PATTERN = re.compile(pattern=r"^1\s+(?P<fingerprint>\S+)", flags=re.M)
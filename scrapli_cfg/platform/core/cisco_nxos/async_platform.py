@@ -4,11 +4,19 @@ from typing import Any, Callable, List, Optional, Union
 
 from scrapli.driver.core import AsyncNXOSDriver
 from scrapli.response import MultiResponse, Response
+from scrapli_cfg.cache import ConfigCache
+from scrapli_cfg.config_tree import parse_indented_config
 from scrapli_cfg.diff import ScrapliCfgDiffResponse
 from scrapli_cfg.exceptions import DiffConfigError, FailedToDetermineDeviceState
+from scrapli_cfg.facts import FactsCache
 from scrapli_cfg.platform.base.async_platform import AsyncScrapliCfgPlatform
-from scrapli_cfg.platform.core.cisco_nxos.base_platform import CONFIG_SOURCES, ScrapliCfgNXOSBase
+from scrapli_cfg.platform.core.cisco_nxos.base_platform import (
+    CONFIG_SOURCES,
+    PULL_FAILED_WHEN_CONTAINS,
+    ScrapliCfgNXOSBase,
+)
 from scrapli_cfg.response import ScrapliCfgResponse
+from scrapli_cfg.transfer import AsyncFileTransfer, PullTransfer
 
 
 class AsyncScrapliCfgNXOS(AsyncScrapliCfgPlatform, ScrapliCfgNXOSBase):
@@ -22,6 +30,11 @@ class AsyncScrapliCfgNXOS(AsyncScrapliCfgPlatform, ScrapliCfgNXOSBase):
         cleanup_post_commit: bool = True,
         dedicated_connection: bool = False,
         ignore_version: bool = False,
+        config_cache: Optional[ConfigCache] = None,
+        facts_cache: Optional[FactsCache] = None,
+        memoize_facts: bool = False,
+        transfer: Optional[Union[AsyncFileTransfer, PullTransfer]] = None,
+        chunk_payloads: bool = False,
     ) -> None:
         if config_sources is None:
             config_sources = CONFIG_SOURCES
@@ -32,8 +45,15 @@ class AsyncScrapliCfgNXOS(AsyncScrapliCfgPlatform, ScrapliCfgNXOSBase):
             on_prepare=on_prepare,
             dedicated_connection=dedicated_connection,
             ignore_version=ignore_version,
+            config_cache=config_cache,
+            facts_cache=facts_cache,
         )
 
+        self.memoize_facts = memoize_facts
+
+        self.transfer = transfer
+        self.chunk_payloads = chunk_payloads
+
         self.filesystem = filesystem
         self._filesystem_space_available_buffer_perc = 10
 
@@ -57,13 +77,45 @@ class AsyncScrapliCfgNXOS(AsyncScrapliCfgPlatform, ScrapliCfgNXOSBase):
             FailedToDetermineDeviceState: if unable to fetch file filesystem bytes available
 
         """
+        memoized_bytes_available = self._get_fact(fact="filesystem_space_available")
+        if memoized_bytes_available is not None:
+            return int(memoized_bytes_available)
+
         filesystem_size_result = await self.conn.send_command(
             command=f"dir {self.filesystem} | i 'bytes free'"
         )
         if filesystem_size_result.failed:
             raise FailedToDetermineDeviceState("failed to determine space available on filesystem")
 
-        return self._post_get_filesystem_space_available(output=filesystem_size_result.result)
+        filesystem_bytes_available = self._post_get_filesystem_space_available(
+            output=filesystem_size_result.result
+        )
+        self._set_fact(
+            fact="filesystem_space_available", value=str(filesystem_bytes_available), persist=False
+        )
+
+        return filesystem_bytes_available
+
+    async def _pull_candidate_config(self, url: str) -> Response:
+        """
+        Have the device copy the candidate config file from the file server
+
+        Args:
+            url: url of the candidate config file
+
+        Returns:
+            Response: response from copying the candidate config
+
+        Raises:
+            N/A
+
+        """
+        pull_vrf = self.transfer.vrf if isinstance(self.transfer, PullTransfer) else ""
+        pull_result = await self.conn.send_command(
+            command=self._get_pull_command(url=url, vrf=pull_vrf),
+            failed_when_contains=PULL_FAILED_WHEN_CONTAINS,
+        )
+        return pull_result
 
     async def _delete_candidate_config(self) -> MultiResponse:
         """
@@ -84,6 +136,9 @@ class AsyncScrapliCfgNXOS(AsyncScrapliCfgPlatform, ScrapliCfgNXOSBase):
             f"delete {self.filesystem}{self.candidate_config_filename}",
         ]
         delete_result = await self.conn.send_commands(commands=delete_commands)
+        self._adjust_filesystem_space_available(
+            delta=len(self.candidate_config), failed=delete_result.failed
+        )
         return delete_result
 
     async def get_checkpoint(self) -> ScrapliCfgResponse:
@@ -115,6 +170,7 @@ class AsyncScrapliCfgNXOS(AsyncScrapliCfgPlatform, ScrapliCfgNXOSBase):
             source="running",
             scrapli_responses=[checkpoint_results],
             result=checkpoint,
+            cache=False,
         )
 
     async def get_version(self) -> ScrapliCfgResponse:
@@ -128,8 +184,28 @@ class AsyncScrapliCfgNXOS(AsyncScrapliCfgPlatform, ScrapliCfgNXOSBase):
             result=self._parse_version(device_output=version_result.result),
         )
 
-    async def get_config(self, source: str = "running") -> ScrapliCfgResponse:
-        response = self._pre_get_config(source=source)
+    async def get_config(
+        self, source: str = "running", sections: Optional[List[str]] = None
+    ) -> ScrapliCfgResponse:
+        response = self._pre_get_config(source=source, sections=sections)
+
+        if sections:
+            section_commands = [
+                self._get_config_command(source=source, section=section) for section in sections
+            ]
+            sections_result = await self.conn.send_commands(commands=section_commands)
+
+            return self._post_get_config(
+                response=response,
+                source=source,
+                scrapli_responses=[sections_result],
+                result="\n".join(section_result.result for section_result in sections_result),
+                sections=sections,
+            )
+
+        cached_response = self._get_cached_config(source=source)
+        if cached_response is not None:
+            return cached_response
 
         config_result = await self.conn.send_command(
             command=self._get_config_command(source=source)
@@ -142,6 +218,20 @@ class AsyncScrapliCfgNXOS(AsyncScrapliCfgPlatform, ScrapliCfgNXOSBase):
             result=config_result.result,
         )
 
+    async def get_config_fingerprint(self, source: str = "running") -> ScrapliCfgResponse:
+        response = self._pre_get_config_fingerprint(source=source)
+
+        fingerprint_result = await self.conn.send_command(
+            command=self._get_config_fingerprint_command(source=source)
+        )
+
+        return self._post_get_config_fingerprint(
+            response=response,
+            source=source,
+            scrapli_responses=[fingerprint_result],
+            result=self._parse_config_fingerprint(device_output=fingerprint_result.result),
+        )
+
     async def load_config(
         self, config: str, replace: bool = False, **kwargs: Any
     ) -> ScrapliCfgResponse:
@@ -169,12 +259,36 @@ class AsyncScrapliCfgNXOS(AsyncScrapliCfgPlatform, ScrapliCfgNXOSBase):
 
         config = self._prepare_load_config(config=config, replace=replace)
 
-        filesystem_bytes_available = await self._get_filesystem_space_available()
-        self._space_available(filesystem_bytes_available=filesystem_bytes_available)
-
-        await self.conn.acquire_priv(desired_priv="tclsh")
-        config_result = await self.conn.send_config(config=config, privilege_level="tclsh")
-        await self.conn.acquire_priv(desired_priv=self.conn.default_desired_privilege_level)
+        with response.timed(phase="space_check"):
+            filesystem_bytes_available = await self._get_filesystem_space_available()
+            self._space_available(filesystem_bytes_available=filesystem_bytes_available)
+
+        if isinstance(self.transfer, PullTransfer):
+            url = self.transfer.url(config=f"{self.candidate_config}\n")
+            try:
+                with response.timed(phase="transfer"):
+                    config_result = await self._pull_candidate_config(url=url)
+            finally:
+                # copy finished or failed, either way the device is done w/ the file
+                self.transfer.discard(url=url)
+        elif self.transfer is not None:
+            with response.timed(phase="transfer"):
+                config_result = await self.transfer.put(
+                    conn=self.conn,
+                    config=f"{self.candidate_config}\n",
+                    remote_path=f"{self.filesystem}{self.candidate_config_filename}",
+                )
+        else:
+            with response.timed(phase="tclsh"):
+                await self.conn.acquire_priv(desired_priv="tclsh")
+            with response.timed(phase="transfer"):
+                config_result = await self.conn.send_config(config=config, privilege_level="tclsh")
+            with response.timed(phase="priv"):
+                await self.conn.acquire_priv(desired_priv=self.conn.default_desired_privilege_level)
+
+        self._adjust_filesystem_space_available(
+            delta=-len(self.candidate_config), failed=config_result.failed
+        )
 
         return self._post_load_config(
             response=response,
@@ -197,24 +311,37 @@ class AsyncScrapliCfgNXOS(AsyncScrapliCfgPlatform, ScrapliCfgNXOSBase):
             source=source, session_or_config_file=bool(self.candidate_config_filename)
         )
 
-        if self._replace is True:
-            replace_command = (
-                f"rollback running-config file {self.filesystem}{self.candidate_config_filename}"
+        if self._commit_is_noop():
+            # the candidate matches the running config, discard it rather than commit (and save) it
+            abort_result = await self.abort_config()
+            return self._post_commit_config(
+                response=response, scrapli_responses=[*abort_result.scrapli_responses]
             )
-            commit_result = await self.conn.send_command(command=replace_command)
-        else:
-            merge_command = f"copy {self.filesystem}{self.candidate_config_filename} running-config"
-            commit_result = await self.conn.send_command(command=merge_command)
+
+        with response.timed(phase="commit"):
+            if self._replace is True:
+                replace_command = (
+                    f"rollback running-config file {self.filesystem}"
+                    f"{self.candidate_config_filename}"
+                )
+                commit_result = await self.conn.send_command(command=replace_command)
+            else:
+                merge_command = (
+                    f"copy {self.filesystem}{self.candidate_config_filename} running-config"
+                )
+                commit_result = await self.conn.send_command(command=merge_command)
 
         scrapli_responses.append(commit_result)
 
-        save_config_result = await self.conn.send_command(
-            command="copy running-config startup-config"
-        )
+        with response.timed(phase="save"):
+            save_config_result = await self.conn.send_command(
+                command="copy running-config startup-config"
+            )
         scrapli_responses.append(save_config_result)
 
         if self.cleanup_post_commit:
-            cleanup_result = await self._delete_candidate_config()
+            with response.timed(phase="cleanup"):
+                cleanup_result = await self._delete_candidate_config()
             scrapli_responses.append(cleanup_result)
 
         self._reset_config_session()
@@ -224,13 +351,16 @@ class AsyncScrapliCfgNXOS(AsyncScrapliCfgPlatform, ScrapliCfgNXOSBase):
             scrapli_responses=scrapli_responses,
         )
 
-    async def diff_config(self, source: str = "running") -> ScrapliCfgDiffResponse:
+    async def diff_config(
+        self, source: str = "running", mode: str = "full"
+    ) -> ScrapliCfgDiffResponse:
         scrapli_responses = []
         device_diff = ""
+        device_difflines: Optional[List[str]] = None
         source_config = ""
 
         diff_response = self._pre_diff_config(
-            source=source, session_or_config_file=bool(self.candidate_config_filename)
+            source=source, session_or_config_file=bool(self.candidate_config_filename), mode=mode
         )
 
         try:
@@ -247,26 +377,32 @@ class AsyncScrapliCfgNXOS(AsyncScrapliCfgPlatform, ScrapliCfgNXOSBase):
             else:
                 device_diff = ""
 
-            source_config_result = await self.get_config(source=source)
-            source_config = source_config_result.result
+            if mode == "device" and diff_command:
+                device_difflines = self._parse_device_diff(device_diff=device_diff)
+
+            if device_difflines is None:
+                source_config_result = await self.get_config(source=source)
+                source_config = source_config_result.result
 
-            if isinstance(source_config_result.scrapli_responses, MultiResponse):
-                # in this case this will always be a multiresponse or nothing (failure) but mypy
-                # doesnt know that, hence the isinstance check
-                scrapli_responses.extend(source_config_result.scrapli_responses)
+                if isinstance(source_config_result.scrapli_responses, MultiResponse):
+                    # in this case this will always be a multiresponse or nothing (failure) but mypy
+                    # doesnt know that, hence the isinstance check
+                    scrapli_responses.extend(source_config_result.scrapli_responses)
 
-            if source_config_result.failed:
-                msg = "failed fetching source config for diff comparison"
-                self.logger.critical(msg)
-                raise DiffConfigError(msg)
+                if source_config_result.failed:
+                    msg = "failed fetching source config for diff comparison"
+                    self.logger.critical(msg)
+                    raise DiffConfigError(msg)
 
         except DiffConfigError:
             pass
 
-        return self._post_diff_config(
+        return await self._post_diff_config_offloaded(
             diff_response=diff_response,
             scrapli_responses=scrapli_responses,
-            source_config=self.clean_config(source_config),
-            candidate_config=self.clean_config(self.candidate_config),
+            source_config=source_config,
+            candidate_config=self.candidate_config,
             device_diff=device_diff,
+            device_difflines=device_difflines,
+            config_parser=parse_indented_config,
         )
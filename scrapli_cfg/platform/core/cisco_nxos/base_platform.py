@@ -3,9 +3,10 @@
 import re
 from datetime import datetime
 from logging import Logger, LoggerAdapter
-from typing import TYPE_CHECKING, List, Tuple, Union
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
 from scrapli.driver.network import AsyncNetworkDriver, NetworkDriver
+from scrapli_cfg.config_tree import parse_indented_config, render_indented_remediation
 from scrapli_cfg.exceptions import (
     FailedToFetchSpaceAvailable,
     GetConfigError,
@@ -15,6 +16,8 @@ from scrapli_cfg.helper import strip_blank_lines
 from scrapli_cfg.platform.core.cisco_nxos.patterns import (
     BYTES_FREE,
     CHECKPOINT_LINE,
+    CONFIG_FINGERPRINT_PATTERN,
+    DEVICE_DIFF_ERROR_PATTERN,
     OUTPUT_HEADER_PATTERN,
     VERSION_PATTERN,
 )
@@ -31,14 +34,27 @@ CONFIG_SOURCES = [
     "startup",
 ]
 
+# output indicating the device failed to pull the candidate config file from the file server
+PULL_FAILED_WHEN_CONTAINS = ["ERROR", "Copy failed"]
+
+# max bytes of (escaped) config written per tclsh `puts` when writing chunked payloads; tclsh gives
+# up on brace enclosed blocks after ~250 lines and nxos truncates very long input lines, so chunks
+# are single lines kept well below what the cli accepts
+TCLSH_CHUNK_SIZE = 1024
+# characters that must be escaped inside a double quoted tcl string
+TCL_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "$": "\\$", "[": "\\[", "]": "\\]"})
+
 
 class ScrapliCfgNXOSBase:
     logger: LoggerAdapterT
     candidate_config: str
     candidate_config_filename: str
     _replace: bool
+    retain: str = "full"
     filesystem: str
     _filesystem_space_available_buffer_perc: int
+    chunk_payloads: bool = False
+    tclsh_chunk_size: int = TCLSH_CHUNK_SIZE
 
     def _post_get_filesystem_space_available(self, output: str) -> int:
         """
@@ -115,6 +131,50 @@ class ScrapliCfgNXOSBase:
         version_string = version_string_search.group(0) or ""
         return version_string
 
+    @staticmethod
+    def _get_config_fingerprint_command(source: str) -> str:
+        """
+        Return command to use to fetch a fingerprint of the provided config source
+
+        The fingerprint is the running config "last done at" (or startup config "saved at")
+        timestamp, nxos filters the config on box so only the single timestamp line is sent back.
+
+        Args:
+            source: name of the config source, generally running|startup
+
+        Returns:
+            str: command to use to fetch the config fingerprint
+
+        Raises:
+            N/A
+
+        """
+        if source == "running":
+            return 'show running-config | include "Running configuration last done at"'
+        return 'show startup-config | include "Startup config saved at"'
+
+    @staticmethod
+    def _parse_config_fingerprint(device_output: str) -> str:
+        """
+        Parse config fingerprint out of device output
+
+        Args:
+            device_output: output from the config fingerprint command
+
+        Returns:
+            str: config fingerprint, or an empty string if no fingerprint could be found
+
+        Raises:
+            N/A
+
+        """
+        fingerprint_search = re.search(pattern=CONFIG_FINGERPRINT_PATTERN, string=device_output)
+
+        if not fingerprint_search:
+            return ""
+
+        return fingerprint_search.group("fingerprint").strip()
+
     def _reset_config_session(self) -> None:
         """
         Reset config session info
@@ -137,12 +197,14 @@ class ScrapliCfgNXOSBase:
         self.candidate_config_filename = ""
 
     @staticmethod
-    def _get_config_command(source: str) -> str:
+    def _get_config_command(source: str, section: str = "") -> str:
         """
         Return command to use to get config based on the provided source
 
         Args:
             source: name of the config source, generally running|startup
+            section: optional section of the config to fetch, i.e. "interface Management1", the
+                section filtering is done on the device so only the section is sent back
 
         Returns:
             str: command to use to fetch the requested config
@@ -151,9 +213,10 @@ class ScrapliCfgNXOSBase:
             N/A
 
         """
-        if source == "running":
-            return "show running-config"
-        return "show startup-config"
+        command = "show running-config" if source == "running" else "show startup-config"
+        if section:
+            command = f"{command} | section {section}"
+        return command
 
     def _get_diff_command(self, source: str) -> str:
         """
@@ -176,6 +239,108 @@ class ScrapliCfgNXOSBase:
             )
         return ""
 
+    def _parse_device_diff(self, device_diff: str) -> Optional[List[str]]:
+        """
+        Parse the device generated rollback patch into ndiff style diff lines
+
+        The rollback patch is the list of commands to turn the source into the candidate; "no"
+        commands are removals, lines that have more indented lines beneath them are parent lines
+        (context) and all other lines are additions.
+
+        Args:
+            device_diff: output of the device diff command
+
+        Returns:
+            list: ndiff style diff lines, or None if the device diff could not be parsed
+
+        Raises:
+            N/A
+
+        """
+        if re.search(pattern=DEVICE_DIFF_ERROR_PATTERN, string=device_diff):
+            self.logger.warning("device diff contains errors, cannot parse device diff")
+            return None
+
+        lines = [
+            line
+            for line in device_diff.splitlines()
+            if line.strip() and not line.lstrip().startswith(("!", "#"))
+        ]
+
+        difflines = []
+        for index, line in enumerate(lines):
+            stripped_line = line.lstrip()
+            indent = line[: len(line) - len(stripped_line)]
+            next_indent = (
+                len(lines[index + 1]) - len(lines[index + 1].lstrip())
+                if index + 1 < len(lines)
+                else 0
+            )
+
+            if stripped_line.startswith("no "):
+                difflines.append(f"- {indent}{stripped_line[3:]}\n")
+            elif next_indent > len(indent):
+                difflines.append(f"  {line}\n")
+            else:
+                difflines.append(f"+ {line}\n")
+
+        return difflines
+
+    def _get_pull_command(self, url: str, vrf: str = "") -> str:
+        """
+        Build the command to copy the candidate config file from a file server
+
+        Args:
+            url: url of the candidate config file
+            vrf: vrf to copy the file in, if any
+
+        Returns:
+            str: copy command
+
+        Raises:
+            N/A
+
+        """
+        pull_command = f"copy {url} {self.filesystem}{self.candidate_config_filename}"
+        if vrf:
+            pull_command += f" vrf {vrf}"
+
+        return pull_command
+
+    def _get_tclsh_chunks(self, config: str) -> List[str]:
+        """
+        Group config lines into escaped chunks of at most `tclsh_chunk_size` bytes
+
+        Each chunk is the content of a double quoted tcl string -- lines are escaped and terminated
+        with a tcl "\\r" escape, matching the line at a time payloads -- so a whole chunk is written
+        by a single tclsh command. A line that is longer than the chunk size on its own is sent as
+        its own chunk.
+
+        Args:
+            config: configuration to chunk
+
+        Returns:
+            list: escaped chunks of config lines
+
+        Raises:
+            N/A
+
+        """
+        chunks: List[str] = []
+        chunk = ""
+
+        for line in config.splitlines():
+            escaped_line = f"{line.translate(TCL_ESCAPES)}\\r"
+            if chunk and len(chunk) + len(escaped_line) > self.tclsh_chunk_size:
+                chunks.append(chunk)
+                chunk = ""
+            chunk += escaped_line
+
+        if chunk:
+            chunks.append(chunk)
+
+        return chunks
+
     def _prepare_config_payloads(self, config: str) -> str:
         """
         Prepare a configuration so it can be nicely sent to the device via scrapli
@@ -195,9 +360,14 @@ class ScrapliCfgNXOSBase:
         # file are enclosed in curly braces for tcl-reasons i guess
         tclsh_filesystem = f"/{self.filesystem.strip(':')}/"
         tclsh_start_file = f'set fl [open "{tclsh_filesystem}{self.candidate_config_filename}" wb+]'
-        tcl_config = "\n".join(
-            [f"puts -nonewline $fl {{{line}\r}}" for line in config.splitlines()]
-        )
+        if self.chunk_payloads:
+            tcl_config = "\n".join(
+                [f'puts -nonewline $fl "{chunk}"' for chunk in self._get_tclsh_chunks(config)]
+            )
+        else:
+            tcl_config = "\n".join(
+                [f"puts -nonewline $fl {{{line}\r}}" for line in config.splitlines()]
+            )
         tclsh_end_file = "close $fl"
         final_config = "\n".join((tclsh_start_file, tcl_config, tclsh_end_file))
 
@@ -253,6 +423,26 @@ class ScrapliCfgNXOSBase:
         config = re.sub(pattern=OUTPUT_HEADER_PATTERN, string=config, repl="")
         return strip_blank_lines(config=config)
 
+    def _render_remediation_config(self, source_config: str, candidate_config: str) -> str:
+        """
+        Render the minimal config that merged into the source config results in the candidate
+
+        Args:
+            source_config: source config
+            candidate_config: candidate config
+
+        Returns:
+            str: remediation config, lines no longer in the candidate are negated w/ "no"
+
+        Raises:
+            N/A
+
+        """
+        return render_indented_remediation(
+            source=parse_indented_config(self.clean_config(source_config)),
+            candidate=parse_indented_config(self.clean_config(candidate_config)),
+        )
+
     def _pre_get_checkpoint(
         self, conn: Union[AsyncNetworkDriver, NetworkDriver]
     ) -> Tuple[ScrapliCfgResponse, List[str]]:
@@ -280,6 +470,8 @@ class ScrapliCfgNXOSBase:
             f"delete {self.filesystem}scrapli_cfg_tmp_{tmp_timestamp}",
         ]
 
-        response = ScrapliCfgResponse(host=conn.host, raise_for_status_exception=GetConfigError)
+        response = ScrapliCfgResponse(
+            host=conn.host, raise_for_status_exception=GetConfigError, retain=self.retain
+        )
 
         return response, checkpoint_commands
@@ -16,3 +16,10 @@ OUTPUT_HEADER_PATTERN = re.compile(
 )
 
 CHECKPOINT_LINE = re.compile(pattern=r"^\s*!#.*$", flags=re.M)
+DEVICE_DIFF_ERROR_PATTERN = re.compile(pattern=r"^(?:error|%\s?invalid)", flags=re.M | re.I)
+CONFIG_FINGERPRINT_PATTERN = re.compile(
+    pattern=(
+        r"^!(?P<fingerprint>(?:running configuration last done at|startup config saved at):.*)$"
+    ),
+    flags=re.I | re.M,
+)
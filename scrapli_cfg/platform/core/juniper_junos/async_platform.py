@@ -1,17 +1,23 @@
 """scrapli_cfg.platform.core.juniper_junos.async_platform"""
 
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, List, Optional, Union
 
 from scrapli.driver import AsyncNetworkDriver
 from scrapli.response import MultiResponse, Response
+from scrapli_cfg.cache import ConfigCache
 from scrapli_cfg.diff import ScrapliCfgDiffResponse
 from scrapli_cfg.exceptions import DiffConfigError
+from scrapli_cfg.facts import FactsCache
 from scrapli_cfg.platform.base.async_platform import AsyncScrapliCfgPlatform
 from scrapli_cfg.platform.core.juniper_junos.base_platform import (
     CONFIG_SOURCES,
+    LOAD_TERMINAL_FAILED_WHEN_CONTAINS,
+    PULL_FAILED_WHEN_CONTAINS,
     ScrapliCfgJunosBase,
+    parse_junos_config,
 )
 from scrapli_cfg.response import ScrapliCfgResponse
+from scrapli_cfg.transfer import AsyncFileTransfer, PullTransfer
 
 
 class AsyncScrapliCfgJunos(AsyncScrapliCfgPlatform, ScrapliCfgJunosBase):
@@ -25,6 +31,9 @@ class AsyncScrapliCfgJunos(AsyncScrapliCfgPlatform, ScrapliCfgJunosBase):
         cleanup_post_commit: bool = True,
         dedicated_connection: bool = False,
         ignore_version: bool = False,
+        config_cache: Optional[ConfigCache] = None,
+        facts_cache: Optional[FactsCache] = None,
+        transfer: Optional[Union[AsyncFileTransfer, PullTransfer]] = None,
     ) -> None:
         if config_sources is None:
             config_sources = CONFIG_SOURCES
@@ -35,18 +44,43 @@ class AsyncScrapliCfgJunos(AsyncScrapliCfgPlatform, ScrapliCfgJunosBase):
             on_prepare=on_prepare,
             dedicated_connection=dedicated_connection,
             ignore_version=ignore_version,
+            config_cache=config_cache,
+            facts_cache=facts_cache,
         )
 
+        self.transfer = transfer
+
         self.filesystem = filesystem
 
         self._replace = False
         self._set = False
+        self._load_terminal = False
 
         self.candidate_config_filename = ""
         self._in_configuration_session = False
 
         self.cleanup_post_commit = cleanup_post_commit
 
+    async def _pull_candidate_config(self, url: str) -> Response:
+        """
+        Have the device copy the candidate config file from the file server
+
+        Args:
+            url: url of the candidate config file
+
+        Returns:
+            Response: response from copying the candidate config
+
+        Raises:
+            N/A
+
+        """
+        pull_result = await self.conn.send_command(
+            command=self._get_pull_command(url=url),
+            failed_when_contains=PULL_FAILED_WHEN_CONTAINS,
+        )
+        return pull_result
+
     async def _delete_candidate_config(self) -> Response:
         """
         Delete candidate config from the filesystem
@@ -78,8 +112,33 @@ class AsyncScrapliCfgJunos(AsyncScrapliCfgPlatform, ScrapliCfgJunosBase):
             result=self._parse_version(device_output=version_result.result),
         )
 
-    async def get_config(self, source: str = "running") -> ScrapliCfgResponse:
-        response = self._pre_get_config(source=source)
+    async def get_config(
+        self, source: str = "running", sections: Optional[List[str]] = None
+    ) -> ScrapliCfgResponse:
+        response = self._pre_get_config(source=source, sections=sections)
+
+        if sections:
+            section_commands = [
+                self._get_config_command(source=source, section=section) for section in sections
+            ]
+            if self._in_configuration_session is True:
+                sections_result = await self.conn.send_configs(
+                    configs=[f"run {command}" for command in section_commands]
+                )
+            else:
+                sections_result = await self.conn.send_commands(commands=section_commands)
+
+            return self._post_get_config(
+                response=response,
+                source=source,
+                scrapli_responses=[sections_result],
+                result="\n".join(section_result.result for section_result in sections_result),
+                sections=sections,
+            )
+
+        cached_response = self._get_cached_config(source=source)
+        if cached_response is not None:
+            return cached_response
 
         if self._in_configuration_session is True:
             config_result = await self.conn.send_config(config="run show configuration")
@@ -93,6 +152,20 @@ class AsyncScrapliCfgJunos(AsyncScrapliCfgPlatform, ScrapliCfgJunosBase):
             result=config_result.result,
         )
 
+    async def get_config_fingerprint(self, source: str = "running") -> ScrapliCfgResponse:
+        response = self._pre_get_config_fingerprint(source=source)
+
+        fingerprint_result = await self.conn.send_command(
+            command=self._get_config_fingerprint_command(source=source)
+        )
+
+        return self._post_get_config_fingerprint(
+            response=response,
+            source=source,
+            scrapli_responses=[fingerprint_result],
+            result=self._parse_config_fingerprint(device_output=fingerprint_result.result),
+        )
+
     async def load_config(
         self, config: str, replace: bool = False, **kwargs: Any
     ) -> ScrapliCfgResponse:
@@ -101,6 +174,11 @@ class AsyncScrapliCfgJunos(AsyncScrapliCfgPlatform, ScrapliCfgJunosBase):
 
         Supported kwargs:
             set: bool indicating config is a "set" style config (ignored if replace is True)
+            terminal: bool indicating the config should be streamed w/ "load override|set|merge
+                terminal" rather than written to a candidate config file first (any `transfer` is
+                ignored), defaults to `False`
+            timeout_ops: timeout for streaming the config w/ `terminal`, defaults to the
+                connection's `timeout_ops` scaled up w/ the size of the config
 
         Args:
             config: string of the configuration to load
@@ -117,22 +195,57 @@ class AsyncScrapliCfgJunos(AsyncScrapliCfgPlatform, ScrapliCfgJunosBase):
 
         """
         self._set = kwargs.get("set", False)
+        self._load_terminal = kwargs.get("terminal", False)
 
         response = self._pre_load_config(config=config)
 
         config = self._prepare_load_config(config=config, replace=replace)
 
-        config_result = await self.conn.send_config(config=config, privilege_level="root_shell")
-
-        if self._replace is True:
-            load_config = f"load override {self.filesystem}{self.candidate_config_filename}"
+        if self._load_terminal is True:
+            with response.timed(phase="transfer"):
+                load_result = await self.conn.send_interactive(
+                    interact_events=self._get_load_terminal_events(),
+                    failed_when_contains=LOAD_TERMINAL_FAILED_WHEN_CONTAINS,
+                    privilege_level="configuration",
+                    timeout_ops=self._get_load_terminal_timeout(
+                        timeout_ops=kwargs.get("timeout_ops"),
+                        default_timeout_ops=self.conn.timeout_ops,
+                    ),
+                )
+            self._in_configuration_session = True
+
+            return self._post_load_config(
+                response=response,
+                scrapli_responses=[load_result],
+            )
+
+        if isinstance(self.transfer, PullTransfer):
+            url = self.transfer.url(config=f"{self.candidate_config}\n")
+            try:
+                with response.timed(phase="transfer"):
+                    config_result = await self._pull_candidate_config(url=url)
+            finally:
+                # copy finished or failed, either way the device is done w/ the file
+                self.transfer.discard(url=url)
+        elif self.transfer is not None:
+            with response.timed(phase="transfer"):
+                config_result = await self.transfer.put(
+                    conn=self.conn,
+                    config=f"{self.candidate_config}\n",
+                    remote_path=f"{self.filesystem}{self.candidate_config_filename}",
+                )
         else:
-            if self._set is True:
-                load_config = f"load set {self.filesystem}{self.candidate_config_filename}"
-            else:
-                load_config = f"load merge {self.filesystem}{self.candidate_config_filename}"
+            with response.timed(phase="transfer"):
+                config_result = await self.conn.send_config(
+                    config=config, privilege_level="root_shell"
+                )
+
+        load_config = self._get_load_command(
+            target=f"{self.filesystem}{self.candidate_config_filename}"
+        )
 
-        load_result = await self.conn.send_config(config=load_config)
+        with response.timed(phase="load"):
+            load_result = await self.conn.send_config(config=load_config)
         self._in_configuration_session = True
 
         return self._post_load_config(
@@ -146,12 +259,16 @@ class AsyncScrapliCfgJunos(AsyncScrapliCfgPlatform, ScrapliCfgJunosBase):
         )
 
         rollback_result = await self.conn.send_config(config="rollback 0")
-        abort_result = await self._delete_candidate_config()
+        scrapli_responses: List[Union[Response, MultiResponse]] = [rollback_result]
+
+        # nothing was written to disk if the config was streamed via "load ... terminal"
+        if self._load_terminal is False:
+            abort_result = await self._delete_candidate_config()
+            scrapli_responses.append(abort_result)
+
         self._reset_config_session()
 
-        return self._post_abort_config(
-            response=response, scrapli_responses=[rollback_result, abort_result]
-        )
+        return self._post_abort_config(response=response, scrapli_responses=scrapli_responses)
 
     async def commit_config(self, source: str = "running") -> ScrapliCfgResponse:
         scrapli_responses = []
@@ -159,11 +276,20 @@ class AsyncScrapliCfgJunos(AsyncScrapliCfgPlatform, ScrapliCfgJunosBase):
             source=source, session_or_config_file=bool(self.candidate_config_filename)
         )
 
-        commit_result = await self.conn.send_config(config="commit")
+        if self._commit_is_noop():
+            # the candidate matches the running config, discard it rather than commit (and save) it
+            abort_result = await self.abort_config()
+            return self._post_commit_config(
+                response=response, scrapli_responses=[*abort_result.scrapli_responses]
+            )
+
+        with response.timed(phase="commit"):
+            commit_result = await self.conn.send_config(config="commit")
         scrapli_responses.append(commit_result)
 
-        if self.cleanup_post_commit:
-            cleanup_result = await self._delete_candidate_config()
+        if self.cleanup_post_commit and self._load_terminal is False:
+            with response.timed(phase="cleanup"):
+                cleanup_result = await self._delete_candidate_config()
             scrapli_responses.append(cleanup_result)
 
         self._reset_config_session()
@@ -173,13 +299,16 @@ class AsyncScrapliCfgJunos(AsyncScrapliCfgPlatform, ScrapliCfgJunosBase):
             scrapli_responses=scrapli_responses,
         )
 
-    async def diff_config(self, source: str = "running") -> ScrapliCfgDiffResponse:
+    async def diff_config(
+        self, source: str = "running", mode: str = "full"
+    ) -> ScrapliCfgDiffResponse:
         scrapli_responses = []
         device_diff = ""
+        device_difflines: Optional[List[str]] = None
         source_config = ""
 
         diff_response = self._pre_diff_config(
-            source=source, session_or_config_file=bool(self.candidate_config_filename)
+            source=source, session_or_config_file=bool(self.candidate_config_filename), mode=mode
         )
 
         try:
@@ -192,26 +321,32 @@ class AsyncScrapliCfgJunos(AsyncScrapliCfgPlatform, ScrapliCfgJunosBase):
 
             device_diff = diff_result.result
 
-            source_config_result = await self.get_config(source=source)
-            source_config = source_config_result.result
+            if mode == "device":
+                device_difflines = self._parse_device_diff(device_diff=device_diff)
 
-            if isinstance(source_config_result.scrapli_responses, MultiResponse):
-                # in this case this will always be a multiresponse or nothing (failure) but mypy
-                # doesnt know that, hence the isinstance check
-                scrapli_responses.extend(source_config_result.scrapli_responses)
+            if device_difflines is None:
+                source_config_result = await self.get_config(source=source)
+                source_config = source_config_result.result
 
-            if source_config_result.failed:
-                msg = "failed fetching source config for diff comparison"
-                self.logger.critical(msg)
-                raise DiffConfigError(msg)
+                if isinstance(source_config_result.scrapli_responses, MultiResponse):
+                    # in this case this will always be a multiresponse or nothing (failure) but mypy
+                    # doesnt know that, hence the isinstance check
+                    scrapli_responses.extend(source_config_result.scrapli_responses)
+
+                if source_config_result.failed:
+                    msg = "failed fetching source config for diff comparison"
+                    self.logger.critical(msg)
+                    raise DiffConfigError(msg)
 
         except DiffConfigError:
             pass
 
-        return self._post_diff_config(
+        return await self._post_diff_config_offloaded(
             diff_response=diff_response,
             scrapli_responses=scrapli_responses,
-            source_config=self.clean_config(source_config),
-            candidate_config=self.clean_config(self.candidate_config),
+            source_config=source_config,
+            candidate_config=self.candidate_config,
             device_diff=device_diff,
+            device_difflines=device_difflines,
+            config_parser=parse_junos_config,
         )
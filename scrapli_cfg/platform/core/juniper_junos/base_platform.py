@@ -3,12 +3,20 @@
 import re
 from datetime import datetime
 from logging import Logger, LoggerAdapter
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator, List, Optional, Set, Tuple
 
+from scrapli_cfg.config_tree import ConfigNode, remediate_config_trees
 from scrapli_cfg.helper import strip_blank_lines
 from scrapli_cfg.platform.core.juniper_junos.patterns import (
+    CONFIG_FINGERPRINT_PATTERN,
+    DEVICE_DIFF_ERROR_PATTERN,
     EDIT_PATTERN,
+    INACTIVE_PREFIX_PATTERN,
+    INACTIVE_STATEMENT_PATTERN,
+    ORDERED_SECTION_PATTERN,
     OUTPUT_HEADER_PATTERN,
+    STATEMENT_PREFIX_PATTERN,
+    TRAILING_COMMENT_PATTERN,
     VERSION_PATTERN,
 )
 
@@ -22,6 +30,206 @@ CONFIG_SOURCES = [
     "running",
 ]
 
+# output indicating the device failed to pull the candidate config file from the file server
+PULL_FAILED_WHEN_CONTAINS = ["error:"]
+
+# junos asks for the config w/ this after a "load ... terminal" command
+LOAD_TERMINAL_PROMPT = "[Type ^D at a new line to end input]"
+# output indicating (part of) a config loaded via "load ... terminal" was rejected
+LOAD_TERMINAL_FAILED_WHEN_CONTAINS = ["syntax error", "error:", "errors)"]
+# unless given an explicit timeout, "load ... terminal" gets the connection's `timeout_ops` plus a
+# second for every this many bytes of candidate config -- junos parses the config as it arrives
+LOAD_TERMINAL_BYTES_PER_SECOND = 10_000
+
+
+def _statement_key(statement: str) -> str:
+    """
+    Build the key for a junos config statement
+
+    The key drops "inactive:"/"protect:" prefixes, trailing "##" comments and the trailing "{" or
+    ";" so that i.e. a section being deactivated is still matched up with the active section.
+
+    Args:
+        statement: stripped config statement
+
+    Returns:
+        str: key for the statement
+
+    Raises:
+        N/A
+
+    """
+    key = re.sub(pattern=STATEMENT_PREFIX_PATTERN, string=statement, repl="")
+    key = re.sub(pattern=TRAILING_COMMENT_PATTERN, string=key, repl="")
+    return key.rstrip("{; ")
+
+
+def parse_junos_config(config: str) -> ConfigNode:
+    """
+    Parse a curly brace style junos config into a tree of ConfigNodes
+
+    Junos does not care about the order of most statements so nodes are unordered, except for the
+    sections where order is significant (policy/filter terms, security policies, nat rules) --
+    meaning a re-ordered config will diff as unchanged where junos considers it unchanged.
+
+    Args:
+        config: config to parse, should already be cleaned by `clean_config`
+
+    Returns:
+        ConfigNode: root node of the config tree
+
+    Raises:
+        N/A
+
+    """
+    root = ConfigNode(line="", ordered=False)
+    stack: List[ConfigNode] = [root]
+
+    for line in config.splitlines():
+        statement = line.strip()
+        if not statement:
+            continue
+
+        if statement.startswith("}"):
+            if len(stack) > 1:
+                stack.pop().closing = line.rstrip()
+            continue
+
+        key = _statement_key(statement=statement)
+        ordered = bool(re.match(pattern=ORDERED_SECTION_PATTERN, string=key))
+        node = ConfigNode(line=line.rstrip(), key=key, ordered=ordered, match_moved=False)
+        stack[-1].children.append(node)
+
+        if statement.endswith("{"):
+            stack.append(node)
+
+    root.compute_digest()
+
+    return root
+
+
+def _set_statements(node: ConfigNode, path: str) -> Iterator[str]:
+    """
+    Yield the set (and deactivate) statements that create a config node
+
+    Args:
+        node: config node to create
+        path: statement path of the parent of the node
+
+    Yields:
+        str: set/deactivate statements
+
+    Raises:
+        N/A
+
+    """
+    node_path = f"{path} {node.key}".strip()
+
+    if not node.children:
+        yield f"set {node_path}"
+
+    for child in node.children:
+        yield from _set_statements(node=child, path=node_path)
+
+    if _is_inactive(statement=node.line.strip()):
+        yield f"deactivate {node_path}"
+
+
+def _is_inactive(statement: str) -> bool:
+    """
+    Check if a junos config statement is inactive
+
+    Args:
+        statement: stripped config statement
+
+    Returns:
+        bool: True if the statement is inactive
+
+    Raises:
+        N/A
+
+    """
+    return bool(re.match(pattern=INACTIVE_STATEMENT_PATTERN, string=statement))
+
+
+def _without_inactive(statement: str) -> str:
+    """
+    Drop the "inactive:" prefix of a junos config statement, keeping any other prefix
+
+    Args:
+        statement: stripped config statement
+
+    Returns:
+        str: the statement w/o its "inactive:" prefix
+
+    Raises:
+        N/A
+
+    """
+    prefix_match = re.match(pattern=STATEMENT_PREFIX_PATTERN, string=statement)
+    prefix = prefix_match.group() if prefix_match else ""
+    return (
+        re.sub(pattern=INACTIVE_PREFIX_PATTERN, string=prefix, repl="") + statement[len(prefix) :]
+    )
+
+
+def render_set_remediation(source: ConfigNode, candidate: ConfigNode) -> str:
+    """
+    Render the minimal junos set/delete statements that turn the source config into the candidate
+
+    Removed statements are deleted and added statements are set. Statements that were only
+    activated/deactivated are activated/deactivated in place rather than deleted and set again.
+    As set statements are always appended, ordered sections (policy/filter terms and such) that
+    gained or lost statements are deleted and set again in full so the candidate order is kept.
+
+    Args:
+        source: root node of the source config, as parsed by `parse_junos_config`
+        candidate: root node of the candidate config, as parsed by `parse_junos_config`
+
+    Returns:
+        str: remediation set statements, an empty string if the configs do not differ
+
+    Raises:
+        N/A
+
+    """
+    statements: List[str] = []
+    # candidate nodes that were set again in full, changes beneath them are already rendered
+    replaced: Set[int] = set()
+
+    for parents, removed, added, changed in remediate_config_trees(
+        source=source, candidate=candidate
+    ):
+        if any(id(parent) in replaced for parent in parents):
+            continue
+
+        if parents and parents[-1].ordered and (removed or added):
+            replaced.add(id(parents[-1]))
+            parent_path = " ".join(parent.key for parent in parents[:-1])
+            statements.append(f"delete {f'{parent_path} {parents[-1].key}'.strip()}")
+            statements.extend(_set_statements(node=parents[-1], path=parent_path))
+            continue
+
+        path = " ".join(parent.key for parent in parents)
+        statements.extend(f"delete {f'{path} {node.key}'.strip()}" for node in removed)
+        for node in added:
+            statements.extend(_set_statements(node=node, path=path))
+
+        for source_node, candidate_node in changed:
+            node_path = f"{path} {candidate_node.key}".strip()
+            source_statement = source_node.line.strip()
+            candidate_statement = candidate_node.line.strip()
+            if _without_inactive(source_statement) == _without_inactive(candidate_statement):
+                action = "deactivate" if _is_inactive(candidate_statement) else "activate"
+                statements.append(f"{action} {node_path}")
+                continue
+
+            replaced.add(id(candidate_node))
+            statements.append(f"delete {node_path}")
+            statements.extend(_set_statements(node=candidate_node, path=path))
+
+    return "\n".join(statements)
+
 
 class ScrapliCfgJunosBase:
     logger: LoggerAdapterT
@@ -30,6 +238,7 @@ class ScrapliCfgJunosBase:
     _in_configuration_session: bool
     _replace: bool
     _set: bool
+    _load_terminal: bool
     filesystem: str
 
     @staticmethod
@@ -55,6 +264,71 @@ class ScrapliCfgJunosBase:
         version_string = version_string_search.group(0) or ""
         return version_string
 
+    @staticmethod
+    def _get_config_command(source: str, section: str = "") -> str:
+        """
+        Return command to use to get config based on the provided source
+
+        Args:
+            source: name of the config source, only running is supported
+            section: optional section of the config to fetch, i.e. "interfaces fxp0", the
+                section filtering is done on the device so only the section is sent back
+
+        Returns:
+            str: command to use to fetch the requested config
+
+        Raises:
+            N/A
+
+        """
+        _ = source
+        if section:
+            return f"show configuration {section}"
+        return "show configuration"
+
+    @staticmethod
+    def _get_config_fingerprint_command(source: str) -> str:
+        """
+        Return command to use to fetch a fingerprint of the provided config source
+
+        The fingerprint is the most recent commit (timestamp, user and client) from the commit
+        history.
+
+        Args:
+            source: name of the config source, generally running|startup
+
+        Returns:
+            str: command to use to fetch the config fingerprint
+
+        Raises:
+            N/A
+
+        """
+        _ = source
+        return 'show system commit | match "^0 "'
+
+    @staticmethod
+    def _parse_config_fingerprint(device_output: str) -> str:
+        """
+        Parse config fingerprint out of device output
+
+        Args:
+            device_output: output from the config fingerprint command
+
+        Returns:
+            str: config fingerprint, or an empty string if no fingerprint could be found
+
+        Raises:
+            N/A
+
+        """
+        fingerprint_search = re.search(pattern=CONFIG_FINGERPRINT_PATTERN, string=device_output)
+
+        if not fingerprint_search:
+            return ""
+
+        return fingerprint_search.group("fingerprint").strip()
+
     def _reset_config_session(self) -> None:
         """
         Reset config session info
@@ -77,6 +351,88 @@ class ScrapliCfgJunosBase:
         self.candidate_config_filename = ""
         self._in_configuration_session = False
         self._set = False
+        self._load_terminal = False
+
+    def _get_pull_command(self, url: str) -> str:
+        """
+        Build the command to copy the candidate config file from a file server
+
+        Args:
+            url: url of the candidate config file
+
+        Returns:
+            str: copy command
+
+        Raises:
+            N/A
+
+        """
+        return f"file copy {url} {self.filesystem}{self.candidate_config_filename}"
+
+    def _get_load_command(self, target: str) -> str:
+        """
+        Build the load command for the current load mode (override, set or merge)
+
+        Args:
+            target: what to load the config from, the candidate config file or "terminal"
+
+        Returns:
+            str: load command
+
+        Raises:
+            N/A
+
+        """
+        if self._replace is True:
+            return f"load override {target}"
+        if self._set is True:
+            return f"load set {target}"
+        return f"load merge {target}"
+
+    def _get_load_terminal_events(self) -> List[Tuple[str, str, bool]]:
+        """
+        Build the interact events to stream the candidate config via "load ... terminal"
+
+        The whole config is written in one go followed by ^D, and then only the final prompt is
+        waited for rather than a prompt per line. The config input is "hidden" so scrapli does not
+        wait for (or log) the echo of every line.
+
+        Args:
+            N/A
+
+        Returns:
+            list: interact events for `send_interactive`
+
+        Raises:
+            N/A
+
+        """
+        return [
+            (self._get_load_command(target="terminal"), LOAD_TERMINAL_PROMPT, False),
+            (f"{self.candidate_config}\n\x04", "", True),
+        ]
+
+    def _get_load_terminal_timeout(
+        self, timeout_ops: Optional[float], default_timeout_ops: float
+    ) -> float:
+        """
+        Determine the timeout for streaming the candidate config via "load ... terminal"
+
+        Args:
+            timeout_ops: explicit timeout passed to `load_config`, if any
+            default_timeout_ops: `timeout_ops` of the connection
+
+        Returns:
+            float: timeout in seconds
+
+        Raises:
+            N/A
+
+        """
+        if timeout_ops is not None:
+            return timeout_ops
+
+        return default_timeout_ops + len(self.candidate_config) / LOAD_TERMINAL_BYTES_PER_SECOND
 
     def _prepare_config_payloads(self, config: str) -> str:
         """
@@ -151,3 +507,60 @@ class ScrapliCfgJunosBase:
         config = re.sub(pattern=OUTPUT_HEADER_PATTERN, string=config, repl="")
         config = re.sub(pattern=EDIT_PATTERN, string=config, repl="")
         return strip_blank_lines(config=config)
+
+    def _render_remediation_config(self, source_config: str, candidate_config: str) -> str:
+        """
+        Render the minimal set/delete statements that turn the source config into the candidate
+
+        Args:
+            source_config: source config
+            candidate_config: candidate config, in curly brace (not set) format
+
+        Returns:
+            str: remediation set/delete statements, to be loaded w/ the `set` load_config kwarg
+
+        Raises:
+            N/A
+
+        """
+        return render_set_remediation(
+            source=parse_junos_config(self.clean_config(source_config)),
+            candidate=parse_junos_config(self.clean_config(candidate_config)),
+        )
+
+    def _parse_device_diff(self, device_diff: str) -> Optional[List[str]]:
+        """
+        Parse the device generated diff ("show | compare") into ndiff style diff lines
+
+        Hierarchy ("[edit ...]") lines are kept as context, the first column of all other lines is
+        a marker -- "+" for added lines, "-" for removed lines, anything else is context.
+
+        Args:
+            device_diff: output of the device diff command
+
+        Returns:
+            list: ndiff style diff lines, or None if the device diff could not be parsed
+
+        Raises:
+            N/A
+
+        """
+        if re.search(pattern=DEVICE_DIFF_ERROR_PATTERN, string=device_diff):
+            self.logger.warning("device diff contains errors, cannot parse device diff")
+            return None
+
+        device_diff = re.sub(pattern=EDIT_PATTERN, string=device_diff, repl="")
+
+        difflines = []
+        for line in device_diff.splitlines():
+            if not line.strip():
+                continue
+
+            if line.startswith("["):
+                difflines.append(f"  {line}\n")
+            elif line[0] in ("+", "-"):
+                difflines.append(f"{line[0]} {line[1:]}\n")
+            else:
+                difflines.append(f"  {line[1:]}\n")
+
+        return difflines
@@ -10,3 +10,17 @@ VERSION_PATTERN = re.compile(
 )
 OUTPUT_HEADER_PATTERN = re.compile(pattern=r"^## last commit.*$\nversion.*$", flags=re.M | re.I)
 EDIT_PATTERN = re.compile(pattern=r"^\[edit\]$", flags=re.M)
+# sections where junos cares about the order of the child statements, i.e. policy/filter terms
+ORDERED_SECTION_PATTERN = re.compile(
+    pattern=r"^(?:policy-statement|filter|rule-set|from-zone \S+ to-zone) \S+", flags=re.I
+)
+STATEMENT_PREFIX_PATTERN = re.compile(pattern=r"^(?:(?:inactive|protect):\s+)+", flags=re.I)
+INACTIVE_STATEMENT_PATTERN = re.compile(
+    pattern=r"^(?:(?:inactive|protect):\s+)*inactive:", flags=re.I
+)
+INACTIVE_PREFIX_PATTERN = re.compile(pattern=r"inactive:\s+", flags=re.I)
+TRAILING_COMMENT_PATTERN = re.compile(pattern=r"\s+##.*$")
+DEVICE_DIFF_ERROR_PATTERN = re.compile(
+    pattern=r"^\s*(?:error|syntax error|unknown command)", flags=re.M | re.I
+)
+CONFIG_FINGERPRINT_PATTERN = re.compile(pattern=r"^0\s+(?P<fingerprint>.+)$", flags=re.M)
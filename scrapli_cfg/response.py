@@ -1,15 +1,79 @@
 """scrapli_cfg.response"""
 
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Iterable, List, Optional, Type, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Type, Union
 
 from scrapli.response import MultiResponse, Response
-from scrapli_cfg.exceptions import ScrapliCfgException
+from scrapli_cfg.exceptions import ApplyConfigError, ScrapliCfgException
+
+# "full" keeps the scrapli responses as is, "summary" only keeps a small summary of each
+RETAIN_MODES = ("full", "summary")
+# max characters of input/output kept per scrapli response (and of the result) when summarized
+SUMMARY_OUTPUT_LENGTH = 1024
+
+
+class ResponseSummary:
+    __slots__ = ("channel_input", "failed", "elapsed_time", "result")
+
+    def __init__(self, response: Response) -> None:
+        """
+        Lightweight summary of a scrapli response -- status, timing and truncated input/output
+
+        Args:
+            response: scrapli response to summarize
+
+        Returns:
+            N/A
+
+        Raises:
+            N/A
+
+        """
+        self.channel_input = response.channel_input[:SUMMARY_OUTPUT_LENGTH]
+        self.failed = response.failed
+        self.elapsed_time = response.elapsed_time
+        self.result = response.result[:SUMMARY_OUTPUT_LENGTH]
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for ResponseSummary class
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for class object
+
+        Raises:
+            N/A
+
+        """
+        return f"ResponseSummary <Success: {str(not self.failed)}>"
 
 
 class ScrapliCfgResponse:
+    __slots__ = (
+        "host",
+        "start_time",
+        "finish_time",
+        "elapsed_time",
+        "timings",
+        "_perf_start",
+        "retain",
+        "scrapli_responses",
+        "summaries",
+        "result",
+        "raise_for_status_exception",
+        "failed",
+    )
+
     def __init__(
-        self, host: str, raise_for_status_exception: Type[Exception] = ScrapliCfgException
+        self,
+        host: str,
+        raise_for_status_exception: Type[Exception] = ScrapliCfgException,
+        retain: str = "full",
     ) -> None:
         """
         Scrapli CFG Response object
@@ -18,23 +82,36 @@ class ScrapliCfgResponse:
             host: host that was operated on
             raise_for_status_exception: exception to raise if response is failed and user calls
                 `raise_for_status`
+            retain: "full" to keep the scrapli responses, or "summary" to only keep a summary of
+                each (see `ResponseSummary`) -- the raw/full output of large operations such as
+                fetching a config is then not held on to for the life of the response
 
         Returns:
             N/A
 
         Raises:
-            N/A
+            ValueError: if retain is not a valid retain mode
 
         """
+        if retain not in RETAIN_MODES:
+            raise ValueError(f"retain must be one of {RETAIN_MODES}")
+
         self.host = host
         self.start_time = datetime.now()
         self.finish_time: Optional[datetime] = None
         self.elapsed_time: Optional[float] = None
 
+        # phase name (i.e. "transfer") -> elapsed seconds of the phase, measured w/ the monotonic
+        # perf_counter; "total" is the elapsed time of the whole operation
+        self.timings: Dict[str, float] = {}
+        self._perf_start = time.perf_counter()
+
         # scrapli_responses is a "flattened" list of responses from all operations that were
         # performed; meaning that if we used any plural operations like send_commands we'll flatten
         # the MultiResponse bits into a list of singular response objects and store them here
+        self.retain = retain
         self.scrapli_responses: List[Response] = []
+        self.summaries: List[ResponseSummary] = []
         self.result: str = ""
 
         self.raise_for_status_exception = raise_for_status_exception
@@ -105,21 +182,107 @@ class ScrapliCfgResponse:
             N/A
 
         """
-        self.finish_time = datetime.now()
-        self.elapsed_time = (self.finish_time - self.start_time).total_seconds()
+        self._record_elapsed_time()
 
+        flattened_responses: List[Response] = []
         for response in scrapli_responses:
             if isinstance(response, Response):
-                self.scrapli_responses.append(response)
+                flattened_responses.append(response)
             elif isinstance(response, MultiResponse):
-                for sub_response in response:
-                    self.scrapli_responses.append(sub_response)
+                flattened_responses.extend(response)
+
+        if self.retain == "summary":
+            self.summaries.extend(ResponseSummary(response) for response in flattened_responses)
+        else:
+            self.scrapli_responses.extend(flattened_responses)
 
         self.result = result
 
-        if not any(response.failed for response in self.scrapli_responses):
+        if not any(response.failed for response in self.scrapli_responses) and not any(
+            summary.failed for summary in self.summaries
+        ):
             self.failed = False
 
+    def _record_elapsed_time(self) -> None:
+        """
+        Record the finish time and elapsed time of the operation
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.finish_time = datetime.now()
+        self.elapsed_time = time.perf_counter() - self._perf_start
+        self.timings["total"] = self.elapsed_time
+
+    @contextmanager
+    def timed(self, phase: str) -> Iterator[None]:
+        """
+        Time a phase of the operation, adding its elapsed time to `timings`
+
+        Timing the same phase more than once (i.e. a priv change before and after the config is
+        sent) accumulates the elapsed time of each.
+
+        Args:
+            phase: name of the phase, i.e. "transfer"
+
+        Yields:
+            None
+
+        Raises:
+            N/A
+
+        """
+        phase_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[phase] = self.timings.get(phase, 0.0) + time.perf_counter() - phase_start
+
+    @property
+    def commands(self) -> List[str]:
+        """
+        Inputs sent to the device, truncated if the scrapli responses were summarized
+
+        Args:
+            N/A
+
+        Returns:
+            list: list of channel inputs
+
+        Raises:
+            N/A
+
+        """
+        return [response.channel_input for response in self.scrapli_responses] + [
+            summary.channel_input for summary in self.summaries
+        ]
+
+    def summarize(self) -> None:
+        """
+        Drop the scrapli responses (keeping only their summaries) and truncate the result
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.summaries.extend(ResponseSummary(response) for response in self.scrapli_responses)
+        self.scrapli_responses = []
+        self.result = self.result[:SUMMARY_OUTPUT_LENGTH]
+        self.retain = "summary"
+
     def raise_for_status(self) -> None:
         """
         Raise a `ScrapliCommandFailure` if command/config failed
@@ -136,3 +299,139 @@ class ScrapliCfgResponse:
         """
         if self.failed:
             raise self.raise_for_status_exception()
+
+
+class ScrapliCfgApplyResponse(ScrapliCfgResponse):
+    __slots__ = ("phases", "committed")
+
+    def __init__(self, host: str, retain: str = "full") -> None:
+        """
+        Scrapli CFG Apply Response object -- the aggregated result of an `apply` operation
+
+        Args:
+            host: host that was operated on
+            retain: "full" or "summary", see `ScrapliCfgResponse`
+
+        Returns:
+            N/A
+
+        Raises:
+            N/A
+
+        """
+        super().__init__(host=host, raise_for_status_exception=ApplyConfigError, retain=retain)
+
+        # phase name ("load", "diff", "commit" or "abort") -> response of the phase, the elapsed
+        # seconds of each phase are recorded in `timings`
+        self.phases: Dict[str, ScrapliCfgResponse] = {}
+        self.committed = False
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for ScrapliCfgApplyResponse class
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for class object
+
+        Raises:
+            N/A
+
+        """
+        return (
+            f"ScrapliCfgApplyResponse <Success: {str(not self.failed)}, "
+            f"Committed: {str(self.committed)}>"
+        )
+
+    def __str__(self) -> str:
+        """
+        Magic str method for ScrapliCfgApplyResponse class
+
+        Args:
+            N/A
+
+        Returns:
+            str: str for class object
+
+        Raises:
+            N/A
+
+        """
+        return self.__repr__()
+
+    @property
+    def round_trips(self) -> int:
+        """
+        Number of device round trips (scrapli operations) across all phases
+
+        Args:
+            N/A
+
+        Returns:
+            int: round trip count
+
+        Raises:
+            N/A
+
+        """
+        return len(self.scrapli_responses) + len(self.summaries)
+
+    def record_phase(self, phase: str, response: ScrapliCfgResponse, elapsed_time: float) -> None:
+        """
+        Record the response and elapsed time of a phase of the apply operation
+
+        Args:
+            phase: name of the phase, i.e. "load"
+            response: scrapli cfg response of the phase
+            elapsed_time: elapsed seconds of the phase
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.phases[phase] = response
+        self.timings[phase] = elapsed_time
+        self.scrapli_responses.extend(response.scrapli_responses)
+        self.summaries.extend(response.summaries)
+
+    def record_apply_response(self, committed: bool) -> None:
+        """
+        Record the outcome of the apply operation once all phases are done
+
+        Args:
+            committed: True if the candidate config was committed
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._record_elapsed_time()
+        self.committed = committed
+
+        self.failed = any(response.failed for response in self.phases.values())
+
+    def summarize(self) -> None:
+        """
+        Summarize the apply response and the responses of all of its phases
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        super().summarize()
+        for response in self.phases.values():
+            response.summarize()
@@ -0,0 +1,348 @@
+"""scrapli_cfg.section_index"""
+
+import re
+from bisect import bisect_left
+from typing import Dict, List, Mapping, Optional, Pattern, Tuple, Union
+
+# lines at the top level of a config that close (junos "}") rather than open a stanza
+CLOSING_LINES = ("}",)
+# lines at the top level of a config that only separate stanzas (ios "!")
+SEPARATOR_LINES = ("!",)
+
+TEMPLATE_VARIABLE_PATTERN = re.compile(pattern=r"{{ (?P<name>[^{}]+?) }}")
+
+# regex characters that end the literal prefix of a pattern
+REGEX_SPECIAL_CHARS = ".^$*+?{}[]|()\\"
+# quantifiers that make the character before them optional
+OPTIONAL_QUANTIFIERS = "*?{"
+
+
+def _alternates_anchor(source: str, leading_groups: int) -> bool:
+    """
+    Check if a pattern has alternation applying to its leading "^" anchor
+
+    Args:
+        source: source of the pattern
+        leading_groups: number of groups the anchor is nested in
+
+    Returns:
+        bool: True if there is a "|" outside of any group nested deeper than the anchor
+
+    Raises:
+        N/A
+
+    """
+    depth = 0
+    in_class = False
+    escaped = False
+    for char in source:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth <= leading_groups:
+            return True
+
+    return False
+
+
+def _literal_prefix(source: str, position: int) -> Tuple[str, int]:
+    """
+    Read the literal text of a pattern starting at a position
+
+    Args:
+        source: source of the pattern
+        position: position to start reading at
+
+    Returns:
+        tuple: the literal text (w/ escapes resolved) and the position of the first non literal
+
+    Raises:
+        N/A
+
+    """
+    prefix = ""
+    while position < len(source):
+        char = source[position]
+        if char == "\\":
+            escaped_char = source[position + 1 : position + 2]
+            if not escaped_char or escaped_char.isalnum():
+                break
+            prefix += escaped_char
+            position += 2
+        elif char in REGEX_SPECIAL_CHARS:
+            break
+        else:
+            prefix += char
+            position += 1
+
+    return prefix, position
+
+
+def _anchored_prefix(pattern: Pattern[str]) -> Optional[str]:
+    """
+    Return the literal text every match of a pattern starts a (top level) line with
+
+    Only multiline patterns anchored w/ "^" (optionally inside leading groups, as in the canned
+    `ETHERNET_INTERFACES` patterns) and w/o alternation outside of nested groups have such a
+    prefix; a match of such a pattern can only start at a top level line beginning w/ the prefix.
+
+    Args:
+        pattern: compiled substitute pattern
+
+    Returns:
+        str: the prefix (lower cased for case insensitive patterns), or None if the pattern has no
+            usable prefix
+
+    Raises:
+        N/A
+
+    """
+    if not pattern.flags & re.M or pattern.flags & re.X:
+        return None
+
+    source = pattern.pattern
+    position = 0
+    leading_groups = 0
+    while True:
+        if source.startswith("(?:", position):
+            position += 3
+        elif source.startswith("(", position) and not source.startswith("(?", position):
+            position += 1
+        else:
+            break
+        leading_groups += 1
+
+    if not source.startswith("^", position):
+        return None
+    while source.startswith("^", position):
+        position += 1
+
+    if _alternates_anchor(source=source, leading_groups=leading_groups):
+        return None
+
+    prefix, position = _literal_prefix(source=source, position=position)
+    if prefix and source[position : position + 1] in tuple(OPTIONAL_QUANTIFIERS):
+        prefix = prefix[:-1]
+
+    if not prefix or prefix[0].isspace() or prefix[0] in (*CLOSING_LINES, *SEPARATOR_LINES):
+        return None
+
+    return prefix.lower() if pattern.flags & re.I else prefix
+
+
+class SectionIndex:
+    def __init__(self, config: str) -> None:
+        """
+        Reusable index over a source config for resolving substitutes
+
+        The config is split into its top level stanzas in a single pass. Substitute patterns
+        anchored to the start of a stanza (i.e. "^interface management1$...") are only matched
+        at the stanzas whose header starts w/ the pattern's literal prefix rather than scanned
+        over the whole config, and every pattern resolved against the index is memoized --
+        rendering any number of templates against the same source config never scans the config
+        more than once per distinct (unanchored) pattern.
+
+        Args:
+            config: source config to index
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.config = config
+        self.sections: Dict[str, str] = {}
+
+        # (lower cased header, offset of the header line in the config, header) of every top level
+        # line that opens a stanza, sorted for prefix lookups; duplicate headers are all kept
+        self._headers: List[Tuple[str, int, str]] = []
+        self._resolved: Dict[Union[str, Pattern[str]], Optional[str]] = {}
+
+        self._index_sections()
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for SectionIndex class
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for class object
+
+        Raises:
+            N/A
+
+        """
+        return f"SectionIndex <sections: {len(self.sections)}, resolved: {len(self._resolved)}>"
+
+    def _index_sections(self) -> None:
+        """
+        Split the config into top level stanzas keyed by their (stripped) first line
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        header = ""
+        section_lines: List[str] = []
+        offset = 0
+
+        # split on "\n" only (not `splitlines`) so offsets line up w/ "^" in multiline patterns
+        for raw_line in self.config.split("\n"):
+            line_offset = offset
+            offset += len(raw_line) + 1
+
+            line = raw_line.rstrip("\r")
+            stripped_line = line.strip()
+            if not stripped_line or (line[0].isspace() or stripped_line in CLOSING_LINES):
+                if header and stripped_line:
+                    section_lines.append(line)
+                continue
+
+            if header:
+                self.sections[header] = "\n".join(section_lines)
+
+            if stripped_line in SEPARATOR_LINES:
+                header = ""
+                section_lines = []
+                continue
+
+            header = stripped_line
+            section_lines = [line]
+            self._headers.append((line.lower(), line_offset, line))
+
+        if header:
+            self.sections[header] = "\n".join(section_lines)
+
+        self._headers.sort()
+
+    def section(self, header: str) -> str:
+        """
+        Return a top level stanza of the config
+
+        Args:
+            header: first line of the stanza, i.e. "interface Management1"
+
+        Returns:
+            str: the stanza (header and all lines nested beneath it), or an empty string if there
+                is no such stanza
+
+        Raises:
+            N/A
+
+        """
+        return self.sections.get(header.strip(), "")
+
+    def _candidate_offsets(self, prefix: str, ignore_case: bool) -> List[int]:
+        """
+        Return the offsets of the stanza headers starting w/ a prefix, in config order
+
+        Args:
+            prefix: literal prefix of a pattern, lower cased if ignore_case
+            ignore_case: compare case insensitively
+
+        Returns:
+            list: offsets of the matching header lines
+
+        Raises:
+            N/A
+
+        """
+        lower_prefix = prefix.lower()
+        offsets = []
+        for lower_header, offset, header in self._headers[
+            bisect_left(self._headers, (lower_prefix,)) :
+        ]:
+            if not lower_header.startswith(lower_prefix):
+                break
+            if ignore_case or header.startswith(prefix):
+                offsets.append(offset)
+
+        return sorted(offsets)
+
+    def resolve(self, pattern: Union[str, Pattern[str]]) -> Optional[str]:
+        """
+        Resolve a substitute pattern against the config
+
+        If the pattern has capture groups the first group is the content for the substitute,
+        otherwise the whole match is. The result is always the same as searching the whole config,
+        patterns w/ an anchored literal prefix (see `_anchored_prefix`) are just only tried at the
+        stanzas that can match them.
+
+        Args:
+            pattern: substitute pattern, compiled or not
+
+        Returns:
+            str: content for the substitute, or None if the pattern does not match the config
+
+        Raises:
+            N/A
+
+        """
+        if pattern in self._resolved:
+            return self._resolved[pattern]
+
+        content: Optional[str] = None
+        compiled_pattern = re.compile(pattern) if isinstance(pattern, str) else pattern
+
+        prefix = _anchored_prefix(pattern=compiled_pattern)
+        if prefix is None:
+            match = compiled_pattern.search(self.config)
+        else:
+            match = None
+            for offset in self._candidate_offsets(
+                prefix=prefix, ignore_case=bool(compiled_pattern.flags & re.I)
+            ):
+                match = compiled_pattern.match(self.config, offset)
+                if match:
+                    break
+
+        if match:
+            groups = match.groups()
+            content = match.group() if not groups else groups[0] or ""
+
+        self._resolved[pattern] = content
+        return content
+
+
+def render_template(config_template: str, replacements: Mapping[str, str]) -> str:
+    """
+    Render jinja2-like "{{ name }}" variables of a template in a single pass
+
+    Variables that are not in the replacements are left as is, and any totally empty lines are
+    removed from the rendered config.
+
+    Args:
+        config_template: template to render
+        replacements: mapping of variable name to replacement content
+
+    Returns:
+        str: rendered config
+
+    Raises:
+        N/A
+
+    """
+    rendered_config = TEMPLATE_VARIABLE_PATTERN.sub(
+        lambda match: replacements.get(match.group("name"), match.group()), config_template
+    )
+
+    return "\n".join(line for line in rendered_config.splitlines() if line)
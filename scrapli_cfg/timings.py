@@ -0,0 +1,153 @@
+"""scrapli_cfg.timings"""
+
+import math
+from typing import Dict, List, Mapping, Sequence
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0)
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Return a percentile of the values, linearly interpolated between the closest ranks
+
+    Args:
+        values: values to compute the percentile of
+        pct: percentile to compute, 0 to 100
+
+    Returns:
+        float: the percentile
+
+    Raises:
+        ValueError: if there are no values or pct is not between 0 and 100
+
+    """
+    if not values:
+        raise ValueError("cannot compute a percentile of no values")
+    if not 0 <= pct <= 100:
+        raise ValueError("pct must be between 0 and 100")
+
+    sorted_values = sorted(values)
+    rank = (len(sorted_values) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+class TimingStats:
+    def __init__(self) -> None:
+        """
+        Per platform collection of the phase timings of scrapli_cfg responses
+
+        The fleets record the `timings` of each response they yield here (keyed by platform name,
+        i.e. "cisco_iosxe"), so the timings of a whole fleet run can be summarized into percentiles
+        per platform and phase -- making it easy to spot which phase of which platform is the real
+        bottleneck.
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        # platform -> phase -> elapsed seconds of each recorded response
+        self._samples: Dict[str, Dict[str, List[float]]] = {}
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for TimingStats class
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for class object
+
+        Raises:
+            N/A
+
+        """
+        return f"TimingStats <platforms: {len(self._samples)}, responses: {len(self)}>"
+
+    def __len__(self) -> int:
+        """
+        Magic len method for TimingStats class
+
+        Args:
+            N/A
+
+        Returns:
+            int: number of responses w/ a "total" timing that were recorded
+
+        Raises:
+            N/A
+
+        """
+        return sum(len(phases.get("total", [])) for phases in self._samples.values())
+
+    def record(self, platform: str, timings: Mapping[str, float]) -> None:
+        """
+        Record the phase timings of a response
+
+        Args:
+            platform: name of the platform the response is from
+            timings: phase name -> elapsed seconds, i.e. the `timings` of a ScrapliCfgResponse
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        platform_samples = self._samples.setdefault(platform, {})
+        for phase, elapsed_time in timings.items():
+            platform_samples.setdefault(phase, []).append(elapsed_time)
+
+    def clear(self) -> None:
+        """
+        Drop all recorded timings
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._samples.clear()
+
+    def percentiles(
+        self, percentiles: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Summarize the recorded timings into percentiles per platform and phase
+
+        Args:
+            percentiles: percentiles to compute, 0 to 100
+
+        Returns:
+            dict: platform -> phase -> {"count": number of samples, "p50": ..., "max": ...}, the
+                percentile keys are formatted w/o trailing zeros, i.e. "p50" and "p99.9"
+
+        Raises:
+            N/A
+
+        """
+        summary: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for platform, phases in self._samples.items():
+            for phase, values in phases.items():
+                phase_summary: Dict[str, float] = {"count": float(len(values))}
+                for pct in percentiles:
+                    phase_summary[f"p{pct:g}"] = percentile(values=values, pct=pct)
+                phase_summary["max"] = max(values)
+                summary.setdefault(platform, {})[phase] = phase_summary
+
+        return summary
@@ -0,0 +1,510 @@
+"""scrapli_cfg.tracing"""
+
+import inspect
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Sequence, Union
+
+from scrapli.response import MultiResponse, Response
+from scrapli_cfg.logging import logger
+
+# scrapli connection methods traced by `TracedConnection`, mapped to the argument holding the
+# channel input(s) of the operation
+TRACED_OPERATIONS = {
+    "send_command": "command",
+    "send_commands": "commands",
+    "send_config": "config",
+    "send_configs": "configs",
+    "send_interactive": "interact_events",
+    "acquire_priv": "desired_priv",
+}
+
+
+class TraceEvent:
+    __slots__ = (
+        "operation",
+        "host",
+        "command_count",
+        "bytes_sent",
+        "bytes_received",
+        "start_time",
+        "duration",
+        "failed",
+    )
+
+    def __init__(self, operation: str, host: str, channel_inputs: Sequence[str]) -> None:
+        """
+        Single device interaction (i.e. a `send_config`) as seen by the trace exporters
+
+        Exporters get the same event object on start and on end; `bytes_received`, `duration` and
+        `failed` are only set by the time the event ends.
+
+        Args:
+            operation: name of the operation, i.e. "send_config"
+            host: host the operation is for
+            channel_inputs: inputs sent to the device, used for the command count and bytes sent
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.operation = operation
+        self.host = host
+        self.command_count = len(channel_inputs)
+        # bytes of the inputs themselves, return characters are not counted
+        self.bytes_sent = sum(len(channel_input.encode()) for channel_input in channel_inputs)
+        self.bytes_received = 0
+        self.start_time = time.perf_counter()
+        self.duration: Optional[float] = None
+        self.failed = False
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for TraceEvent class
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for class object
+
+        Raises:
+            N/A
+
+        """
+        return (
+            f"TraceEvent <operation: {self.operation}, host: {self.host}, "
+            f"duration: {self.duration}>"
+        )
+
+    def record_result(self, result: Any) -> None:
+        """
+        Record the bytes received and status from the result of the operation
+
+        Args:
+            result: result of the operation, scrapli (multi)responses are recorded, anything else
+                (i.e. the None returned by `acquire_priv`) is ignored
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        responses: List[Response] = []
+        if isinstance(result, Response):
+            responses.append(result)
+        elif isinstance(result, MultiResponse):
+            responses.extend(result)
+
+        self.bytes_received += sum(len(response.raw_result) for response in responses)
+        self.failed = self.failed or any(response.failed for response in responses)
+
+
+class TraceExporter:
+    """
+    Base class for trace exporters -- implement `on_start` and/or `on_end` to receive events
+
+    Exporters are called synchronously from the operation being traced, so should be cheap; any
+    exception raised by an exporter is logged and otherwise ignored.
+
+    """
+
+    def on_start(self, event: TraceEvent) -> None:
+        """
+        Handle the start of a device interaction
+
+        Args:
+            event: event of the interaction
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+
+    def on_end(self, event: TraceEvent) -> None:
+        """
+        Handle the end of a device interaction, successful or not
+
+        Args:
+            event: event of the interaction
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+
+
+class InMemoryExporter(TraceExporter):
+    def __init__(self, max_events: Optional[int] = None) -> None:
+        """
+        Trace exporter keeping ended events in memory
+
+        Args:
+            max_events: optional maximum number of events to keep, the oldest events are dropped
+                first
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.events: Deque[TraceEvent] = deque(maxlen=max_events)
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for InMemoryExporter class
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for class object
+
+        Raises:
+            N/A
+
+        """
+        return f"InMemoryExporter <events: {len(self.events)}>"
+
+    def on_end(self, event: TraceEvent) -> None:
+        """
+        Keep the ended event
+
+        Args:
+            event: event of the interaction
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.events.append(event)
+
+    def clear(self) -> None:
+        """
+        Drop all kept events
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.events.clear()
+
+
+class OpenTelemetryExporter(TraceExporter):
+    def __init__(self, tracer: Any) -> None:
+        """
+        Trace exporter emitting an OpenTelemetry span per device interaction
+
+        Only the tracer api (`start_span`, `set_attribute` and `end`) is used, so opentelemetry is
+        not a dependency of scrapli_cfg -- pass a tracer from your own opentelemetry setup, i.e.
+        `opentelemetry.trace.get_tracer("scrapli_cfg")`.
+
+        Args:
+            tracer: opentelemetry tracer to create the spans with
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.tracer = tracer
+
+        # id of an event that has started -> span of the event
+        self._spans: Dict[int, Any] = {}
+
+    def on_start(self, event: TraceEvent) -> None:
+        """
+        Start the span of the interaction
+
+        Args:
+            event: event of the interaction
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self._spans[id(event)] = self.tracer.start_span(
+            name=f"scrapli_cfg.{event.operation}",
+            attributes={
+                "net.peer.name": event.host,
+                "scrapli_cfg.command_count": event.command_count,
+                "scrapli_cfg.bytes_sent": event.bytes_sent,
+            },
+        )
+
+    def on_end(self, event: TraceEvent) -> None:
+        """
+        End the span of the interaction
+
+        Args:
+            event: event of the interaction
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        span = self._spans.pop(id(event), None)
+        if span is None:
+            return
+
+        span.set_attribute("scrapli_cfg.bytes_received", event.bytes_received)
+        span.set_attribute("scrapli_cfg.failed", event.failed)
+        span.end()
+
+
+def _export(exporters: Sequence[TraceExporter], hook: str, event: TraceEvent) -> None:
+    """
+    Pass an event to a hook of every exporter, logging rather than raising exporter failures
+
+    Args:
+        exporters: exporters to pass the event to
+        hook: "on_start" or "on_end"
+        event: event to pass
+
+    Returns:
+        None
+
+    Raises:
+        N/A
+
+    """
+    for exporter in exporters:
+        try:
+            getattr(exporter, hook)(event)
+        except Exception as exc:  # pylint: disable=W0703
+            logger.warning(
+                f"trace exporter {exporter!r} failed {hook}, {type(exc).__name__}: {exc}"
+            )
+
+
+@contextmanager
+def traced(
+    exporters: Sequence[TraceExporter], operation: str, host: str, channel_inputs: Sequence[str]
+) -> Iterator[TraceEvent]:
+    """
+    Trace a device interaction, passing its start and end events to the exporters
+
+    Record the result of the interaction on the yielded event (`record_result`) before the context
+    exits; if the context exits via an exception the event is marked as failed.
+
+    Args:
+        exporters: exporters to pass the events to
+        operation: name of the operation, i.e. "send_config"
+        host: host the operation is for
+        channel_inputs: inputs sent to the device
+
+    Yields:
+        TraceEvent: event of the interaction
+
+    Raises:
+        BaseException: any exception raised in the context, re-raised once the event is failed
+
+    """
+    event = TraceEvent(operation=operation, host=host, channel_inputs=channel_inputs)
+    _export(exporters=exporters, hook="on_start", event=event)
+
+    try:
+        yield event
+    except BaseException:
+        event.failed = True
+        raise
+    finally:
+        event.duration = time.perf_counter() - event.start_time
+        _export(exporters=exporters, hook="on_end", event=event)
+
+
+def _channel_inputs(operation: str, args: Sequence[Any], kwargs: Dict[str, Any]) -> List[str]:
+    """
+    Return the channel inputs of a traced scrapli connection method call
+
+    Args:
+        operation: name of the connection method
+        args: positional arguments of the call
+        kwargs: keyword arguments of the call
+
+    Returns:
+        list: inputs sent to the device, empty for `acquire_priv`
+
+    Raises:
+        N/A
+
+    """
+    channel_input: Union[str, Sequence[Any], None] = kwargs.get(
+        TRACED_OPERATIONS[operation], args[0] if args else None
+    )
+
+    if channel_input is None or operation == "acquire_priv":
+        return []
+    if isinstance(channel_input, str):
+        return channel_input.splitlines() if operation == "send_config" else [channel_input]
+    if operation == "send_interactive":
+        return [interact_event[0] for interact_event in channel_input]
+    return list(channel_input)
+
+
+class TracedConnection:
+    def __init__(self, conn: Any, exporters: List[TraceExporter]) -> None:
+        """
+        Transparent proxy of a (sync or async) scrapli connection tracing its device interactions
+
+        Every call of the `TRACED_OPERATIONS` methods is traced to the exporters, everything else
+        (including setting attributes) is passed straight through to the wrapped connection.
+
+        Args:
+            conn: scrapli connection to wrap
+            exporters: exporters to pass the events to, the list is shared w/ the platform so
+                exporters can be added/removed at any time
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        object.__setattr__(self, "_conn", conn)
+        object.__setattr__(self, "_exporters", exporters)
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for TracedConnection class
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for class object
+
+        Raises:
+            N/A
+
+        """
+        return f"TracedConnection <{self._conn!r}>"
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Get an attribute of the wrapped connection, tracing the traced operations
+
+        Args:
+            name: name of the attribute
+
+        Returns:
+            Any: the attribute, or a tracing wrapper of it for the traced operations
+
+        Raises:
+            N/A
+
+        """
+        attr = getattr(self._conn, name)
+        if name not in TRACED_OPERATIONS or not self._exporters:
+            return attr
+
+        if inspect.iscoroutinefunction(attr):
+            return self._async_wrapper(operation=name, method=attr)
+        return self._sync_wrapper(operation=name, method=attr)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Set an attribute of the wrapped connection
+
+        Args:
+            name: name of the attribute
+            value: value to set
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        setattr(self._conn, name, value)
+
+    def _sync_wrapper(self, operation: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wrap a sync connection method so each call is traced
+
+        Args:
+            operation: name of the connection method
+            method: the bound connection method
+
+        Returns:
+            Callable: tracing wrapper of the method
+
+        Raises:
+            N/A
+
+        """
+
+        def _traced_method(*args: Any, **kwargs: Any) -> Any:
+            with traced(
+                exporters=self._exporters,
+                operation=operation,
+                host=self._conn.host,
+                channel_inputs=_channel_inputs(operation=operation, args=args, kwargs=kwargs),
+            ) as event:
+                result = method(*args, **kwargs)
+                event.record_result(result)
+            return result
+
+        return _traced_method
+
+    def _async_wrapper(self, operation: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wrap an async connection method so each call is traced
+
+        Args:
+            operation: name of the connection method
+            method: the bound connection method
+
+        Returns:
+            Callable: tracing wrapper of the method
+
+        Raises:
+            N/A
+
+        """
+
+        async def _traced_method(*args: Any, **kwargs: Any) -> Any:
+            with traced(
+                exporters=self._exporters,
+                operation=operation,
+                host=self._conn.host,
+                channel_inputs=_channel_inputs(operation=operation, args=args, kwargs=kwargs),
+            ) as event:
+                result = await method(*args, **kwargs)
+                event.record_result(result)
+            return result
+
+        return _traced_method
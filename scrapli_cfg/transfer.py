@@ -0,0 +1,774 @@
+"""scrapli_cfg.transfer"""
+
+import asyncio
+import hashlib
+import shlex
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from logging import getLogger
+from types import TracebackType
+from typing import Any, Dict, Optional, Type, Union
+
+from scrapli.driver import AsyncNetworkDriver, NetworkDriver
+from scrapli.response import Response
+from scrapli_cfg.exceptions import FileTransferError, FileTransferNotSupported, ScrapliCfgException
+
+TRANSFER_PROTOCOLS = ("sftp", "scp")
+
+SCP_OK = b"\x00"
+SCP_WARNING = b"\x01"
+SCP_ERROR = b"\x02"
+
+
+class FileTransferBase:
+    def __init__(self, protocol: str = "sftp", timeout: float = 60.0) -> None:
+        """
+        Candidate config file transfer base class
+
+        Args:
+            protocol: sftp|scp
+            timeout: seconds to allow for the transfer
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: if protocol is not supported or timeout is not positive
+
+        """
+        if protocol not in TRANSFER_PROTOCOLS:
+            raise ValueError(f"protocol must be one of {', '.join(TRANSFER_PROTOCOLS)}")
+        if timeout <= 0:
+            raise ValueError("timeout must be positive")
+
+        self.protocol = protocol
+        self.timeout = timeout
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for file transfer classes
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for class object
+
+        Raises:
+            N/A
+
+        """
+        return f"{self.__class__.__name__} <protocol: {self.protocol}, timeout: {self.timeout}>"
+
+    @staticmethod
+    def _get_session(conn: Union[NetworkDriver, AsyncNetworkDriver], required_attr: str) -> Any:
+        """
+        Return the ssh session of the scrapli transport to open the transfer channel on
+
+        Args:
+            conn: scrapli connection the candidate config is loaded over
+            required_attr: attribute the session must have for the transfer, used to tell ssh
+                libraries (and so scrapli transports) apart
+
+        Returns:
+            Any: paramiko `Transport` or asyncssh `SSHClientConnection` of the scrapli transport
+
+        Raises:
+            FileTransferNotSupported: if the scrapli transport has no (supported) ssh session
+
+        """
+        session = getattr(conn.transport, "session", None)
+        if session is None or not hasattr(session, required_attr):
+            raise FileTransferNotSupported(
+                f"transport '{conn.transport_name}' does not support file transfers, use the "
+                "paramiko (sync) or asyncssh (async) transport"
+            )
+
+        return session
+
+    @staticmethod
+    def _scp_header(payload: bytes, remote_path: str) -> bytes:
+        """
+        Build the scp "C" (create file) message for a payload
+
+        Args:
+            payload: content of the file to create
+            remote_path: path of the file on the device
+
+        Returns:
+            bytes: scp message
+
+        Raises:
+            N/A
+
+        """
+        filename = remote_path.replace(":", "/").rsplit("/", maxsplit=1)[-1]
+        return f"C0644 {len(payload)} {filename}\n".encode()
+
+    @staticmethod
+    def _scp_ack_complete(ack: bytes) -> bool:
+        """
+        Check if a complete acknowledgement of a scp message has been read
+
+        An acknowledgement is a single status byte, warnings and errors are followed by a message
+        terminated by a newline; either may arrive split over several reads.
+
+        Args:
+            ack: reply read from the scp channel so far
+
+        Returns:
+            bool: True if the acknowledgement is complete
+
+        Raises:
+            N/A
+
+        """
+        if not ack:
+            return False
+        return ack.startswith(SCP_OK) or b"\n" in ack
+
+    @staticmethod
+    def _check_scp_ack(ack: bytes) -> None:
+        """
+        Check the acknowledgement of a scp message
+
+        Args:
+            ack: complete reply read from the scp channel
+
+        Returns:
+            None
+
+        Raises:
+            FileTransferError: if the device did not acknowledge the message
+
+        """
+        if not ack:
+            raise FileTransferError("scp channel closed before acknowledging the message")
+        if not ack.startswith(SCP_OK):
+            message = ack.lstrip(SCP_WARNING + SCP_ERROR).decode(errors="ignore").strip()
+            raise FileTransferError(f"scp transfer refused: {message}")
+
+    @staticmethod
+    def _scp_command(remote_path: str) -> str:
+        """
+        Build the (sink mode) scp command writing to a remote path
+
+        Args:
+            remote_path: path of the file on the device
+
+        Returns:
+            str: scp command w/ the remote path shell quoted
+
+        Raises:
+            N/A
+
+        """
+        return f"scp -t {shlex.quote(remote_path)}"
+
+    def _pre_put(
+        self, conn: Union[NetworkDriver, AsyncNetworkDriver], remote_path: str
+    ) -> Response:
+        """
+        Handle pre "put" operations for parity between sync and async
+
+        Args:
+            conn: scrapli connection the candidate config is loaded over
+            remote_path: path of the file on the device
+
+        Returns:
+            Response: scrapli response object to record the transfer in
+
+        Raises:
+            N/A
+
+        """
+        conn.logger.info(f"transferring candidate config to '{remote_path}' over {self.protocol}")
+
+        return Response(host=conn.host, channel_input=f"{self.protocol} put {remote_path}")
+
+
+class FileTransfer(FileTransferBase):
+    def _read_scp_ack(self, channel: Any) -> None:
+        """
+        Read and check the acknowledgement of a scp message
+
+        Args:
+            channel: paramiko channel running the scp command
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        ack = b""
+        while not self._scp_ack_complete(ack=ack):
+            chunk = channel.recv(1024)
+            if not chunk:
+                break
+            ack += chunk
+        self._check_scp_ack(ack=ack)
+
+    def _put_sftp(self, session: Any, payload: bytes, remote_path: str) -> None:
+        """
+        Write a file over sftp
+
+        Args:
+            session: paramiko transport
+            payload: content of the file
+            remote_path: path of the file on the device
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        sftp_client = session.open_sftp_client()
+        try:
+            sftp_client.get_channel().settimeout(self.timeout)
+            with sftp_client.open(remote_path, "wb") as f:
+                f.write(payload)
+        finally:
+            sftp_client.close()
+
+    def _put_scp(self, session: Any, payload: bytes, remote_path: str) -> None:
+        """
+        Write a file over scp
+
+        Args:
+            session: paramiko transport
+            payload: content of the file
+            remote_path: path of the file on the device
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        channel = session.open_session(timeout=self.timeout)
+        try:
+            channel.settimeout(self.timeout)
+            channel.exec_command(self._scp_command(remote_path=remote_path))
+            self._read_scp_ack(channel=channel)
+            channel.sendall(self._scp_header(payload=payload, remote_path=remote_path))
+            self._read_scp_ack(channel=channel)
+            channel.sendall(payload + SCP_OK)
+            self._read_scp_ack(channel=channel)
+        finally:
+            channel.close()
+
+    def put(self, conn: NetworkDriver, config: str, remote_path: str) -> Response:
+        """
+        Write a candidate config file to a device
+
+        The file is opened on a new channel of the scrapli connection's own ssh session, so no
+        additional authentication is needed. Any existing file at the remote path is overwritten.
+
+        Args:
+            conn: scrapli connection the candidate config is loaded over, must use the paramiko
+                transport
+            config: content of the candidate config file
+            remote_path: path of the file on the device, i.e. "flash:scrapli_cfg_1234"
+
+        Returns:
+            Response: scrapli response object recording the transfer, failed if the transfer failed
+
+        Raises:
+            N/A
+
+        """
+        response = self._pre_put(conn=conn, remote_path=remote_path)
+        session = self._get_session(conn=conn, required_attr="open_sftp_client")
+
+        payload = config.encode()
+        put = self._put_sftp if self.protocol == "sftp" else self._put_scp
+
+        try:
+            put(session=session, payload=payload, remote_path=remote_path)
+        except Exception as exc:  # pylint: disable=W0703
+            conn.logger.critical(f"failed transferring candidate config, {exc}")
+            response.record_response(result=str(exc).encode())
+            response.failed = True
+            return response
+
+        response.record_response(result=f"transferred {len(payload)} bytes".encode())
+        return response
+
+
+class AsyncFileTransfer(FileTransferBase):
+    async def _read_scp_ack(self, process: Any) -> None:
+        """
+        Read and check the acknowledgement of a scp message
+
+        Args:
+            process: asyncssh process running the scp command
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        ack = b""
+        while not self._scp_ack_complete(ack=ack):
+            chunk = await process.stdout.read(1024)
+            if not chunk:
+                break
+            ack += chunk
+        self._check_scp_ack(ack=ack)
+
+    async def _put_sftp(self, session: Any, payload: bytes, remote_path: str) -> None:
+        """
+        Write a file over sftp
+
+        Args:
+            session: asyncssh connection
+            payload: content of the file
+            remote_path: path of the file on the device
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        async with session.start_sftp_client() as sftp_client:
+            async with sftp_client.open(remote_path, "wb") as f:
+                await f.write(payload)
+
+    async def _put_scp(self, session: Any, payload: bytes, remote_path: str) -> None:
+        """
+        Write a file over scp
+
+        Args:
+            session: asyncssh connection
+            payload: content of the file
+            remote_path: path of the file on the device
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        process = await session.create_process(
+            self._scp_command(remote_path=remote_path), encoding=None
+        )
+        try:
+            await self._read_scp_ack(process=process)
+            process.stdin.write(self._scp_header(payload=payload, remote_path=remote_path))
+            await self._read_scp_ack(process=process)
+            process.stdin.write(payload + SCP_OK)
+            await self._read_scp_ack(process=process)
+        finally:
+            process.close()
+
+    async def put(self, conn: AsyncNetworkDriver, config: str, remote_path: str) -> Response:
+        """
+        Write a candidate config file to a device
+
+        The file is opened on a new channel of the scrapli connection's own ssh session, so no
+        additional authentication is needed. Any existing file at the remote path is overwritten.
+
+        Args:
+            conn: scrapli connection the candidate config is loaded over, must use the asyncssh
+                transport
+            config: content of the candidate config file
+            remote_path: path of the file on the device, i.e. "flash:scrapli_cfg_1234"
+
+        Returns:
+            Response: scrapli response object recording the transfer, failed if the transfer failed
+
+        Raises:
+            N/A
+
+        """
+        response = self._pre_put(conn=conn, remote_path=remote_path)
+        session = self._get_session(conn=conn, required_attr="start_sftp_client")
+
+        payload = config.encode()
+        put = self._put_sftp if self.protocol == "sftp" else self._put_scp
+
+        try:
+            await asyncio.wait_for(
+                put(session=session, payload=payload, remote_path=remote_path),
+                timeout=self.timeout,
+            )
+        except Exception as exc:  # pylint: disable=W0703
+            conn.logger.critical(f"failed transferring candidate config, {exc}")
+            response.record_response(result=str(exc).encode())
+            response.failed = True
+            return response
+
+        response.record_response(result=f"transferred {len(payload)} bytes".encode())
+        return response
+
+
+class _CandidateFileRequestHandler(BaseHTTPRequestHandler):
+    server: "_CandidateFileHTTPServer"
+
+    def do_GET(self) -> None:  # pylint: disable=C0103
+        """
+        Serve a candidate config file by its digest
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        content = self.server.files.get(self.path.lstrip("/"))
+        if content is None:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=W0622
+        """
+        Send the request log to the scrapli_cfg logger rather than stderr
+
+        Args:
+            format: log message format
+            args: log message args
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.server.logger.debug(f"{self.address_string()} {format % args}")
+
+
+class _CandidateFileHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, host: str, port: int) -> None:
+        """
+        Threading http server holding the served candidate config files
+
+        Args:
+            host: address to listen on
+            port: port to listen on
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        super().__init__((host, port), _CandidateFileRequestHandler)
+
+        # digest -> content, shared by every handler thread
+        self.files: Dict[str, bytes] = {}
+        # digest -> number of `add`s not yet discarded; guards files against concurrent add/discard
+        self.references: Dict[str, int] = {}
+        self.files_lock = threading.Lock()
+        self.logger = getLogger("scrapli_cfg.transfer")
+
+
+class CandidateFileServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, advertise_host: str = "") -> None:
+        """
+        Short lived http server devices pull candidate config files from
+
+        Files are content addressed -- the url of a file is the sha256 digest of its content -- so
+        pushing the same (golden) config to any number of devices serves a single copy of it from
+        memory. One server is meant to be shared by all platforms of a fleet run, requests are
+        served from a thread per request. Files are reference counted, a file is served until
+        every `add` of it has been discarded.
+
+        The server listens on loopback only by default, set host to the address of the interface
+        facing the devices (or "0.0.0.0" to explicitly listen on all addresses) for real devices.
+
+        Args:
+            host: address to listen on, defaults to loopback
+            port: port to listen on, by default a free port is picked
+            advertise_host: address devices reach this host at, used to build the file urls;
+                defaults to host, or the hostname of this machine if listening on all addresses
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.host = host
+        self.port = port
+        self.advertise_host = advertise_host or (
+            host if host not in ("", "0.0.0.0", "::") else socket.gethostname()
+        )
+
+        self._server: Optional[_CandidateFileHTTPServer] = None
+        self._server_thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "CandidateFileServer":
+        """
+        Enter method for context manager
+
+        Args:
+            N/A
+
+        Returns:
+            CandidateFileServer: started server
+
+        Raises:
+            N/A
+
+        """
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """
+        Exit method to cleanup for context manager
+
+        Args:
+            exception_type: exception type being raised
+            exception_value: message from exception being raised
+            traceback: traceback from exception being raised
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.stop()
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for CandidateFileServer class
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for class object
+
+        Raises:
+            N/A
+
+        """
+        files = len(self._server.files) if self._server is not None else 0
+        return f"CandidateFileServer <url: {self.url}, files: {files}>"
+
+    @property
+    def url(self) -> str:
+        """
+        Base url of the server
+
+        Args:
+            N/A
+
+        Returns:
+            str: base url of the server
+
+        Raises:
+            N/A
+
+        """
+        return f"http://{self.advertise_host}:{self.port}"
+
+    def start(self) -> None:
+        """
+        Start serving files in a background thread
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        if self._server is not None:
+            return
+
+        self._server = _CandidateFileHTTPServer(host=self.host, port=self.port)
+        self.port = self._server.server_address[1]
+
+        self._server_thread = threading.Thread(
+            target=self._server.serve_forever, name="scrapli_cfg_file_server", daemon=True
+        )
+        self._server_thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop serving files and drop all files
+
+        Args:
+            N/A
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        if self._server is None:
+            return
+
+        self._server.shutdown()
+        self._server.server_close()
+        if self._server_thread is not None:
+            self._server_thread.join()
+
+        self._server = None
+        self._server_thread = None
+
+    def add(self, content: str) -> str:
+        """
+        Serve a file, adding the same content again only adds a reference to the served file
+
+        Args:
+            content: content of the file
+
+        Returns:
+            str: url of the file
+
+        Raises:
+            ScrapliCfgException: if the server is not started
+
+        """
+        if self._server is None:
+            raise ScrapliCfgException("file server not started, call start or use a with block")
+
+        payload = content.encode()
+        digest = hashlib.sha256(payload).hexdigest()
+        with self._server.files_lock:
+            self._server.files.setdefault(digest, payload)
+            self._server.references[digest] = self._server.references.get(digest, 0) + 1
+
+        return f"{self.url}/{digest}"
+
+    def discard(self, url: str) -> None:
+        """
+        Drop a reference to a file, the file stops being served once its last reference is dropped
+
+        Args:
+            url: url of the file as returned by `add`
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        if self._server is None:
+            return
+
+        digest = url.rsplit("/", maxsplit=1)[-1]
+        with self._server.files_lock:
+            references = self._server.references.pop(digest, 0) - 1
+            if references > 0:
+                self._server.references[digest] = references
+            else:
+                self._server.files.pop(digest, None)
+
+
+class PullTransfer:
+    def __init__(self, server: CandidateFileServer, vrf: str = "") -> None:
+        """
+        Candidate config transfer where the device pulls the file from a `CandidateFileServer`
+
+        Rather than writing the candidate config file line by line, load_config serves the file
+        and has the device copy it from the server with a single command. Works w/ any transport,
+        the device just needs to be able to reach the server.
+
+        Args:
+            server: (started) file server to serve candidate configs from, can be shared by any
+                number of platforms
+            vrf: vrf to copy the file in (nxos only)
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.server = server
+        self.vrf = vrf
+
+    def __repr__(self) -> str:
+        """
+        Magic repr method for PullTransfer class
+
+        Args:
+            N/A
+
+        Returns:
+            str: repr for class object
+
+        Raises:
+            N/A
+
+        """
+        return f"PullTransfer <server: {self.server.url}>"
+
+    def url(self, config: str) -> str:
+        """
+        Serve a candidate config file and return the url for the device to pull it from
+
+        Every url must be passed to `discard` once the device has copied (or failed to copy) the
+        file.
+
+        Args:
+            config: content of the candidate config file
+
+        Returns:
+            str: url of the candidate config file
+
+        Raises:
+            N/A
+
+        """
+        return self.server.add(content=config)
+
+    def discard(self, url: str) -> None:
+        """
+        Stop serving a candidate config file to this transfer
+
+        Args:
+            url: url of the candidate config file as returned by `url`
+
+        Returns:
+            None
+
+        Raises:
+            N/A
+
+        """
+        self.server.discard(url=url)
@@ -97,6 +97,9 @@ def dummy_logger():
         def debug(self, msg):
             pass
 
+        def warning(self, msg):
+            pass
+
         def critical(self, msg):
             pass
 
@@ -1,4 +1,16 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from scrapli.exceptions import ScrapliConnectionNotOpened, ScrapliTimeout
+from scrapli.response import MultiResponse, Response
+from scrapli_cfg.cache import ConfigCache
+from scrapli_cfg.diff import ScrapliCfgDiffResponse, generate_difflines
+from scrapli_cfg.facts import FactsCache
+from scrapli_cfg.helper import split_config_blocks
 from scrapli_cfg.response import ScrapliCfgResponse
+from scrapli_cfg.tracing import InMemoryExporter, TracedConnection
 
 
 async def test_open(async_cfg_object, monkeypatch):
@@ -46,6 +58,33 @@ async def test_open(async_cfg_object, monkeypatch):
     assert on_prepare_called is True
 
 
+async def test_open_cached_version(async_cfg_object, monkeypatch):
+    get_version_called = False
+
+    async def _open(cls):
+        pass
+
+    async def _get_version(cls):
+        nonlocal get_version_called
+        get_version_called = True
+
+    monkeypatch.setattr("scrapli.driver.base.async_driver.AsyncDriver.open", _open)
+    monkeypatch.setattr(
+        "scrapli_cfg.platform.core.cisco_iosxe.async_platform.AsyncScrapliCfgIOSXE.get_version",
+        _get_version,
+    )
+
+    async_cfg_object.facts_cache = FactsCache()
+    async_cfg_object.facts_cache.set(
+        host="localhost", port=async_cfg_object.conn.port, fact="version", value="16.12.03"
+    )
+    async_cfg_object.dedicated_connection = True
+    await async_cfg_object.prepare()
+
+    assert get_version_called is False
+    assert async_cfg_object._version_string == "16.12.03"
+
+
 async def test_close(async_cfg_object, monkeypatch):
     close_called = False
 
@@ -97,7 +136,7 @@ async def test_render_substituted_config(monkeypatch, async_cfg_object):
     """Asserts context manager properly opens/closes"""
     get_config_called = False
 
-    async def _get_config(cls, source):
+    async def _get_config(cls, source, sections=None):
         nonlocal get_config_called
         get_config_called = True
         response = ScrapliCfgResponse(host="localhost")
@@ -114,3 +153,400 @@ async def test_render_substituted_config(monkeypatch, async_cfg_object):
         substitutes=[("taco", "matchthisline")],
     )
     assert rendered_config == "something\nmatchthisline\nsomethingelse"
+
+
+async def test_get_config_cached(monkeypatch, async_cfg_object):
+    send_command_count = 0
+
+    async def _send_command(cls, command, **kwargs):
+        nonlocal send_command_count
+        send_command_count += 1
+        response = Response(host="localhost", channel_input=command)
+        response.record_response(b"hostname tacocat")
+        return response
+
+    monkeypatch.setattr(
+        "scrapli.driver.network.async_driver.AsyncNetworkDriver.send_command", _send_command
+    )
+
+    async_cfg_object.config_cache = ConfigCache()
+    async_cfg_object._prepared = True
+    async_cfg_object.ignore_version = True
+
+    first_response = await async_cfg_object.get_config()
+    assert await async_cfg_object.get_config() is first_response
+    assert send_command_count == 1
+
+    await async_cfg_object.cleanup()
+    async_cfg_object._prepared = True
+    await async_cfg_object.get_config()
+    assert send_command_count == 2
+
+
+async def test_get_config_sections(monkeypatch, async_cfg_object):
+    sent_commands = []
+
+    async def _send_commands(cls, commands, **kwargs):
+        multi_response = MultiResponse()
+        for command in commands:
+            sent_commands.append(command)
+            response = Response(host="localhost", channel_input=command)
+            response.record_response(
+                f"{command.split('| section ')[1]}\n description tacocat".encode()
+            )
+            multi_response.append(response)
+        return multi_response
+
+    monkeypatch.setattr(
+        "scrapli.driver.network.async_driver.AsyncNetworkDriver.send_commands", _send_commands
+    )
+
+    async_cfg_object.config_cache = ConfigCache()
+    async_cfg_object._prepared = True
+    async_cfg_object.ignore_version = True
+
+    response = await async_cfg_object.get_config(
+        sections=["interface GigabitEthernet1", "interface GigabitEthernet2"]
+    )
+    assert sent_commands == [
+        "show running-config | section interface GigabitEthernet1",
+        "show running-config | section interface GigabitEthernet2",
+    ]
+    assert response.result == (
+        "interface GigabitEthernet1\n description tacocat\n"
+        "interface GigabitEthernet2\n description tacocat"
+    )
+    assert len(response.scrapli_responses) == 2
+    # partial configs are never cached
+    assert len(async_cfg_object.config_cache) == 0
+
+
+@pytest.mark.parametrize(
+    "executor_class",
+    (
+        ThreadPoolExecutor,
+        ProcessPoolExecutor,
+    ),
+    ids=("thread", "process"),
+)
+async def test_post_diff_config_offloaded(async_cfg_object, executor_class):
+    source_config = "Building configuration...\nhostname tacocat\ninterface loopback1"
+    candidate_config = "hostname racecar\ninterface loopback1"
+
+    lazy_diff_response = await async_cfg_object._post_diff_config_offloaded(
+        diff_response=ScrapliCfgDiffResponse(host="localhost", source="running"),
+        scrapli_responses=[],
+        source_config=source_config,
+        candidate_config=candidate_config,
+        device_diff="",
+    )
+    assert lazy_diff_response._difflines_cache is None
+
+    with executor_class(max_workers=1) as executor:
+        async_cfg_object.cpu_executor = executor
+        diff_response = await async_cfg_object._post_diff_config_offloaded(
+            diff_response=ScrapliCfgDiffResponse(host="localhost", source="running"),
+            scrapli_responses=[],
+            source_config=source_config,
+            candidate_config=candidate_config,
+            device_diff="",
+        )
+
+    assert diff_response.source_config == async_cfg_object.clean_config(source_config) + "\n"
+    assert diff_response._difflines_cache is not None
+    assert diff_response._difflines == lazy_diff_response._difflines
+    assert diff_response.additions == lazy_diff_response.additions
+
+
+async def test_post_diff_config_offloaded_identical_configs(monkeypatch, async_cfg_object):
+    offloaded = []
+
+    async def _run_cpu_bound(func, *args, clean=False):
+        offloaded.append(func)
+        return func(*args)
+
+    monkeypatch.setattr(async_cfg_object, "_run_cpu_bound", _run_cpu_bound)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        async_cfg_object.cpu_executor = executor
+        diff_response = await async_cfg_object._post_diff_config_offloaded(
+            diff_response=ScrapliCfgDiffResponse(host="localhost", source="running"),
+            scrapli_responses=[],
+            source_config="hostname tacocat\ninterface loopback1",
+            candidate_config="hostname tacocat\ninterface loopback1",
+            device_diff="",
+        )
+
+    # only the configs are cleaned, identical configs are never diffed in the executor
+    assert generate_difflines not in offloaded
+    assert len(offloaded) == 2
+    assert async_cfg_object._candidate_unchanged is True
+    assert diff_response.additions == ""
+
+
+def _fake_fast_load_device(written, echo=True):
+    """Fake channel io of a device echoing every written line, failing "description bad" lines"""
+    echoed = 0
+    closed = False
+
+    def _close():
+        nonlocal closed
+        closed = True
+
+    def _write(channel_input):
+        written.append(channel_input)
+
+    def _send_return():
+        written.append("\n")
+
+    async def _read():
+        nonlocal echoed
+        if closed:
+            raise ScrapliConnectionNotOpened
+        if not echo:
+            await asyncio.sleep(0.01)
+            return b""
+
+        lines = "".join(written)[echoed:].split("\n")[:-1]
+        echoed += sum(len(line) + 1 for line in lines)
+        output = ""
+        for line in lines:
+            output += f"localhost(config-s-scrapli)#{line}\n"
+            if line == " description bad":
+                output += "% Invalid input detected at '^' marker.\n"
+        return f"{output}localhost(config-s-scrapli)#".encode()
+
+    return _write, _send_return, _read, _close
+
+
+@pytest.mark.parametrize(
+    "config,expected_failed",
+    [
+        (
+            # "% Invalid input" in the config text itself must not fail the response
+            "\n".join(f"interface Loopback{i}\n description % Invalid input" for i in range(10)),
+            False,
+        ),
+        ("interface Loopback1\n!\n description bad\n!\nexit", True),
+    ],
+    ids=["ok", "failed"],
+)
+async def test_send_config_fast_load(monkeypatch, async_cfg_object, config, expected_failed):
+    written = []
+    acquired_privs = []
+
+    async def _acquire_priv(desired_priv):
+        acquired_privs.append(desired_priv)
+
+    async_cfg_object.fast_load_block_size = 64
+    channel = async_cfg_object.conn.channel
+    _write, _send_return, _read, _ = _fake_fast_load_device(written=written)
+    monkeypatch.setattr(async_cfg_object.conn, "acquire_priv", _acquire_priv)
+    monkeypatch.setattr(channel, "write", _write)
+    monkeypatch.setattr(channel, "send_return", _send_return)
+    monkeypatch.setattr(channel, "read", _read)
+
+    response = await async_cfg_object._send_config_fast_load(
+        config=config, privilege_level="configuration"
+    )
+
+    assert acquired_privs == ["configuration"]
+    blocks = split_config_blocks(config=config, block_size=64)
+    # every block is followed by its own uniquely identified sync marker
+    assert len(written) == len(blocks) * 3
+    assert "".join(written[::3]) == f"{config}\n"
+    sync_markers = written[1::3]
+    assert all(marker.startswith("! scrapli_cfg fast load sync ") for marker in sync_markers)
+    assert len(set(sync_markers)) == len(blocks)
+    assert response.channel_input == config
+    # the echoed config (and the prompts) are stripped from the result, the raw output is kept
+    assert "description" not in response.result
+    assert b"description" in response.raw_result
+    assert response.failed is expected_failed
+    if expected_failed:
+        assert response.result == "% Invalid input detected at '^' marker."
+
+
+async def test_send_config_fast_load_timeout(monkeypatch, async_cfg_object):
+    written = []
+
+    async def _acquire_priv(desired_priv):
+        pass
+
+    channel = async_cfg_object.conn.channel
+    _write, _send_return, _read, _close = _fake_fast_load_device(written=written, echo=False)
+    monkeypatch.setattr(async_cfg_object.conn, "acquire_priv", _acquire_priv)
+    monkeypatch.setattr(channel, "write", _write)
+    monkeypatch.setattr(channel, "send_return", _send_return)
+    monkeypatch.setattr(channel, "read", _read)
+    monkeypatch.setattr(channel.transport, "close", _close)
+    monkeypatch.setattr(channel._base_channel_args, "timeout_ops", 0.2)
+
+    with pytest.raises(ScrapliTimeout):
+        await async_cfg_object._send_config_fast_load(
+            config="interface Loopback1", privilege_level="configuration"
+        )
+
+
+def test_add_trace_exporter(async_cfg_object):
+    exporter = InMemoryExporter()
+    scrapli_conn = async_cfg_object.conn
+
+    async_cfg_object.add_trace_exporter(exporter=exporter)
+    async_cfg_object.add_trace_exporter(exporter=InMemoryExporter())
+
+    assert isinstance(async_cfg_object.conn, TracedConnection)
+    assert async_cfg_object.conn._conn is scrapli_conn
+    assert len(async_cfg_object.trace_exporters) == 2
+
+
+async def test_render_remediation_config(monkeypatch, async_cfg_object):
+    async def _get_config(source="running", sections=None):
+        response = ScrapliCfgResponse(host="localhost")
+        response.record_response(scrapli_responses=[])
+        response.result = "hostname tacocat\n!\ninterface Loopback0\n description one\n!\nend"
+        return response
+
+    monkeypatch.setattr(async_cfg_object, "get_config", _get_config)
+
+    remediation = await async_cfg_object.render_remediation_config(
+        config="hostname tacocat\n!\ninterface Loopback0\n description two\n!\nend"
+    )
+    assert remediation == "interface Loopback0\n no description one\n description two"
+
+
+async def test_commit_config_skips_noop(monkeypatch, async_cfg_object):
+    abort_called = False
+
+    async def _abort_config():
+        nonlocal abort_called
+        abort_called = True
+        response = ScrapliCfgResponse(host="localhost")
+        response.record_response(scrapli_responses=[])
+        return response
+
+    monkeypatch.setattr(async_cfg_object, "abort_config", _abort_config)
+
+    async_cfg_object._prepared = True
+    async_cfg_object.ignore_version = True
+    async_cfg_object.candidate_config_filename = "scrapli_cfg_candidate"
+    async_cfg_object.skip_noop_commits = True
+    async_cfg_object._candidate_unchanged = True
+
+    response = await async_cfg_object.commit_config()
+
+    assert abort_called is True
+    assert response.failed is False
+
+
+@pytest.mark.parametrize(
+    "test_data",
+    (
+        (False, False, None, ["load", "diff", "commit"], True),
+        (False, True, None, ["load", "diff", "abort"], False),
+        (False, False, lambda diff_response: False, ["load", "diff", "abort"], False),
+        (True, False, None, ["load", "abort"], False),
+    ),
+    ids=["changed", "unchanged", "commit_if_rejected", "load_failed"],
+)
+async def test_apply(monkeypatch, async_cfg_object, test_data):
+    load_failed, unchanged, commit_if, expected_phases, expected_committed = test_data
+    called = []
+
+    def _response(operation, failed=False):
+        called.append(operation)
+        scrapli_response = Response(host="localhost", channel_input=operation)
+        scrapli_response.failed = failed
+        response = ScrapliCfgResponse(host="localhost")
+        response.record_response(scrapli_responses=[scrapli_response])
+        return response
+
+    async def _load_config(config, replace=False, **kwargs):
+        # facts are memoized for the duration of the apply
+        assert async_cfg_object.memoize_facts is True
+        async_cfg_object._session_facts["file_prompt_mode"] = "quiet"
+        return _response(operation="load", failed=load_failed)
+
+    async def _diff_config(source="running", mode="full"):
+        assert mode == "full"
+        async_cfg_object._candidate_unchanged = unchanged
+        return _response(operation="diff")
+
+    async def _commit_config(source="running"):
+        return _response(operation="commit")
+
+    async def _abort_config():
+        return _response(operation="abort")
+
+    monkeypatch.setattr(async_cfg_object, "load_config", _load_config)
+    monkeypatch.setattr(async_cfg_object, "diff_config", _diff_config)
+    monkeypatch.setattr(async_cfg_object, "commit_config", _commit_config)
+    monkeypatch.setattr(async_cfg_object, "abort_config", _abort_config)
+
+    async_cfg_object._prepared = True
+    async_cfg_object.ignore_version = True
+
+    response = await async_cfg_object.apply(config="interface Loopback0", commit_if=commit_if)
+
+    assert called == expected_phases
+    assert list(response.phases) == expected_phases
+    assert set(response.timings) == {*expected_phases, "total"}
+    assert response.round_trips == len(expected_phases)
+    assert response.committed is expected_committed
+    assert response.failed is load_failed
+    assert async_cfg_object.memoize_facts is False
+    assert async_cfg_object._session_facts == {}
+
+
+@pytest.mark.parametrize(
+    "failing_phase",
+    ("commit_if", "commit"),
+)
+async def test_apply_exception_aborts(monkeypatch, async_cfg_object, failing_phase):
+    called = []
+
+    def _response(operation):
+        called.append(operation)
+        scrapli_response = Response(host="localhost", channel_input=operation)
+        scrapli_response.failed = False
+        response = ScrapliCfgResponse(host="localhost")
+        response.record_response(scrapli_responses=[scrapli_response])
+        return response
+
+    async def _load_config(config, replace=False, **kwargs):
+        return _response(operation="load")
+
+    async def _diff_config(source="running", mode="full"):
+        assert mode == "device"
+        return _response(operation="diff")
+
+    async def _commit_config(source="running"):
+        called.append("commit")
+        raise ScrapliTimeout
+
+    async def _abort_config():
+        return _response(operation="abort")
+
+    def _commit_if(diff_response):
+        if failing_phase == "commit_if":
+            raise ValueError
+        return True
+
+    monkeypatch.setattr(async_cfg_object, "load_config", _load_config)
+    monkeypatch.setattr(async_cfg_object, "diff_config", _diff_config)
+    monkeypatch.setattr(async_cfg_object, "commit_config", _commit_config)
+    monkeypatch.setattr(async_cfg_object, "abort_config", _abort_config)
+
+    async_cfg_object._prepared = True
+    async_cfg_object.ignore_version = True
+
+    with pytest.raises(ValueError if failing_phase == "commit_if" else ScrapliTimeout):
+        await async_cfg_object.apply(
+            config="interface Loopback0", commit_if=_commit_if, diff_mode="device"
+        )
+
+    expected_phases = ["load", "diff", "abort"]
+    if failing_phase == "commit":
+        expected_phases.insert(2, "commit")
+    assert called == expected_phases
+    assert async_cfg_object.memoize_facts is False
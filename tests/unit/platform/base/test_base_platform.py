@@ -1,6 +1,7 @@
 import pytest
 
 from scrapli.response import Response
+from scrapli_cfg.cache import ConfigCache
 from scrapli_cfg.exceptions import (
     AbortConfigError,
     CommitConfigError,
@@ -9,6 +10,7 @@ from scrapli_cfg.exceptions import (
     TemplateError,
     VersionError,
 )
+from scrapli_cfg.facts import FactsCache
 from scrapli_cfg.response import ScrapliCfgResponse
 
 
@@ -30,6 +32,19 @@ def test_render_substituted_config_multiple_substitutes(base_cfg_object):
     assert result == "notinthesource\nFOO\nBAR\nalsonotinthesource"
 
 
+def test_render_substituted_config_reuses_section_index(base_cfg_object):
+    source_config = "something\nFOO\nBAR\nsomethingelse"
+    for config_template in ("{{ taco }}\n{{ bell }}", "{{ bell }}\n{{ taco }}"):
+        base_cfg_object._render_substituted_config(
+            config_template=config_template,
+            substitutes=[("taco", "FOO"), ("bell", "BAR")],
+            source_config=source_config,
+        )
+    section_index = base_cfg_object._section_index
+    assert base_cfg_object._get_section_index(source_config=source_config) is section_index
+    assert base_cfg_object._get_section_index(source_config="hostname racecar") is not section_index
+
+
 def test_render_substituted_config_no_substitutes(base_cfg_object):
     with pytest.raises(TemplateError):
         base_cfg_object._render_substituted_config(
@@ -90,6 +105,57 @@ def test_post_get_version(base_cfg_object):
     assert post_get_version_response.result == "blah"
 
 
+def test_post_get_version_refreshes_facts(base_cfg_object):
+    base_cfg_object.facts_cache = FactsCache()
+    base_cfg_object._set_fact(fact="version", value="16.12.03")
+    base_cfg_object._set_fact(fact="file_prompt_mode", value="quiet")
+
+    scrapli_response = Response(host="localhost", channel_input="show version")
+    scrapli_response.failed = False
+    base_cfg_object._post_get_version(
+        response=ScrapliCfgResponse(host="localhost"),
+        scrapli_responses=[scrapli_response],
+        result="17.3.1",
+    )
+
+    # the version disagreed w/ the cached version so all other facts are dropped
+    assert base_cfg_object._get_fact(fact="version") == "17.3.1"
+    assert base_cfg_object._get_fact(fact="file_prompt_mode") is None
+
+
+def test_session_facts(base_cfg_object):
+    base_cfg_object.facts_cache = FactsCache()
+    base_cfg_object._set_fact(fact="version", value="16.12.03")
+
+    # without memoizing facts come straight from the facts cache
+    assert base_cfg_object._get_fact(fact="version") == "16.12.03"
+    assert base_cfg_object._session_facts == {}
+
+    base_cfg_object.memoize_facts = True
+    assert base_cfg_object._get_fact(fact="version") == "16.12.03"
+    assert base_cfg_object._session_facts == {"version": "16.12.03"}
+
+    # volatile facts are memoized for the session only
+    base_cfg_object._set_fact(fact="filesystem_space_available", value="1000", persist=False)
+    base_cfg_object._adjust_filesystem_space_available(delta=-100)
+    assert base_cfg_object._get_fact(fact="filesystem_space_available") == "900"
+    # a failed write/delete leaves the space available unknown, so the memo is dropped
+    base_cfg_object._adjust_filesystem_space_available(delta=-100, failed=True)
+    assert base_cfg_object._get_fact(fact="filesystem_space_available") is None
+    base_cfg_object._set_fact(fact="filesystem_space_available", value="900", persist=False)
+    assert (
+        base_cfg_object.facts_cache.get(
+            host="localhost", port=22, fact="filesystem_space_available"
+        )
+        is None
+    )
+
+    base_cfg_object._invalidate_facts(facts=["filesystem_space_available"])
+    assert base_cfg_object._get_fact(fact="filesystem_space_available") is None
+    base_cfg_object._invalidate_facts()
+    assert base_cfg_object._get_fact(fact="version") is None
+
+
 def test_pre_get_config(base_cfg_object):
     r = base_cfg_object._pre_get_config(source="running")
     assert isinstance(r, ScrapliCfgResponse)
@@ -114,6 +180,104 @@ def test_post_get_config(base_cfg_object):
     assert post_get_config_response.result == "blah"
 
 
+def test_post_get_config_cached(base_cfg_object):
+    base_cfg_object.config_cache = ConfigCache()
+    scrapli_response = Response(host="localhost", channel_input="show running-config")
+    scrapli_response.failed = False
+    post_get_config_response = base_cfg_object._post_get_config(
+        response=ScrapliCfgResponse(host="localhost"),
+        scrapli_responses=[scrapli_response],
+        result="blah",
+        source="running",
+    )
+    assert base_cfg_object._get_cached_config(source="running") is post_get_config_response
+    assert base_cfg_object._get_cached_config(source="startup") is None
+
+    base_cfg_object._pre_commit_config(source="running", session_or_config_file=True)
+    assert base_cfg_object._get_cached_config(source="running") is None
+
+
+def test_post_get_config_failed_not_cached(base_cfg_object):
+    base_cfg_object.config_cache = ConfigCache()
+    base_cfg_object._post_get_config(
+        response=ScrapliCfgResponse(host="localhost"),
+        scrapli_responses=[Response(host="localhost", channel_input="show running-config")],
+        result="blah",
+        source="running",
+    )
+    assert base_cfg_object._get_cached_config(source="running") is None
+
+
+def test_pre_get_config_fingerprint(base_cfg_object):
+    r = base_cfg_object._pre_get_config_fingerprint(source="running")
+    assert isinstance(r, ScrapliCfgResponse)
+
+
+def test_pre_get_config_fingerprint_exception(base_cfg_object):
+    with pytest.raises(InvalidConfigTarget):
+        base_cfg_object._pre_get_config_fingerprint(source="tacocat")
+
+
+def test_post_get_config_fingerprint_no_fingerprint(base_cfg_object):
+    scrapli_response = Response(host="localhost", channel_input="verify /md5 system:running-config")
+    scrapli_response.failed = False
+    post_response = base_cfg_object._post_get_config_fingerprint(
+        response=ScrapliCfgResponse(host="localhost"),
+        scrapli_responses=[scrapli_response],
+        result="",
+        source="running",
+    )
+    assert post_response.failed is True
+
+
+def test_config_fingerprint_changed(base_cfg_object):
+    base_cfg_object.config_cache = ConfigCache()
+
+    def _fingerprint_response(fingerprint):
+        scrapli_response = Response(host="localhost", channel_input="fingerprint")
+        scrapli_response.failed = False
+        return base_cfg_object._post_get_config_fingerprint(
+            response=ScrapliCfgResponse(host="localhost"),
+            scrapli_responses=[scrapli_response],
+            result=fingerprint,
+            source="running",
+        )
+
+    # first check has nothing to compare against
+    assert base_cfg_object._config_fingerprint_changed(
+        source="running", response=_fingerprint_response("abc")
+    )
+    base_cfg_object.config_cache.set(
+        host="localhost", port=22, source="running", response=ScrapliCfgResponse(host="localhost")
+    )
+    base_cfg_object.facts_cache = FactsCache()
+    base_cfg_object._set_fact(fact="version", value="16.12.03")
+    base_cfg_object._set_fact(fact="file_prompt_mode", value="quiet")
+    assert not base_cfg_object._config_fingerprint_changed(
+        source="running", response=_fingerprint_response("abc")
+    )
+    assert base_cfg_object._get_cached_config(source="running") is not None
+
+    assert base_cfg_object._config_fingerprint_changed(
+        source="running", response=_fingerprint_response("def")
+    )
+    assert base_cfg_object._get_cached_config(source="running") is None
+    # config derived facts are dropped w/ the config, the version is not config derived
+    assert base_cfg_object._get_fact(fact="file_prompt_mode") is None
+    assert base_cfg_object._get_fact(fact="version") == "16.12.03"
+    assert base_cfg_object.config_fingerprints == {"running": "def"}
+
+    assert not base_cfg_object._config_fingerprint_changed(
+        source="running", response=_fingerprint_response("xyz"), fingerprint="xyz"
+    )
+
+    # a failed fingerprint fetch is always a change
+    assert base_cfg_object._config_fingerprint_changed(
+        source="running", response=_fingerprint_response("")
+    )
+    assert base_cfg_object.config_fingerprints == {}
+
+
 def test_pre_load_config(base_cfg_object):
     r = base_cfg_object._pre_load_config(config="newconfig")
     assert base_cfg_object.candidate_config == "newconfig"
@@ -191,6 +355,30 @@ def test_pre_diff_config_exception_no_session_or_config(base_cfg_object):
         base_cfg_object._pre_diff_config(source="running", session_or_config_file=False)
 
 
+def test_pre_diff_config_exception_invalid_mode(base_cfg_object):
+    with pytest.raises(DiffConfigError):
+        base_cfg_object._pre_diff_config(
+            source="running", session_or_config_file=True, mode="tacocat"
+        )
+
+
+def test_post_diff_config_device_difflines(diff_obj, base_cfg_object):
+    scrapli_response = Response(host="localhost", channel_input="diff a config")
+    scrapli_response.failed = False
+    post_diff_response = base_cfg_object._post_diff_config(
+        diff_response=diff_obj,
+        scrapli_responses=[scrapli_response],
+        source_config="",
+        candidate_config="candidate config",
+        device_diff="+candidate config",
+        device_difflines=["+ candidate config\n"],
+    )
+    assert post_diff_response.failed is False
+    assert post_diff_response.source_config == "\n"
+    assert post_diff_response.additions == "candidate config\n"
+    assert post_diff_response.subtractions == ""
+
+
 def test_post_diff_config(diff_obj, base_cfg_object):
     scrapli_response = Response(host="localhost", channel_input="diff a config")
     source_config = "source config"
@@ -204,3 +392,96 @@ def test_post_diff_config(diff_obj, base_cfg_object):
         device_diff=device_diff,
     )
     assert post_diff_response.failed is True
+
+
+def test_post_diff_config_identical_configs(diff_obj, base_cfg_object):
+    def _diff_backend(source_lines, candidate_lines):
+        raise AssertionError("identical configs should not be diffed")
+
+    diff_obj.diff_backend = _diff_backend
+    scrapli_response = Response(host="localhost", channel_input="diff a config")
+    scrapli_response.failed = False
+    post_diff_response = base_cfg_object._post_diff_config(
+        diff_response=diff_obj,
+        scrapli_responses=[scrapli_response],
+        source_config="interface Loopback0\n description tacocat",
+        candidate_config="interface Loopback0\n description tacocat",
+        device_diff="",
+    )
+    assert post_diff_response.failed is False
+    assert post_diff_response.additions == ""
+    assert post_diff_response.subtractions == ""
+    assert base_cfg_object._candidate_unchanged is True
+
+
+def test_post_diff_config_whitespace_changes(diff_obj, base_cfg_object):
+    base_cfg_object._candidate_unchanged = True
+    scrapli_response = Response(host="localhost", channel_input="diff a config")
+    scrapli_response.failed = False
+    post_diff_response = base_cfg_object._post_diff_config(
+        diff_response=diff_obj,
+        scrapli_responses=[scrapli_response],
+        source_config="banner motd ^C\ntacocat\n^C",
+        candidate_config="banner motd ^C\ntacocat\n\nracecar  \n^C",
+        device_diff="",
+    )
+    # blank lines and trailing whitespace inside a banner are real changes, never a no-op
+    assert base_cfg_object._candidate_unchanged is False
+    assert post_diff_response.additions == "\nracecar  \n"
+
+
+def test_post_diff_config_changed_configs(diff_obj, base_cfg_object):
+    base_cfg_object._candidate_unchanged = True
+    scrapli_response = Response(host="localhost", channel_input="diff a config")
+    scrapli_response.failed = False
+    base_cfg_object._post_diff_config(
+        diff_response=diff_obj,
+        scrapli_responses=[scrapli_response],
+        source_config="interface Loopback0\n description tacocat",
+        candidate_config="interface Loopback0\n description racecar",
+        device_diff="",
+    )
+    assert base_cfg_object._candidate_unchanged is False
+
+
+def test_commit_is_noop(base_cfg_object):
+    base_cfg_object._candidate_unchanged = True
+    assert base_cfg_object._commit_is_noop() is False
+
+    base_cfg_object.skip_noop_commits = True
+    assert base_cfg_object._commit_is_noop() is True
+
+    # loading a new candidate always resets the unchanged state
+    base_cfg_object._prepared = True
+    base_cfg_object._pre_load_config(config="interface Loopback0")
+    assert base_cfg_object._commit_is_noop() is False
+
+
+def test_apply_should_commit(diff_obj, base_cfg_object):
+    assert base_cfg_object._apply_should_commit(diff_response=diff_obj, commit_if=None) is True
+    assert (
+        base_cfg_object._apply_should_commit(
+            diff_response=diff_obj, commit_if=lambda diff_response: False
+        )
+        is False
+    )
+
+    base_cfg_object._candidate_unchanged = True
+    assert base_cfg_object._apply_should_commit(diff_response=diff_obj, commit_if=None) is False
+
+
+def test_post_load_config_retain_summary(base_cfg_object):
+    base_cfg_object.retain = "summary"
+    base_cfg_object._prepared = True
+
+    load_config_response = base_cfg_object._pre_load_config(config="interface Loopback0")
+    scrapli_response = Response(host="localhost", channel_input="interface Loopback0")
+    scrapli_response.record_response(result=b"")
+    post_load_config_response = base_cfg_object._post_load_config(
+        response=load_config_response, scrapli_responses=[scrapli_response]
+    )
+
+    assert post_load_config_response.failed is False
+    assert post_load_config_response.retain == "summary"
+    assert post_load_config_response.scrapli_responses == []
+    assert post_load_config_response.commands == ["interface Loopback0"]
@@ -64,6 +64,15 @@ def test_parse_version_no_match(eos_base_cfg_object):
     assert actual_version_string == ""
 
 
+def test_parse_config_fingerprint(eos_base_cfg_object):
+    device_output = """9b2cf5f5d2b1a0c6e34cb6a0b7a4d0b9  -
+"""
+    assert eos_base_cfg_object._parse_config_fingerprint(device_output=device_output) == (
+        "9b2cf5f5d2b1a0c6e34cb6a0b7a4d0b9"
+    )
+    assert eos_base_cfg_object._parse_config_fingerprint(device_output="blah") == ""
+
+
 def test_config_sessions(eos_base_cfg_object):
     actual_config_session_list = eos_base_cfg_object._parse_config_sessions(
         device_output=EOS_CONFIG_SESSION_OUTPUT
@@ -95,6 +104,13 @@ def test_get_config_command(eos_base_cfg_object, test_data):
     assert eos_base_cfg_object._get_config_command(source=source) == expected_command
 
 
+def test_get_config_command_section(eos_base_cfg_object):
+    assert (
+        eos_base_cfg_object._get_config_command(source="running", section="interface Management1")
+        == "show running-config | section interface Management1"
+    )
+
+
 def test_prepare_config_payloads(eos_base_cfg_object):
     actual_regular_config, actual_eager_config = eos_base_cfg_object._prepare_config_payloads(
         config=CONFIG_PAYLOAD
@@ -164,3 +180,29 @@ def test_pre_and_post_clear_config_sessions(eos_base_cfg_object, dummy_logger):
         response=pre_response, scrapli_responses=[scrapli_response]
     )
     assert post_response.result == "configuration session(s) cleared"
+
+
+EOS_DEVICE_DIFF = """--- system:/running-config
++++ session:/scrapli_cfg_session-session-config
+@@ -245,6 +245,9 @@
+    ipv6 nd ra rx accept default-route
+ !
++interface Loopback1
++   description tacocat
++!
+ interface Management1
+-   description tacocat
+"""
+
+
+def test_parse_device_diff(eos_base_cfg_object, dummy_logger):
+    eos_base_cfg_object.logger = dummy_logger
+    assert eos_base_cfg_object._parse_device_diff(device_diff=EOS_DEVICE_DIFF) == [
+        "     ipv6 nd ra rx accept default-route\n",
+        "  !\n",
+        "+ interface Loopback1\n",
+        "+    description tacocat\n",
+        "+ !\n",
+        "  interface Management1\n",
+        "-    description tacocat\n",
+    ]
@@ -113,6 +113,19 @@ def test_post_determine_file_prompt_mode(iosxe_base_cfg_object, dummy_logger):
     )
 
 
+def test_file_prompt_mode_may_change(iosxe_base_cfg_object):
+    iosxe_base_cfg_object._replace = False
+    iosxe_base_cfg_object.candidate_config = "interface Loopback0\n description tacocat"
+    assert iosxe_base_cfg_object._file_prompt_mode_may_change() is False
+
+    iosxe_base_cfg_object.candidate_config = "file prompt quiet"
+    assert iosxe_base_cfg_object._file_prompt_mode_may_change() is True
+
+    iosxe_base_cfg_object.candidate_config = "interface Loopback0\n description tacocat"
+    iosxe_base_cfg_object._replace = True
+    assert iosxe_base_cfg_object._file_prompt_mode_may_change() is True
+
+
 def test_parse_version_success(iosxe_base_cfg_object):
     actual_version_string = iosxe_base_cfg_object._parse_version(
         device_output=IOSXE_SHOW_VERSION_OUTPUT
@@ -125,6 +138,16 @@ def test_parse_version_no_match(iosxe_base_cfg_object):
     assert actual_version_string == ""
 
 
+def test_parse_config_fingerprint(iosxe_base_cfg_object):
+    device_output = """.............................Done!
+verify /md5 (system:running-config) = 3e8c5bb0bd4ba6a8a7e1e5e2a6b7f0d1
+"""
+    assert iosxe_base_cfg_object._parse_config_fingerprint(device_output=device_output) == (
+        "3e8c5bb0bd4ba6a8a7e1e5e2a6b7f0d1"
+    )
+    assert iosxe_base_cfg_object._parse_config_fingerprint(device_output="blah") == ""
+
+
 def test_clean_config(iosxe_base_cfg_object, dummy_logger):
     iosxe_base_cfg_object.logger = dummy_logger
     assert iosxe_base_cfg_object.clean_config(config=CONFIG_PAYLOAD) == "version 16.12"
@@ -160,6 +183,15 @@ def test_get_config_command(iosxe_base_cfg_object, test_data):
     assert iosxe_base_cfg_object._get_config_command(source=source) == expected_command
 
 
+def test_get_config_command_section(iosxe_base_cfg_object):
+    assert (
+        iosxe_base_cfg_object._get_config_command(
+            source="running", section="interface GigabitEthernet1"
+        )
+        == "show running-config | section interface GigabitEthernet1"
+    )
+
+
 @pytest.mark.parametrize(
     "test_data",
     (
@@ -197,6 +229,27 @@ def test_prepare_config_payloads(iosxe_base_cfg_object):
     )
 
 
+def test_get_pull_events(iosxe_base_cfg_object):
+    iosxe_base_cfg_object.filesystem = "flash:"
+    iosxe_base_cfg_object.candidate_config_filename = "scrapli_cfg_candidate"
+    pull_command = "copy http://10.0.0.1:8080/abc flash:scrapli_cfg_candidate"
+
+    assert iosxe_base_cfg_object._get_pull_events(
+        url="http://10.0.0.1:8080/abc", file_prompt_mode=FilePromptMode.QUIET
+    ) == [(pull_command, "")]
+    assert iosxe_base_cfg_object._get_pull_events(
+        url="http://10.0.0.1:8080/abc", file_prompt_mode=FilePromptMode.ALERT
+    ) == [(pull_command, "Destination filename"), ("", "")]
+    assert (
+        len(
+            iosxe_base_cfg_object._get_pull_events(
+                url="http://10.0.0.1:8080/abc", file_prompt_mode=FilePromptMode.NOISY
+            )
+        )
+        == 4
+    )
+
+
 def test_prepare_load_config(iosxe_base_cfg_object, dummy_logger):
     iosxe_base_cfg_object.logger = dummy_logger
     iosxe_base_cfg_object.candidate_config_filename = ""
@@ -210,3 +263,48 @@ def test_prepare_load_config(iosxe_base_cfg_object, dummy_logger):
     # config is what we think it shoudl be
     assert actual_config.startswith("""puts [open "flash:scrapli_cfg_""")
     assert actual_config.endswith("""w+] {\ninterface loopback123\n  description tacocat\n}""")
+
+
+IOSXE_REPLACE_DEVICE_DIFF = """!Contextual Config Diffs:
+interface loopback1
+ +description racecar
+ -description tacocat
++license udi pid CSR1000V sn 9MVVU09YZFH
+-license udi pid CSR1000V sn 9FK0UZW73QE
+"""
+IOSXE_MERGE_DEVICE_DIFF = """!List of Commands:
+interface loopback1
+description tacocat
+end
+"""
+
+
+@pytest.mark.parametrize(
+    "test_data",
+    (
+        (
+            True,
+            IOSXE_REPLACE_DEVICE_DIFF,
+            [
+                "  interface loopback1\n",
+                "+  description racecar\n",
+                "-  description tacocat\n",
+                "+ license udi pid CSR1000V sn 9MVVU09YZFH\n",
+                "- license udi pid CSR1000V sn 9FK0UZW73QE\n",
+            ],
+        ),
+        (
+            False,
+            IOSXE_MERGE_DEVICE_DIFF,
+            ["+ interface loopback1\n", "+ description tacocat\n"],
+        ),
+        (True, "!No changes were found\n", []),
+        (True, "%Error opening flash:nope (File not found)", None),
+    ),
+    ids=("replace", "merge", "no_changes", "error"),
+)
+def test_parse_device_diff(iosxe_base_cfg_object, dummy_logger, test_data):
+    iosxe_base_cfg_object.logger = dummy_logger
+    replace, device_diff, expected_difflines = test_data
+    iosxe_base_cfg_object._replace = replace
+    assert iosxe_base_cfg_object._parse_device_diff(device_diff=device_diff) == expected_difflines
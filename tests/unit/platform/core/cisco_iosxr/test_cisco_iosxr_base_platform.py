@@ -39,6 +39,27 @@ def test_parse_version_no_match(iosxr_base_cfg_object):
     assert actual_version_string == ""
 
 
+def test_parse_config_fingerprint(iosxr_base_cfg_object):
+    device_output = """SNo. Label/ID              User      Line                Client      Time Stamp
+~~~~ ~~~~~~~~              ~~~~      ~~~~                ~~~~~~      ~~~~~~~~~~
+1    1000000123            vrnetlab  vty0:node0_RP0_CPU0 CLI         Sat May  1 16:27:55 2021
+"""
+    assert iosxr_base_cfg_object._parse_config_fingerprint(device_output=device_output) == (
+        "1000000123"
+    )
+    assert iosxr_base_cfg_object._parse_config_fingerprint(device_output="blah") == ""
+
+
+def test_get_config_command(iosxr_base_cfg_object):
+    assert iosxr_base_cfg_object._get_config_command(source="running") == "show running-config"
+    assert (
+        iosxr_base_cfg_object._get_config_command(
+            source="running", section="interface MgmtEth0/RP0/CPU0/0"
+        )
+        == "show running-config interface MgmtEth0/RP0/CPU0/0"
+    )
+
+
 def test_prepare_config_payloads(iosxr_base_cfg_object):
     actual_config, actual_eager_config = iosxr_base_cfg_object._prepare_config_payloads(
         config=CONFIG_PAYLOAD
@@ -109,3 +130,30 @@ def test_clean_config(iosxr_base_cfg_object, dummy_logger):
         actual_config
         == "!\ntelnet vrf default ipv4 server max-servers 10\nbanner motd ^\nsomething in a banner\n^\nend"
     )
+
+
+IOSXR_DEVICE_DIFF = """Sat May 29 13:11:53.863 UTC
+Building configuration...
+!! IOS XR Configuration version = 6.5.3
+#  interface Loopback0
+-   description tacocat
++   description racecar
+   !
++  interface Loopback1
++   description tacocat
+   !
+end
+"""
+
+
+def test_parse_device_diff(iosxr_base_cfg_object, dummy_logger):
+    iosxr_base_cfg_object.logger = dummy_logger
+    assert iosxr_base_cfg_object._parse_device_diff(device_diff=IOSXR_DEVICE_DIFF) == [
+        "  interface Loopback0\n",
+        "-  description tacocat\n",
+        "+  description racecar\n",
+        "  !\n",
+        "+ interface Loopback1\n",
+        "+  description tacocat\n",
+        "  !\n",
+    ]
@@ -1,7 +1,12 @@
 import pytest
 
+from scrapli import Scrapli
+from scrapli.response import MultiResponse, Response
+from scrapli_cfg.cache import ConfigCache
 from scrapli_cfg.exceptions import FailedToFetchSpaceAvailable, InsufficientSpaceAvailable
+from scrapli_cfg.platform.core.cisco_nxos.sync_platform import ScrapliCfgNXOS
 from scrapli_cfg.response import ScrapliCfgResponse
+from scrapli_cfg.transfer import CandidateFileServer, PullTransfer
 
 CONFIG_PAYLOAD = """!Command: show running-config
 !Running configuration last done at: Sat Mar  6 15:58:28 2021
@@ -89,6 +94,15 @@ def test_parse_version_no_match(nxos_base_cfg_object):
     assert actual_version_string == ""
 
 
+def test_parse_config_fingerprint(nxos_base_cfg_object):
+    device_output = """!Running configuration last done at: Fri Apr 30 21:43:01 2021
+"""
+    assert nxos_base_cfg_object._parse_config_fingerprint(device_output=device_output) == (
+        "Running configuration last done at: Fri Apr 30 21:43:01 2021"
+    )
+    assert nxos_base_cfg_object._parse_config_fingerprint(device_output="blah") == ""
+
+
 def test_reset_config_session(nxos_base_cfg_object, dummy_logger):
     nxos_base_cfg_object.logger = dummy_logger
     nxos_base_cfg_object.candidate_config_filename = "BLAH"
@@ -119,6 +133,13 @@ def test_get_config_command(nxos_base_cfg_object, test_data):
     assert nxos_base_cfg_object._get_config_command(source=source) == expected_command
 
 
+def test_get_config_command_section(nxos_base_cfg_object):
+    assert (
+        nxos_base_cfg_object._get_config_command(source="running", section="interface mgmt0")
+        == "show running-config | section interface mgmt0"
+    )
+
+
 @pytest.mark.parametrize(
     "test_data",
     (
@@ -156,6 +177,74 @@ def test_prepare_config_payloads(nxos_base_cfg_object):
     )
 
 
+def test_prepare_config_payloads_chunked(nxos_base_cfg_object):
+    nxos_base_cfg_object.filesystem = "bootflash:"
+    nxos_base_cfg_object.candidate_config_filename = "scrapli_cfg_candidate"
+    nxos_base_cfg_object.chunk_payloads = True
+    actual_config = nxos_base_cfg_object._prepare_config_payloads(
+        config="interface loopback123\n  description tacocat"
+    )
+    assert (
+        actual_config
+        == """set fl [open "/bootflash/scrapli_cfg_candidate" wb+]\nputs -nonewline $fl "interface loopback123\\r  description tacocat\\r"\nclose $fl"""
+    )
+
+
+def test_get_tclsh_chunks(nxos_base_cfg_object):
+    nxos_base_cfg_object.tclsh_chunk_size = 64
+    config = "\n".join(f"interface loopback{i}" for i in range(20))
+    config += "\n" + "  description " + "x" * 100
+
+    chunks = nxos_base_cfg_object._get_tclsh_chunks(config=config)
+
+    assert len(chunks) > 1
+    # only the single line longer than the chunk size exceeds it
+    assert all(len(chunk) <= 64 for chunk in chunks[:-1])
+    assert chunks[-1] == "  description " + "x" * 100 + "\\r"
+    assert "".join(chunks) == "".join(f"{line}\\r" for line in config.splitlines())
+
+
+def test_get_tclsh_chunks_escaping(nxos_base_cfg_object, tmp_path):
+    tkinter = pytest.importorskip("tkinter")
+    try:
+        tcl = tkinter.Tcl()
+    except tkinter.TclError:
+        pytest.skip("tcl interpreter not available")
+
+    config_lines = [
+        "interface loopback123",
+        '  description "tacocat" $HOME [exec ls] {brace} \\ \\r back\\slash',
+        "banner motd ^[$x]{}^",
+        "  description unbalanced { ] [ } }",
+        "alias cmd dir ; puts $fl oops",
+    ]
+    nxos_base_cfg_object.tclsh_chunk_size = 80
+    chunks = nxos_base_cfg_object._get_tclsh_chunks(config="\n".join(config_lines))
+    assert len(chunks) > 1
+
+    candidate_path = tmp_path / "scrapli_cfg_candidate"
+    tcl.eval(f'set fl [open "{candidate_path}" wb+]')
+    for chunk in chunks:
+        tcl.eval(f'puts -nonewline $fl "{chunk}"')
+    tcl.eval("close $fl")
+
+    assert candidate_path.read_bytes().decode() == "".join(f"{line}\r" for line in config_lines)
+
+
+def test_get_pull_command(nxos_base_cfg_object):
+    nxos_base_cfg_object.filesystem = "bootflash:"
+    nxos_base_cfg_object.candidate_config_filename = "scrapli_cfg_candidate"
+
+    assert (
+        nxos_base_cfg_object._get_pull_command(url="http://10.0.0.1:8080/abc")
+        == "copy http://10.0.0.1:8080/abc bootflash:scrapli_cfg_candidate"
+    )
+    assert (
+        nxos_base_cfg_object._get_pull_command(url="http://10.0.0.1:8080/abc", vrf="management")
+        == "copy http://10.0.0.1:8080/abc bootflash:scrapli_cfg_candidate vrf management"
+    )
+
+
 def test_prepare_load_config(nxos_base_cfg_object, dummy_logger):
     nxos_base_cfg_object.logger = dummy_logger
     nxos_base_cfg_object.candidate_config_filename = ""
@@ -195,3 +284,137 @@ def test_pre_get_checkpoint(nxos_base_cfg_object, dummy_logger, sync_scrapli_con
     assert actual_commands[1].startswith("checkpoint file bootflash:scrapli_cfg_tmp_")
     assert actual_commands[2].startswith("show file bootflash:scrapli_cfg_tmp_")
     assert actual_commands[3].startswith("delete bootflash:scrapli_cfg_tmp_")
+
+
+def test_get_checkpoint_not_cached(monkeypatch):
+    scrapli_conn = Scrapli(host="localhost", platform="cisco_nxos")
+    nxos_cfg_conn = ScrapliCfgNXOS(
+        conn=scrapli_conn, config_cache=ConfigCache(), ignore_version=True
+    )
+    nxos_cfg_conn._prepared = True
+
+    def _response(channel_input, result):
+        response = Response(host="localhost", channel_input=channel_input)
+        response.record_response(result=result.encode())
+        return response
+
+    def _send_commands(commands):
+        multi_response = MultiResponse()
+        multi_response.extend(
+            _response(channel_input=command, result="checkpoint file") for command in commands
+        )
+        return multi_response
+
+    sent_commands = []
+
+    def _send_command(command):
+        sent_commands.append(command)
+        return _response(channel_input=command, result="running config")
+
+    monkeypatch.setattr(scrapli_conn, "send_commands", _send_commands)
+    monkeypatch.setattr(scrapli_conn, "send_command", _send_command)
+
+    checkpoint_response = nxos_cfg_conn.get_checkpoint()
+    config_response = nxos_cfg_conn.get_config()
+
+    assert checkpoint_response.result == "checkpoint file"
+    # the checkpoint is not cached as the running config, so get_config goes to the device
+    assert config_response.result == "running config"
+    assert sent_commands == ["show running-config"]
+    assert (
+        nxos_cfg_conn.config_cache.get(host="localhost", port=22, source="running")
+        is config_response
+    )
+
+
+def test_load_config_pull_transfer_discards_url(monkeypatch):
+    with CandidateFileServer(host="127.0.0.1") as server:
+        scrapli_conn = Scrapli(host="localhost", platform="cisco_nxos")
+        nxos_cfg_conn = ScrapliCfgNXOS(
+            conn=scrapli_conn, transfer=PullTransfer(server=server), ignore_version=True
+        )
+        nxos_cfg_conn._prepared = True
+
+        pulled_urls = []
+
+        def _pull_candidate_config(url):
+            pulled_urls.append(url)
+            assert server._server.files
+            response = Response(host="localhost", channel_input="copy")
+            response.record_response(result=b"Copy complete")
+            return response
+
+        monkeypatch.setattr(nxos_cfg_conn, "_get_filesystem_space_available", lambda: 1000000)
+        monkeypatch.setattr(nxos_cfg_conn, "_pull_candidate_config", _pull_candidate_config)
+
+        nxos_cfg_conn.load_config(config="interface loopback1")
+        assert len(pulled_urls) == 1
+        assert server._server.files == {}
+
+        def _failed_pull_candidate_config(url):
+            raise ConnectionError("copy failed")
+
+        monkeypatch.setattr(nxos_cfg_conn, "_pull_candidate_config", _failed_pull_candidate_config)
+
+        with pytest.raises(ConnectionError):
+            nxos_cfg_conn.load_config(config="interface loopback1")
+        assert server._server.files == {}
+
+
+@pytest.mark.parametrize(
+    "test_data",
+    ((False, str(1000000 - len("interface loopback1"))), (True, None)),
+    ids=["transferred", "transfer_failed"],
+)
+def test_load_config_adjusts_filesystem_space_available(monkeypatch, test_data):
+    transfer_failed, expected_space_available = test_data
+    with CandidateFileServer(host="127.0.0.1") as server:
+        scrapli_conn = Scrapli(host="localhost", platform="cisco_nxos")
+        nxos_cfg_conn = ScrapliCfgNXOS(
+            conn=scrapli_conn, transfer=PullTransfer(server=server), ignore_version=True
+        )
+        nxos_cfg_conn._prepared = True
+        nxos_cfg_conn.memoize_facts = True
+        nxos_cfg_conn._session_facts["filesystem_space_available"] = "1000000"
+
+        def _pull_candidate_config(url):
+            response = Response(host="localhost", channel_input="copy")
+            response.record_response(result=b"Copy complete")
+            response.failed = transfer_failed
+            return response
+
+        monkeypatch.setattr(nxos_cfg_conn, "_pull_candidate_config", _pull_candidate_config)
+
+        nxos_cfg_conn.load_config(config="interface loopback1")
+
+    assert (
+        nxos_cfg_conn._session_facts.get("filesystem_space_available") == expected_space_available
+    )
+
+
+NXOS_DEVICE_DIFF = """#Generating Rollback Patch
+!!
+interface loopback1
+  no description tacocat
+  description racecar
+no hostname tacocat
+"""
+
+
+def test_parse_device_diff(nxos_base_cfg_object, dummy_logger):
+    nxos_base_cfg_object.logger = dummy_logger
+    assert nxos_base_cfg_object._parse_device_diff(device_diff=NXOS_DEVICE_DIFF) == [
+        "  interface loopback1\n",
+        "-   description tacocat\n",
+        "+   description racecar\n",
+        "- hostname tacocat\n",
+    ]
+
+
+def test_parse_device_diff_error(nxos_base_cfg_object, dummy_logger):
+    nxos_base_cfg_object.logger = dummy_logger
+    device_diff = (
+        "ERROR: Rollback patch computation failed due to the following reason(s)\n"
+        "The checkpoint file was not created using checkpoint CLI"
+    )
+    assert nxos_base_cfg_object._parse_device_diff(device_diff=device_diff) is None
@@ -1,6 +1,12 @@
 import pytest
 
+from scrapli_cfg.config_tree import diff_configs
 from scrapli_cfg.exceptions import FailedToFetchSpaceAvailable, InsufficientSpaceAvailable
+from scrapli_cfg.platform.core.juniper_junos.base_platform import (
+    LOAD_TERMINAL_BYTES_PER_SECOND,
+    parse_junos_config,
+    render_set_remediation,
+)
 from scrapli_cfg.response import ScrapliCfgResponse
 
 CONFIG_PAYLOAD = """## Last commit: 2021-03-07 18:30:28 UTC by vrnetlab
@@ -11,6 +17,46 @@ system {
 FLASH_BYTES_OUTPUT = " 1950670848 bytes free"
 JUNOS_SHOW_VERSION_OUTPUT = """Junos: 17.3R2.10
 """
+JUNOS_SOURCE_CONFIG = """system {
+    host-name vsrx;
+    root-authentication {
+        encrypted-password "$6$abc"; ## SECRET-DATA
+    }
+    services {
+        ssh;
+        netconf;
+    }
+}
+policy-options {
+    policy-statement EXPORT {
+        term one {
+            then accept;
+        }
+        term two {
+            then reject;
+        }
+    }
+}"""
+JUNOS_REORDERED_CONFIG = """policy-options {
+    policy-statement EXPORT {
+        term one {
+            then accept;
+        }
+        term two {
+            then reject;
+        }
+    }
+}
+system {
+    services {
+        netconf;
+        ssh;
+    }
+    root-authentication {
+        encrypted-password "$6$abc"; ## SECRET-DATA
+    }
+    host-name vsrx;
+}"""
 
 
 def test_parse_version_success(junos_base_cfg_object):
@@ -25,6 +71,23 @@ def test_parse_version_no_match(junos_base_cfg_object):
     assert actual_version_string == ""
 
 
+def test_parse_config_fingerprint(junos_base_cfg_object):
+    device_output = """0   2021-05-01 16:34:07 UTC by vrnetlab via cli
+"""
+    assert junos_base_cfg_object._parse_config_fingerprint(device_output=device_output) == (
+        "2021-05-01 16:34:07 UTC by vrnetlab via cli"
+    )
+    assert junos_base_cfg_object._parse_config_fingerprint(device_output="blah") == ""
+
+
+def test_get_config_command(junos_base_cfg_object):
+    assert junos_base_cfg_object._get_config_command(source="running") == "show configuration"
+    assert (
+        junos_base_cfg_object._get_config_command(source="running", section="interfaces fxp0")
+        == "show configuration interfaces fxp0"
+    )
+
+
 def test_reset_config_session(junos_base_cfg_object, dummy_logger):
     junos_base_cfg_object.logger = dummy_logger
     junos_base_cfg_object.candidate_config_filename = "BLAH"
@@ -52,6 +115,61 @@ def test_prepare_config_payloads(junos_base_cfg_object):
     )
 
 
+def test_get_pull_command(junos_base_cfg_object):
+    junos_base_cfg_object.filesystem = "/config/"
+    junos_base_cfg_object.candidate_config_filename = "scrapli_cfg_candidate"
+
+    assert (
+        junos_base_cfg_object._get_pull_command(url="http://10.0.0.1:8080/abc")
+        == "file copy http://10.0.0.1:8080/abc /config/scrapli_cfg_candidate"
+    )
+
+
+@pytest.mark.parametrize(
+    "test_data",
+    (
+        (True, False, "load override terminal"),
+        (True, True, "load override terminal"),
+        (False, True, "load set terminal"),
+        (False, False, "load merge terminal"),
+    ),
+    ids=["replace", "replace_ignores_set", "set", "merge"],
+)
+def test_get_load_command(junos_base_cfg_object, test_data):
+    replace, set_, expected_command = test_data
+    junos_base_cfg_object._replace = replace
+    junos_base_cfg_object._set = set_
+    assert junos_base_cfg_object._get_load_command(target="terminal") == expected_command
+
+
+def test_get_load_terminal_events(junos_base_cfg_object):
+    junos_base_cfg_object._replace = False
+    junos_base_cfg_object._set = True
+    junos_base_cfg_object.candidate_config = "set system host-name tacocat\nset system ntp"
+    assert junos_base_cfg_object._get_load_terminal_events() == [
+        ("load set terminal", "[Type ^D at a new line to end input]", False),
+        ("set system host-name tacocat\nset system ntp\n\x04", "", True),
+    ]
+
+
+@pytest.mark.parametrize(
+    "test_data",
+    ((None, 30.0), (None, 40.0), (5.0, 5.0)),
+    ids=["small_config", "large_config", "explicit"],
+)
+def test_get_load_terminal_timeout(junos_base_cfg_object, test_data):
+    timeout_ops, expected_timeout = test_data
+    junos_base_cfg_object.candidate_config = "x" * int(
+        (expected_timeout - 30.0) * LOAD_TERMINAL_BYTES_PER_SECOND
+    )
+    assert (
+        junos_base_cfg_object._get_load_terminal_timeout(
+            timeout_ops=timeout_ops, default_timeout_ops=30.0
+        )
+        == expected_timeout
+    )
+
+
 def test_prepare_load_config(junos_base_cfg_object, dummy_logger):
     junos_base_cfg_object.logger = dummy_logger
     junos_base_cfg_object.candidate_config_filename = ""
@@ -74,3 +192,147 @@ def test_clean_config(junos_base_cfg_object, dummy_logger):
     actual_config = junos_base_cfg_object.clean_config(config=CONFIG_PAYLOAD)
 
     assert actual_config == "system {"
+
+
+def test_parse_junos_config():
+    root = parse_junos_config(JUNOS_SOURCE_CONFIG)
+    assert [child.key for child in root.children] == ["system", "policy-options"]
+    system = root.children[0]
+    assert [child.key for child in system.children] == [
+        "host-name vsrx",
+        "root-authentication",
+        "services",
+    ]
+    assert system.children[1].children[0].key == 'encrypted-password "$6$abc"'
+    assert list(system.children[2].lines()) == [
+        "    services {",
+        "        ssh;",
+        "        netconf;",
+        "    }",
+    ]
+    assert root.children[1].children[0].ordered is True
+    assert system.ordered is False
+
+
+def test_parse_junos_config_order_insensitive():
+    assert (
+        parse_junos_config(JUNOS_SOURCE_CONFIG).digest
+        == parse_junos_config(JUNOS_REORDERED_CONFIG).digest
+    )
+    assert (
+        diff_configs(
+            source_config=JUNOS_SOURCE_CONFIG,
+            candidate_config=JUNOS_REORDERED_CONFIG,
+            config_parser=parse_junos_config,
+        )
+        == []
+    )
+
+
+def test_parse_junos_config_section_diffs():
+    candidate_config = (
+        JUNOS_SOURCE_CONFIG.replace("        netconf;\n", "")
+        .replace(
+            "    policy-statement EXPORT {\n        term one {\n            then accept;\n        }\n",
+            "    policy-statement EXPORT {\n",
+        )
+        .replace(
+            "        term two {\n            then reject;\n        }\n",
+            "        term two {\n            then reject;\n        }\n        term one {\n            then accept;\n        }\n",
+        )
+    )
+    candidate_config = candidate_config.replace(
+        "    host-name vsrx;", "    inactive: host-name vsrx;"
+    )
+
+    section_diffs = {
+        section_diff.path: (section_diff.additions, section_diff.subtractions)
+        for section_diff in diff_configs(
+            source_config=JUNOS_SOURCE_CONFIG,
+            candidate_config=candidate_config,
+            config_parser=parse_junos_config,
+        )
+    }
+    assert section_diffs == {
+        ("system",): (["    inactive: host-name vsrx;"], ["    host-name vsrx;"]),
+        ("system", "services"): ([], ["        netconf;"]),
+        # term order is significant in a policy, so moving a term is a change
+        ("policy-options", "policy-statement EXPORT"): (
+            ["        term one {", "            then accept;", "        }"],
+            ["        term one {", "            then accept;", "        }"],
+        ),
+    }
+
+
+def test_render_set_remediation():
+    candidate_config = (
+        JUNOS_SOURCE_CONFIG.replace("        netconf;\n", "")
+        .replace("    host-name vsrx;", "    inactive: host-name vsrx;")
+        .replace(
+            "        term two {\n            then reject;\n        }\n",
+            "        term two {\n            then reject;\n        }\n        term three {\n            then next policy;\n        }\n",
+        )
+    )
+
+    remediation = render_set_remediation(
+        source=parse_junos_config(JUNOS_SOURCE_CONFIG),
+        candidate=parse_junos_config(candidate_config),
+    )
+    assert remediation.splitlines() == [
+        # only the inactive state changed, so the statement is deactivated in place
+        "deactivate system host-name vsrx",
+        "delete system services netconf",
+        # term order is significant in a policy, so the policy is set again in full
+        "delete policy-options policy-statement EXPORT",
+        "set policy-options policy-statement EXPORT term one then accept",
+        "set policy-options policy-statement EXPORT term two then reject",
+        "set policy-options policy-statement EXPORT term three then next policy",
+    ]
+
+
+def test_render_set_remediation_activate_section():
+    source_config = JUNOS_SOURCE_CONFIG.replace("    services {", "    inactive: services {")
+    candidate_config = JUNOS_SOURCE_CONFIG.replace("        netconf;\n", "")
+
+    remediation = render_set_remediation(
+        source=parse_junos_config(source_config),
+        candidate=parse_junos_config(candidate_config),
+    )
+    assert remediation.splitlines() == [
+        "activate system services",
+        "delete system services netconf",
+    ]
+
+
+def test_render_set_remediation_no_changes():
+    tree = parse_junos_config(JUNOS_SOURCE_CONFIG)
+    assert render_set_remediation(source=tree, candidate=tree) == ""
+
+
+JUNOS_DEVICE_DIFF = """
+[edit interfaces fxp0 unit 0]
++    description RACECAR;
+-    description TACOCAT;
+[edit system]
+     host-name vsrx;
++    time-zone UTC;
+
+[edit]"""
+
+
+def test_parse_device_diff(junos_base_cfg_object, dummy_logger):
+    junos_base_cfg_object.logger = dummy_logger
+    assert junos_base_cfg_object._parse_device_diff(device_diff=JUNOS_DEVICE_DIFF) == [
+        "  [edit interfaces fxp0 unit 0]\n",
+        "+     description RACECAR;\n",
+        "-     description TACOCAT;\n",
+        "  [edit system]\n",
+        "      host-name vsrx;\n",
+        "+     time-zone UTC;\n",
+    ]
+
+
+def test_parse_device_diff_error(junos_base_cfg_object, dummy_logger):
+    junos_base_cfg_object.logger = dummy_logger
+    device_diff = "                 ^\nsyntax error, expecting <command>."
+    assert junos_base_cfg_object._parse_device_diff(device_diff=device_diff) is None
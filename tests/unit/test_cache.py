@@ -0,0 +1,110 @@
+import threading
+
+import pytest
+
+from scrapli_cfg.cache import ConfigCache
+from scrapli_cfg.response import ScrapliCfgResponse
+
+
+@pytest.fixture(scope="function")
+def config_cache():
+    return ConfigCache(ttl=10, max_entries=2)
+
+
+def test_config_cache_invalid_args():
+    with pytest.raises(ValueError):
+        ConfigCache(ttl=0)
+    with pytest.raises(ValueError):
+        ConfigCache(max_entries=0)
+
+
+def test_config_cache_get_set(config_cache):
+    response = ScrapliCfgResponse(host="localhost")
+    assert config_cache.get(host="localhost", port=22, source="running") is None
+
+    config_cache.set(host="localhost", port=22, source="running", response=response)
+    assert config_cache.get(host="localhost", port=22, source="running") is response
+    assert len(config_cache) == 1
+
+
+def test_config_cache_per_device(config_cache):
+    device_a = ScrapliCfgResponse(host="device_a")
+    config_cache.set(host="device_a", port=22, source="running", response=device_a)
+
+    # a cache shared by a fleet never returns one device's config for another device
+    assert config_cache.get(host="device_b", port=22, source="running") is None
+    assert config_cache.get(host="device_a", port=830, source="running") is None
+    assert config_cache.get(host="device_a", port=22, source="running") is device_a
+
+
+def test_config_cache_ttl(monkeypatch, config_cache):
+    now = 100.0
+    monkeypatch.setattr("scrapli_cfg.cache.time.monotonic", lambda: now)
+
+    config_cache.set(
+        host="localhost", port=22, source="running", response=ScrapliCfgResponse(host="localhost")
+    )
+    now = 109.9
+    assert config_cache.get(host="localhost", port=22, source="running") is not None
+    now = 110.0
+    assert config_cache.get(host="localhost", port=22, source="running") is None
+    assert len(config_cache) == 0
+
+
+def test_config_cache_lru(config_cache):
+    for source in ("running", "startup"):
+        config_cache.set(
+            host="localhost", port=22, source=source, response=ScrapliCfgResponse(host="localhost")
+        )
+    # touch running so startup is the least recently used entry
+    config_cache.get(host="localhost", port=22, source="running")
+    config_cache.set(
+        host="localhost", port=22, source="candidate", response=ScrapliCfgResponse(host="localhost")
+    )
+
+    assert config_cache.get(host="localhost", port=22, source="startup") is None
+    assert config_cache.get(host="localhost", port=22, source="running") is not None
+    assert config_cache.get(host="localhost", port=22, source="candidate") is not None
+
+
+def test_config_cache_invalidate():
+    config_cache = ConfigCache()
+    for host in ("device_a", "device_b"):
+        for source in ("running", "startup"):
+            config_cache.set(
+                host=host, port=22, source=source, response=ScrapliCfgResponse(host=host)
+            )
+
+    config_cache.invalidate(host="device_a", port=22, source="startup")
+    assert config_cache.get(host="device_a", port=22, source="startup") is None
+    assert config_cache.get(host="device_a", port=22, source="running") is not None
+
+    # invalidating a device leaves the other devices sharing the cache alone
+    config_cache.invalidate(host="device_a", port=22)
+    assert config_cache.get(host="device_a", port=22, source="running") is None
+    assert len(config_cache) == 2
+
+    config_cache.clear()
+    assert len(config_cache) == 0
+
+
+def test_config_cache_threads():
+    config_cache = ConfigCache(max_entries=64)
+
+    def _worker(worker):
+        for i in range(200):
+            host = f"device_{worker}_{i % 16}"
+            config_cache.set(
+                host=host, port=22, source="running", response=ScrapliCfgResponse(host=host)
+            )
+            cached_response = config_cache.get(host=host, port=22, source="running")
+            assert cached_response is None or cached_response.host == host
+            config_cache.invalidate(host=host, port=22)
+
+    threads = [threading.Thread(target=_worker, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(config_cache) <= 64
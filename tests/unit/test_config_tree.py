@@ -0,0 +1,216 @@
+import pytest
+
+from scrapli_cfg.config_tree import diff_configs, parse_indented_config, render_indented_remediation
+
+SOURCE_CONFIG = """hostname tacocat
+!
+interface loopback1
+ description one
+ ip address 1.1.1.1 255.255.255.255
+!
+interface loopback2
+ description two
+!
+router bgp 65000
+ address-family ipv4 unicast
+  network 1.1.1.1 mask 255.255.255.255
+ exit-address-family
+!
+end"""
+
+CANDIDATE_CONFIG = """hostname tacocat
+!
+interface loopback2
+ description two
+!
+router bgp 65000
+ address-family ipv4 unicast
+  network 1.1.1.1 mask 255.255.255.255
+  network 2.2.2.2 mask 255.255.255.255
+ exit-address-family
+!
+interface loopback1
+ description uno
+ ip address 1.1.1.1 255.255.255.255
+!
+interface loopback3
+ description three
+!
+end"""
+
+
+def _section_diffs(source_config, candidate_config):
+    return {
+        section_diff.path: (section_diff.additions, section_diff.subtractions)
+        for section_diff in diff_configs(
+            source_config=source_config, candidate_config=candidate_config
+        )
+    }
+
+
+def test_parse_indented_config():
+    root = parse_indented_config(SOURCE_CONFIG)
+    assert [child.key for child in root.children] == [
+        "hostname tacocat",
+        "interface loopback1",
+        "interface loopback2",
+        "router bgp 65000",
+        "end",
+    ]
+    router_bgp = root.children[3]
+    assert [child.key for child in router_bgp.children] == [
+        "address-family ipv4 unicast",
+        "exit-address-family",
+    ]
+    assert list(router_bgp.lines()) == [
+        "router bgp 65000",
+        " address-family ipv4 unicast",
+        "  network 1.1.1.1 mask 255.255.255.255",
+        " exit-address-family",
+    ]
+
+
+def test_parse_indented_config_digest():
+    assert (
+        parse_indented_config(SOURCE_CONFIG).digest
+        == parse_indented_config(SOURCE_CONFIG.replace("!\n", "")).digest
+    )
+    assert (
+        parse_indented_config(SOURCE_CONFIG).digest
+        != parse_indented_config(CANDIDATE_CONFIG).digest
+    )
+
+
+def test_diff_configs_no_changes():
+    assert diff_configs(source_config=SOURCE_CONFIG, candidate_config=SOURCE_CONFIG) == []
+
+
+def test_diff_configs():
+    assert _section_diffs(SOURCE_CONFIG, CANDIDATE_CONFIG) == {
+        (): (["interface loopback3", " description three"], []),
+        ("interface loopback1",): ([" description uno"], [" description one"]),
+        ("router bgp 65000", "address-family ipv4 unicast"): (
+            ["  network 2.2.2.2 mask 255.255.255.255"],
+            [],
+        ),
+    }
+
+
+def test_diff_configs_moved_section():
+    source_config = "interface loopback1\n description one\ninterface loopback2\n description two"
+    candidate_config = (
+        "interface loopback2\n description two\ninterface loopback1\n description one"
+    )
+    assert diff_configs(source_config=source_config, candidate_config=candidate_config) == []
+
+
+def test_diff_configs_moved_leaf():
+    source_config = "hostname a\nip routing\nip domain-name x"
+    candidate_config = "hostname a\nip domain-name x\nip routing"
+    # top level lines are matched by key, a line that only moved is not a change
+    assert diff_configs(source_config=source_config, candidate_config=candidate_config) == []
+
+
+def test_diff_configs_ordered_leaves():
+    source_config = "ip access-list standard ACL\n permit 1.1.1.1\n deny any"
+    candidate_config = "ip access-list standard ACL\n deny any\n permit 1.1.1.1"
+    assert _section_diffs(source_config, candidate_config) == {
+        ("ip access-list standard ACL",): ([" permit 1.1.1.1"], [" permit 1.1.1.1"]),
+    }
+
+
+def test_render_indented_remediation():
+    source_config = SOURCE_CONFIG.replace(
+        "hostname tacocat", "hostname tacocat\nno ip domain lookup"
+    )
+    remediation = render_indented_remediation(
+        source=parse_indented_config(source_config),
+        candidate=parse_indented_config(CANDIDATE_CONFIG),
+    )
+    assert remediation.splitlines() == [
+        "ip domain lookup",
+        "interface loopback3",
+        " description three",
+        "router bgp 65000",
+        " address-family ipv4 unicast",
+        "  network 2.2.2.2 mask 255.255.255.255",
+        "interface loopback1",
+        " no description one",
+        " description uno",
+    ]
+
+
+def test_render_indented_remediation_removed_section():
+    remediation = render_indented_remediation(
+        source=parse_indented_config(CANDIDATE_CONFIG),
+        candidate=parse_indented_config(SOURCE_CONFIG),
+    )
+    assert "no interface loopback3" in remediation.splitlines()
+    assert " description three" not in remediation.splitlines()
+
+
+def test_render_indented_remediation_no_changes():
+    tree = parse_indented_config(SOURCE_CONFIG)
+    assert render_indented_remediation(source=tree, candidate=tree) == ""
+
+
+def test_render_indented_remediation_moved_leaves():
+    source_config = "hostname a\nip routing\nip domain-name x"
+    candidate_config = "hostname a\nip domain-name x\nip routing"
+    # a top level line that only moved must never be negated
+    assert (
+        render_indented_remediation(
+            source=parse_indented_config(source_config),
+            candidate=parse_indented_config(candidate_config),
+        )
+        == ""
+    )
+
+
+ACL_CONFIG = """ip access-list extended ACL
+ permit ip host 1.1.1.1 any
+ deny ip any any"""
+
+
+@pytest.mark.parametrize(
+    "candidate_config,expected_remediation",
+    [
+        (
+            ACL_CONFIG.replace(" deny", " permit ip host 2.2.2.2 any\n deny"),
+            [
+                "no ip access-list extended ACL",
+                "ip access-list extended ACL",
+                " permit ip host 1.1.1.1 any",
+                " permit ip host 2.2.2.2 any",
+                " deny ip any any",
+            ],
+        ),
+        (
+            f"{ACL_CONFIG}\n permit ip host 2.2.2.2 any",
+            ["ip access-list extended ACL", " permit ip host 2.2.2.2 any"],
+        ),
+        (
+            ACL_CONFIG.replace(" deny ip any any", ""),
+            ["ip access-list extended ACL", " no deny ip any any"],
+        ),
+    ],
+    ids=["inserted", "appended", "removed"],
+)
+def test_render_indented_remediation_ordered_section(candidate_config, expected_remediation):
+    remediation = render_indented_remediation(
+        source=parse_indented_config(ACL_CONFIG),
+        candidate=parse_indented_config(candidate_config),
+    )
+    assert remediation.splitlines() == expected_remediation
+
+
+def test_render_indented_remediation_ordered_section_sequence_numbers():
+    source_config = (
+        "ip access-list extended ACL\n 10 permit ip host 1.1.1.1 any\n 30 deny ip any any"
+    )
+    candidate_config = source_config.replace(" 30", " 20 permit ip host 2.2.2.2 any\n 30")
+    # the device puts sequenced entries in place, so only the new entry is rendered
+    assert render_indented_remediation(
+        source=parse_indented_config(source_config),
+        candidate=parse_indented_config(candidate_config),
+    ).splitlines() == ["ip access-list extended ACL", " 20 permit ip host 2.2.2.2 any"]
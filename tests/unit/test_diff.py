@@ -1,5 +1,8 @@
+import difflib
+
 import pytest
 
+from scrapli_cfg.config_tree import parse_indented_config
 from scrapli_cfg.diff import END_COLOR, GREEN, RED, YELLOW
 
 DUMMY_SOURCE_CONFIG = """!
@@ -120,3 +123,84 @@ def test_unified_diff(diff_obj, colorize):
         assert diff_obj.unified_diff == COLORIZED_UNIFIED_DIFF
     else:
         assert diff_obj.unified_diff == UNIFIED_DIFF
+
+
+def test_record_diff_response_lazy(diff_obj):
+    calls = []
+
+    def _diff_backend(source_lines, candidate_lines):
+        calls.append((source_lines, candidate_lines))
+        return difflib.ndiff(source_lines, candidate_lines)
+
+    diff_obj.diff_backend = _diff_backend
+    diff_obj.record_diff_response(
+        source_config=DUMMY_SOURCE_CONFIG,
+        candidate_config=DUMMY_CANDIDATE_CONFIG,
+        device_diff=DUMMY_DEVICE_DIFF,
+    )
+    assert diff_obj.device_diff == DUMMY_DEVICE_DIFF
+    assert not calls
+
+    assert diff_obj.unified_diff == COLORIZED_UNIFIED_DIFF
+    assert diff_obj.side_by_side_diff == COLORIZED_SIDE_BY_SIDE_DIFF
+    assert diff_obj.additions == "interface loopback456\n   description racecar\n"
+    assert diff_obj.subtractions == "interface loopback123\n   description tacocat\n"
+    assert len(calls) == 1
+
+    # recording a new diff must reset any previously generated output
+    diff_obj.record_diff_response(
+        source_config=DUMMY_SOURCE_CONFIG,
+        candidate_config=DUMMY_SOURCE_CONFIG,
+        device_diff="",
+    )
+    assert diff_obj.additions == ""
+    assert diff_obj.unified_diff == DUMMY_SOURCE_CONFIG
+    assert len(calls) == 2
+
+
+def test_section_diffs(diff_obj):
+    diff_obj.record_diff_response(
+        source_config=DUMMY_SOURCE_CONFIG,
+        candidate_config=DUMMY_CANDIDATE_CONFIG,
+        device_diff=DUMMY_DEVICE_DIFF,
+    )
+    assert diff_obj.section_diffs == []
+
+    diff_obj.record_diff_response(
+        source_config=DUMMY_SOURCE_CONFIG,
+        candidate_config=DUMMY_CANDIDATE_CONFIG,
+        device_diff=DUMMY_DEVICE_DIFF,
+        config_parser=parse_indented_config,
+    )
+    assert len(diff_obj.section_diffs) == 1
+    assert diff_obj.section_diffs[0].path == ()
+    assert diff_obj.section_diffs[0].additions == [
+        "interface loopback456",
+        "   description racecar",
+    ]
+    assert diff_obj.section_diffs[0].subtractions == [
+        "interface loopback123",
+        "   description tacocat",
+    ]
+
+
+def test_summarize(diff_obj):
+    diff_obj.record_diff_response(
+        source_config=DUMMY_SOURCE_CONFIG,
+        candidate_config=DUMMY_CANDIDATE_CONFIG,
+        device_diff=DUMMY_DEVICE_DIFF,
+    )
+    diff_obj.summarize()
+
+    assert diff_obj.retain == "summary"
+    assert diff_obj.source_config == ""
+    assert diff_obj.candidate_config == ""
+    assert diff_obj.device_diff == ""
+    assert diff_obj._difflines == [
+        "- interface loopback123\n",
+        "+ interface loopback456\n",
+        "-    description tacocat\n",
+        "+    description racecar\n",
+    ]
+    assert diff_obj.subtractions == "interface loopback123\n   description tacocat\n"
+    assert diff_obj.additions == "interface loopback456\n   description racecar\n"
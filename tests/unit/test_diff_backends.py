@@ -0,0 +1,181 @@
+import difflib
+import random
+
+import pytest
+
+import scrapli_cfg.diff_backends
+from scrapli_cfg.diff_backends import (
+    INTRALINE_HINT_MAX_PAIRS,
+    blocks_to_opcodes,
+    differ_diff,
+    myers_diff,
+    myers_opcodes,
+    patience_diff,
+    patience_opcodes,
+)
+
+SOURCE_LINES = [
+    "hostname tacocat\n",
+    "!\n",
+    "interface loopback1\n",
+    " description one\n",
+    "!\n",
+    "interface loopback2\n",
+    " description two\n",
+    "!\n",
+    "end\n",
+]
+CANDIDATE_LINES = [
+    "hostname racecar\n",
+    "!\n",
+    "interface loopback2\n",
+    " description two\n",
+    "!\n",
+    "interface loopback3\n",
+    " description three\n",
+    "!\n",
+    "end\n",
+]
+
+
+def _lcs_length(a, b):
+    lengths = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i in range(len(a) - 1, -1, -1):
+        for j in range(len(b) - 1, -1, -1):
+            if a[i] == b[j]:
+                lengths[i][j] = lengths[i + 1][j + 1] + 1
+            else:
+                lengths[i][j] = max(lengths[i + 1][j], lengths[i][j + 1])
+    return lengths[0][0]
+
+
+def _assert_valid_opcodes(opcodes, a, b):
+    rebuilt_a = []
+    rebuilt_b = []
+    equal_count = 0
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            assert a[i1:i2] == b[j1:j2]
+            equal_count += i2 - i1
+        rebuilt_a.extend(a[i1:i2])
+        rebuilt_b.extend(b[j1:j2])
+    assert rebuilt_a == list(a)
+    assert rebuilt_b == list(b)
+    return equal_count
+
+
+@pytest.mark.parametrize(
+    "diff_backend",
+    (
+        myers_diff,
+        patience_diff,
+        differ_diff,
+    ),
+    ids=("myers", "patience", "differ"),
+)
+def test_diff_backend_restore(diff_backend):
+    difflines = list(diff_backend(SOURCE_LINES, CANDIDATE_LINES))
+    assert list(difflib.restore(difflines, 1)) == SOURCE_LINES
+    assert list(difflib.restore(difflines, 2)) == CANDIDATE_LINES
+
+
+@pytest.mark.parametrize(
+    "diff_backend",
+    (
+        myers_diff,
+        patience_diff,
+    ),
+    ids=("myers", "patience"),
+)
+def test_diff_backend_matches_differ_small_hunks(diff_backend):
+    source_lines = ["!\n", "interface loopback123\n", "   description tacocat\n", "!\n"]
+    candidate_lines = ["!\n", "interface loopback456\n", "   description racecar\n", "!\n"]
+    assert list(diff_backend(source_lines, candidate_lines)) == list(
+        differ_diff(source_lines, candidate_lines)
+    )
+
+
+def test_diff_backend_large_hunk_no_hints():
+    source_lines = [f"line {i}\n" for i in range(INTRALINE_HINT_MAX_PAIRS // 50)]
+    candidate_lines = [f"line {i}x\n" for i in range(100)]
+    difflines = list(patience_diff(source_lines, candidate_lines))
+    assert not [line for line in difflines if line[:2] == "? "]
+    assert difflines == [f"- {line}" for line in source_lines] + [
+        f"+ {line}" for line in candidate_lines
+    ]
+
+
+@pytest.mark.parametrize(
+    "seed",
+    range(5),
+)
+def test_myers_opcodes_minimal(seed):
+    rand = random.Random(seed)
+    for _ in range(200):
+        a = [rand.randint(0, 4) for _ in range(rand.randint(0, 12))]
+        b = [rand.randint(0, 4) for _ in range(rand.randint(0, 12))]
+        assert _assert_valid_opcodes(myers_opcodes(a, b), a, b) == _lcs_length(a, b)
+
+
+@pytest.mark.parametrize(
+    "seed",
+    range(5),
+)
+def test_patience_opcodes_valid(seed):
+    rand = random.Random(seed)
+    for _ in range(200):
+        a = [rand.randint(0, 6) for _ in range(rand.randint(0, 12))]
+        b = [rand.randint(0, 6) for _ in range(rand.randint(0, 12))]
+        _assert_valid_opcodes(patience_opcodes(a, b), a, b)
+
+
+@pytest.mark.parametrize(
+    "seed",
+    range(5),
+)
+def test_myers_opcodes_cost_limit(monkeypatch, seed):
+    monkeypatch.setattr(scrapli_cfg.diff_backends, "MYERS_MIN_COST_LIMIT", 1)
+    rand = random.Random(seed)
+    for _ in range(200):
+        a = [rand.randint(0, 4) for _ in range(rand.randint(0, 12))]
+        b = [rand.randint(0, 4) for _ in range(rand.randint(0, 12))]
+        _assert_valid_opcodes(myers_opcodes(a, b), a, b)
+        _assert_valid_opcodes(patience_opcodes(a, b), a, b)
+
+
+def test_myers_opcodes_cost_limit_disjoint():
+    # nothing in common, without the cost limit this walks every one of the N+M diagonals
+    a = [f"source {i}" for i in range(10_000)]
+    b = [f"candidate {i}" for i in range(10_000)]
+    assert myers_opcodes(a, b) == [("replace", 0, 10_000, 0, 10_000)]
+
+
+def test_patience_opcodes_anchor_on_unique_lines():
+    source_lines = ["a\n", "}\n", "b\n", "}\n", "c\n", "}\n"]
+    candidate_lines = ["c\n", "}\n", "a\n", "}\n", "b\n", "}\n"]
+    # unique lines "a" and "b" are the anchors, so "c" moving is a delete + insert of its stanza
+    assert patience_opcodes(source_lines, candidate_lines) == [
+        ("insert", 0, 0, 0, 2),
+        ("equal", 0, 3, 2, 5),
+        ("delete", 3, 5, 5, 5),
+        ("equal", 5, 6, 5, 6),
+    ]
+
+
+def test_blocks_to_opcodes():
+    assert blocks_to_opcodes(blocks=[(0, 0, 1), (2, 1, 1)], a_length=3, b_length=3) == [
+        ("equal", 0, 1, 0, 1),
+        ("delete", 1, 2, 1, 1),
+        ("equal", 2, 3, 1, 2),
+        ("insert", 3, 3, 2, 3),
+    ]
+
+
+def test_diff_response_diff_backend(diff_obj):
+    diff_obj.diff_backend = differ_diff
+    diff_obj.record_diff_response(
+        source_config="".join(SOURCE_LINES),
+        candidate_config="".join(CANDIDATE_LINES),
+        device_diff="",
+    )
+    assert diff_obj._difflines == list(difflib.ndiff(SOURCE_LINES, CANDIDATE_LINES))
@@ -0,0 +1,106 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from scrapli_cfg.facts import FactsCache, JSONFactsCache
+
+
+@pytest.fixture(scope="function")
+def facts_cache():
+    return FactsCache(ttl=10)
+
+
+def test_facts_cache_invalid_args():
+    with pytest.raises(ValueError):
+        FactsCache(ttl=0)
+
+
+def test_facts_cache_get_set(facts_cache):
+    assert facts_cache.get(host="localhost", port=22, fact="version") is None
+
+    facts_cache.set(host="localhost", port=22, fact="version", value="16.12.03")
+    assert facts_cache.get(host="localhost", port=22, fact="version") == "16.12.03"
+    # facts are keyed by host *and* port
+    assert facts_cache.get(host="localhost", port=2222, fact="version") is None
+
+
+def test_facts_cache_ttl(monkeypatch, facts_cache):
+    now = 100.0
+    monkeypatch.setattr("scrapli_cfg.facts.time.time", lambda: now)
+
+    facts_cache.set(host="localhost", port=22, fact="version", value="16.12.03")
+    now = 109.9
+    assert facts_cache.get(host="localhost", port=22, fact="version") is not None
+    now = 110.0
+    assert facts_cache.get(host="localhost", port=22, fact="version") is None
+
+
+def test_facts_cache_invalidate(facts_cache):
+    facts_cache.set(host="localhost", port=22, fact="version", value="16.12.03")
+    facts_cache.set(host="localhost", port=22, fact="file_prompt_mode", value="quiet")
+
+    facts_cache.invalidate(host="localhost", port=22, facts=["file_prompt_mode"])
+    assert facts_cache.get(host="localhost", port=22, fact="file_prompt_mode") is None
+    assert facts_cache.get(host="localhost", port=22, fact="version") == "16.12.03"
+
+    facts_cache.invalidate(host="localhost", port=22)
+    assert facts_cache.get(host="localhost", port=22, fact="version") is None
+
+
+def test_json_facts_cache(tmp_path):
+    path = str(tmp_path / "facts.json")
+
+    facts_cache = JSONFactsCache(path=path)
+    facts_cache.set(host="localhost", port=22, fact="version", value="16.12.03")
+
+    with open(path, "r", encoding="utf-8") as f:
+        assert "localhost:22" in json.load(f)
+
+    # a new cache (i.e. the next short lived job) picks up the persisted facts
+    assert JSONFactsCache(path=path).get(host="localhost", port=22, fact="version") == "16.12.03"
+
+    facts_cache.invalidate(host="localhost", port=22, fact="version")
+    # changes within the flush interval are only written once flushed
+    assert JSONFactsCache(path=path).get(host="localhost", port=22, fact="version") == "16.12.03"
+
+    facts_cache.flush()
+    assert JSONFactsCache(path=path).get(host="localhost", port=22, fact="version") is None
+
+
+def test_json_facts_cache_flush_interval(monkeypatch, tmp_path):
+    path = str(tmp_path / "facts.json")
+    writes = []
+    original_replace = os.replace
+
+    def _replace(src, dst):
+        writes.append(dst)
+        original_replace(src, dst)
+
+    monkeypatch.setattr("scrapli_cfg.facts.os.replace", _replace)
+
+    facts_cache = JSONFactsCache(path=path, flush_interval=60)
+    for i in range(100):
+        facts_cache.set(host=f"host{i}", port=22, fact="version", value="16.12.03")
+
+    # the first change is written right away, the rest are batched until flushed
+    assert len(writes) == 1
+
+    facts_cache.close()
+    facts_cache.flush()
+    assert len(writes) == 2
+    assert len(JSONFactsCache(path=path)._facts) == 100
+
+
+def test_json_facts_cache_threads(tmp_path):
+    facts_cache = JSONFactsCache(path=str(tmp_path / "facts.json"), flush_interval=0)
+
+    def _set_facts(worker):
+        for i in range(50):
+            facts_cache.set(host=f"host{worker}-{i}", port=22, fact="version", value="16.12.03")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_set_facts, range(8)))
+
+    assert len(JSONFactsCache(path=str(tmp_path / "facts.json"))._facts) == 400
@@ -0,0 +1,284 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from scrapli_cfg.exceptions import ScrapliCfgException
+from scrapli_cfg.fleet import AsyncScrapliCfgFleet, ScrapliCfgFleet, _platform_name
+from scrapli_cfg.response import ScrapliCfgResponse
+
+
+class DummyConn:
+    def __init__(self, host):
+        self.host = host
+
+
+class DummyPlatform:
+    def __init__(self, host, delay=0.01):
+        self.conn = DummyConn(host=host)
+        self.delay = delay
+        self.loaded_config = None
+
+    async def load_config(self, config, replace=False, **kwargs):
+        self.loaded_config = config
+        response = ScrapliCfgResponse(host=self.conn.host)
+        with response.timed(phase="transfer"):
+            await asyncio.sleep(0)
+        response.record_response(scrapli_responses=[])
+        return response
+
+
+DummyPlatform.__module__ = "dummy.cisco_iosxe.async_platform"
+
+
+class DummyEOSPlatform(DummyPlatform):
+    pass
+
+
+DummyEOSPlatform.__module__ = "dummy.arista_eos.async_platform"
+
+
+def _tracking_operation():
+    state = {"running": {}, "max_running": {}}
+
+    async def _operation(cfg_conn):
+        key = (_platform_name(cfg_conn), cfg_conn.site)
+        for tracked in (key, key[0], key[1], "all"):
+            state["running"][tracked] = state["running"].get(tracked, 0) + 1
+            state["max_running"][tracked] = max(
+                state["max_running"].get(tracked, 0), state["running"][tracked]
+            )
+        await asyncio.sleep(cfg_conn.delay)
+        for tracked in (key, key[0], key[1], "all"):
+            state["running"][tracked] -= 1
+
+    return state, _operation
+
+
+def test_fleet_invalid_limits():
+    with pytest.raises(ScrapliCfgException):
+        AsyncScrapliCfgFleet(max_concurrency=0)
+    with pytest.raises(ScrapliCfgException):
+        AsyncScrapliCfgFleet(site_limits={"dc1": 0})
+
+
+async def test_fleet_max_concurrency():
+    fleet = AsyncScrapliCfgFleet(max_concurrency=3)
+    for i in range(10):
+        cfg_conn = DummyPlatform(host=f"host{i}")
+        cfg_conn.site = ""
+        fleet.add(cfg_conn)
+
+    state, operation = _tracking_operation()
+    responses = [response async for response in fleet.run(operation=operation)]
+
+    assert len(fleet) == 10
+    assert len(responses) == 10
+    assert not any(response.failed for response in responses)
+    assert state["max_running"]["all"] == 3
+
+
+async def test_fleet_platform_and_site_limits():
+    fleet = AsyncScrapliCfgFleet(
+        max_concurrency=10, platform_limits={"cisco_iosxe": 2}, site_limits={"dc1": 3}
+    )
+    for i in range(12):
+        platform_class = DummyPlatform if i % 2 else DummyEOSPlatform
+        cfg_conn = platform_class(host=f"host{i}")
+        cfg_conn.site = "dc1" if i < 6 else "dc2"
+        fleet.add(cfg_conn, site=cfg_conn.site)
+
+    state, operation = _tracking_operation()
+    responses = [response async for response in fleet.run(operation=operation)]
+
+    assert len(responses) == 12
+    assert state["max_running"]["cisco_iosxe"] == 2
+    assert state["max_running"]["dc1"] == 3
+    # the eos hosts at dc2 are not held up by the saturated iosxe/dc1 limits
+    assert state["max_running"][("arista_eos", "dc2")] == 3
+
+
+async def test_fleet_failures():
+    fleet = AsyncScrapliCfgFleet(host_timeout=0.05)
+    fleet.add(DummyPlatform(host="slow", delay=1))
+    fleet.add(DummyPlatform(host="broken"))
+    fleet.add(DummyPlatform(host="fine"))
+
+    async def _operation(cfg_conn):
+        if cfg_conn.conn.host == "broken":
+            raise ValueError("tacocat")
+        await asyncio.sleep(cfg_conn.delay)
+
+    responses = {response.host: response async for response in fleet.run(operation=_operation)}
+
+    assert responses["fine"].failed is False
+    assert responses["broken"].failed is True
+    assert responses["broken"].result == "operation failed, ValueError: tacocat"
+    assert responses["slow"].failed is True
+    assert "deadline" in responses["slow"].result
+
+
+async def test_fleet_early_exit_awaits_cancelled_tasks():
+    fleet = AsyncScrapliCfgFleet(max_concurrency=3)
+    fleet.add(DummyPlatform(host="fast", delay=0))
+    fleet.add(DummyPlatform(host="slow1", delay=10))
+    fleet.add(DummyPlatform(host="slow2", delay=10))
+    cleaned_up = []
+
+    async def _operation(cfg_conn):
+        try:
+            await asyncio.sleep(cfg_conn.delay)
+        finally:
+            cleaned_up.append(cfg_conn.conn.host)
+
+    responses = fleet.run(operation=_operation)
+    response = await responses.__anext__()
+    await responses.aclose()
+
+    assert response.host == "fast"
+    # the in flight hosts were cancelled *and* unwound by the time the iterator closed
+    assert sorted(cleaned_up) == ["fast", "slow1", "slow2"]
+
+
+async def test_fleet_load_config_per_host():
+    fleet = AsyncScrapliCfgFleet()
+    platforms = [DummyPlatform(host="host1"), DummyPlatform(host="host2")]
+    for cfg_conn in platforms:
+        fleet.add(cfg_conn)
+
+    responses = {
+        response.host: response
+        async for response in fleet.load_config(config={"host1": "hostname host1"})
+    }
+
+    assert platforms[0].loaded_config == "hostname host1"
+    assert responses["host1"].failed is False
+    assert platforms[1].loaded_config is None
+    assert responses["host2"].failed is True
+    # the skipped host has no timings to record
+    assert len(fleet.timings) == 1
+
+
+async def test_fleet_timings():
+    fleet = AsyncScrapliCfgFleet()
+    for i in range(4):
+        fleet.add(DummyPlatform(host=f"host{i}") if i % 2 else DummyEOSPlatform(host=f"host{i}"))
+
+    _ = [response async for response in fleet.load_config(config="hostname tacocat")]
+
+    summary = fleet.timings.percentiles()
+    assert set(summary) == {"cisco_iosxe", "arista_eos"}
+    assert set(summary["cisco_iosxe"]) == {"transfer", "total"}
+    assert summary["cisco_iosxe"]["total"]["count"] == 2
+
+    # timings are of the most recent run only
+    _ = [response async for response in fleet.load_config(config="hostname racecar")]
+    assert len(fleet.timings) == 4
+
+
+class DummySyncPlatform:
+    def __init__(self, host, delay=0.01):
+        self.conn = DummyConn(host=host)
+        self.delay = delay
+        self.calls = []
+
+    def prepare(self):
+        self.calls.append("prepare")
+
+    def cleanup(self):
+        self.calls.append("cleanup")
+
+    def commit_config(self, source="running"):
+        self.calls.append("commit_config")
+        response = ScrapliCfgResponse(host=self.conn.host)
+        with response.timed(phase="commit"):
+            time.sleep(self.delay)
+        response.record_response(scrapli_responses=[])
+        return response
+
+
+DummySyncPlatform.__module__ = "dummy.cisco_iosxe.sync_platform"
+
+
+def test_sync_fleet_invalid_max_workers():
+    with pytest.raises(ScrapliCfgException):
+        ScrapliCfgFleet(max_workers=0)
+
+
+def test_sync_fleet_max_workers():
+    fleet = ScrapliCfgFleet(max_workers=3)
+    for i in range(10):
+        fleet.add(DummySyncPlatform(host=f"host{i}"))
+
+    lock = threading.Lock()
+    state = {"running": 0, "max_running": 0}
+
+    def _operation(cfg_conn):
+        with lock:
+            state["running"] += 1
+            state["max_running"] = max(state["max_running"], state["running"])
+        time.sleep(cfg_conn.delay)
+        with lock:
+            state["running"] -= 1
+
+    responses = list(fleet.run(operation=_operation))
+
+    assert len(responses) == 10
+    assert not any(response.failed for response in responses)
+    assert state["max_running"] == 3
+
+
+def test_sync_fleet_ordered():
+    fleet = ScrapliCfgFleet(max_workers=4)
+    for i in range(4):
+        fleet.add(DummySyncPlatform(host=f"host{i}", delay=0.04 - i * 0.01))
+
+    responses = list(fleet.commit_config(ordered=True))
+
+    assert [response.host for response in responses] == ["host0", "host1", "host2", "host3"]
+    assert fleet.timings.percentiles()["cisco_iosxe"]["commit"]["count"] == 4
+
+
+def test_sync_fleet_session():
+    fleet = ScrapliCfgFleet()
+    cfg_conn = DummySyncPlatform(host="host1")
+    fleet.add(cfg_conn)
+
+    def _operation(cfg_conn):
+        cfg_conn.commit_config()
+        raise ValueError("tacocat")
+
+    responses = list(fleet.run(operation=_operation, session=True))
+
+    assert responses[0].failed is True
+    assert responses[0].result == "operation failed, ValueError: tacocat"
+    # cleanup always runs so dedicated connections are always closed
+    assert cfg_conn.calls == ["prepare", "commit_config", "cleanup"]
+
+
+def test_sync_fleet_timeout():
+    fleet = ScrapliCfgFleet(host_timeout=0.05)
+    fleet.add(DummySyncPlatform(host="slow", delay=0.5))
+    fleet.add(DummySyncPlatform(host="fine"))
+
+    responses = {response.host: response for response in fleet.commit_config()}
+
+    assert responses["fine"].failed is False
+    assert responses["slow"].failed is True
+    assert "deadline" in responses["slow"].result
+
+
+def test_sync_fleet_cancel():
+    fleet = ScrapliCfgFleet(max_workers=1)
+    for i in range(5):
+        fleet.add(DummySyncPlatform(host=f"host{i}"))
+
+    responses = []
+    for response in fleet.commit_config(ordered=True):
+        responses.append(response)
+        fleet.cancel()
+
+    assert len(responses) == 5
+    assert responses[0].failed is False
+    assert all(response.result == "operation cancelled" for response in responses[2:])
@@ -0,0 +1,20 @@
+from scrapli_cfg.helper import split_config_blocks, strip_blank_lines
+
+
+def test_strip_blank_lines():
+    assert strip_blank_lines(config="interface Loopback0\n\n description tacocat\n") == (
+        "interface Loopback0\n description tacocat"
+    )
+
+
+def test_split_config_blocks():
+    config = "\n".join(f"interface Loopback{i}" for i in range(20))
+    config += "\n description " + "x" * 100
+
+    blocks = split_config_blocks(config=config, block_size=64)
+
+    assert len(blocks) > 1
+    # only the single line longer than the block size exceeds it
+    assert all(len(block) <= 64 for block in blocks[:-1])
+    assert blocks[-1] == " description " + "x" * 100 + "\n"
+    assert "".join(blocks) == f"{config}\n"
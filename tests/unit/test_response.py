@@ -1,6 +1,8 @@
 import pytest
 
-from scrapli_cfg.exceptions import ScrapliCfgException, TemplateError
+from scrapli.response import Response
+from scrapli_cfg.exceptions import ApplyConfigError, ScrapliCfgException, TemplateError
+from scrapli_cfg.response import SUMMARY_OUTPUT_LENGTH, ScrapliCfgApplyResponse, ScrapliCfgResponse
 
 
 def test_response_obj_bool(response_obj):
@@ -29,3 +31,96 @@ def test_response_obj_raise_for_status(response_obj):
 
     with pytest.raises(TemplateError):
         response_obj.raise_for_status()
+
+
+def test_apply_response_obj():
+    apply_response = ScrapliCfgApplyResponse(host="localhost")
+
+    for phase, failed in (("load", False), ("diff", False), ("commit", True)):
+        phase_response = ScrapliCfgResponse(host="localhost")
+        scrapli_response = Response(host="localhost", channel_input=f"{phase} a config")
+        scrapli_response.failed = failed
+        phase_response.record_response(scrapli_responses=[scrapli_response, scrapli_response])
+        apply_response.record_phase(phase=phase, response=phase_response, elapsed_time=0.5)
+
+    apply_response.record_apply_response(committed=False)
+
+    assert list(apply_response.phases) == ["load", "diff", "commit"]
+    assert apply_response.timings == {
+        "load": 0.5,
+        "diff": 0.5,
+        "commit": 0.5,
+        "total": apply_response.elapsed_time,
+    }
+    assert apply_response.round_trips == 6
+    assert apply_response.failed is True
+    assert repr(apply_response) == "ScrapliCfgApplyResponse <Success: False, Committed: False>"
+    with pytest.raises(ApplyConfigError):
+        apply_response.raise_for_status()
+
+
+def test_response_obj_invalid_retain():
+    with pytest.raises(ValueError):
+        ScrapliCfgResponse(host="localhost", retain="tacocat")
+
+
+def test_response_obj_slots(response_obj):
+    with pytest.raises(AttributeError):
+        response_obj.tacocat = True
+
+
+def test_response_obj_retain_summary():
+    response = ScrapliCfgResponse(host="localhost", retain="summary")
+    scrapli_response = Response(host="localhost", channel_input="show running-config")
+    scrapli_response.record_response(result=b"x" * (SUMMARY_OUTPUT_LENGTH * 2))
+
+    response.record_response(scrapli_responses=[scrapli_response], result="running config")
+
+    assert response.failed is False
+    assert response.scrapli_responses == []
+    assert response.commands == ["show running-config"]
+    assert len(response.summaries[0].result) == SUMMARY_OUTPUT_LENGTH
+    # the result is left alone until the response is summarized
+    assert response.result == "running config"
+
+
+def test_response_obj_summarize():
+    response = ScrapliCfgResponse(host="localhost")
+    scrapli_response = Response(host="localhost", channel_input="show running-config")
+    scrapli_response.record_response(result=b"running config")
+    response.record_response(
+        scrapli_responses=[scrapli_response], result="x" * (SUMMARY_OUTPUT_LENGTH * 2)
+    )
+
+    response.summarize()
+
+    assert response.retain == "summary"
+    assert response.scrapli_responses == []
+    assert response.commands == ["show running-config"]
+    assert response.summaries[0].result == "running config"
+    assert len(response.result) == SUMMARY_OUTPUT_LENGTH
+
+
+def test_response_obj_timings(response_obj):
+    with response_obj.timed(phase="priv"):
+        pass
+    with response_obj.timed(phase="transfer"):
+        pass
+    priv_elapsed_time = response_obj.timings["priv"]
+    with response_obj.timed(phase="priv"):
+        pass
+
+    response_obj.record_response(scrapli_responses=[])
+
+    assert response_obj.timings["priv"] >= priv_elapsed_time
+    assert response_obj.timings["total"] == response_obj.elapsed_time
+    assert response_obj.elapsed_time >= response_obj.timings["transfer"]
+    assert set(response_obj.timings) == {"priv", "transfer", "total"}
+
+
+def test_response_obj_timings_exception(response_obj):
+    with pytest.raises(ValueError):
+        with response_obj.timed(phase="transfer"):
+            raise ValueError
+
+    assert "transfer" in response_obj.timings
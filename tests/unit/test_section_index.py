@@ -0,0 +1,125 @@
+import re
+
+import pytest
+
+from scrapli_cfg.section_index import SectionIndex, render_template
+
+IOS_CONFIG = """hostname tacocat
+!
+interface loopback1
+ description one
+!
+router bgp 65000
+ address-family ipv4 unicast
+  network 1.1.1.1 mask 255.255.255.255
+ exit-address-family
+!
+end"""
+
+JUNOS_CONFIG = """system {
+    host-name tacocat;
+}
+interfaces {
+    fxp0 {
+        unit 0;
+    }
+}"""
+
+
+def test_section_index_sections():
+    section_index = SectionIndex(config=IOS_CONFIG)
+    assert list(section_index.sections) == [
+        "hostname tacocat",
+        "interface loopback1",
+        "router bgp 65000",
+        "end",
+    ]
+    assert section_index.section("interface loopback1") == "interface loopback1\n description one"
+    assert section_index.section("interface loopback2") == ""
+
+
+def test_section_index_sections_closing_lines():
+    section_index = SectionIndex(config=JUNOS_CONFIG)
+    assert list(section_index.sections) == ["system {", "interfaces {"]
+    assert section_index.section("system {") == "system {\n    host-name tacocat;\n}"
+
+
+def test_section_index_resolve():
+    section_index = SectionIndex(config=IOS_CONFIG)
+    pattern = re.compile(pattern=r"^interface loopback1$(?:\n^\s.*$)*", flags=re.M)
+    assert section_index.resolve(pattern=pattern) == "interface loopback1\n description one"
+    assert section_index.resolve(pattern=r"hostname (\S+)") == "tacocat"
+    assert section_index.resolve(pattern="nope") is None
+    assert len(section_index._resolved) == 3
+
+
+ETHERNET_CONFIG = """hostname tacocat
+!
+interface Ethernet1
+   description one
+!
+interface Ethernet2
+   description two
+!
+interface Management1
+   ip address 1.1.1.1/24
+!
+end"""
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        re.compile(pattern=r"^interface management1$(?:\n^\s{3}.*$)*\n!", flags=re.I | re.M),
+        re.compile(pattern=r"(^interface ethernet\d+$(?:\n^\s{3}.*$)*\n!\n)+", flags=re.I | re.M),
+        re.compile(pattern=r"^interface Ethernet2$(?:\n^\s{3}.*$)*", flags=re.M),
+        re.compile(pattern=r"^interface ethernet2$", flags=re.M),
+        re.compile(pattern=r"^hostnames?", flags=re.M),
+    ],
+    ids=["case_insensitive", "leading_group", "case_sensitive", "case_mismatch", "quantifier"],
+)
+def test_section_index_resolve_stanza(monkeypatch, pattern):
+    expected = pattern.search(ETHERNET_CONFIG)
+    section_index = SectionIndex(config=ETHERNET_CONFIG)
+
+    class NoSearchPattern:
+        flags = pattern.flags
+        groups = pattern.groups
+
+        def __getattr__(self, name):
+            return getattr(pattern, name)
+
+        def search(self, *args, **kwargs):
+            raise AssertionError("anchored pattern searched the whole config")
+
+    assert section_index.resolve(pattern=NoSearchPattern()) == (
+        (expected.group(1) if pattern.groups else expected.group()) if expected else None
+    )
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        re.compile(pattern=r"description two", flags=re.M),
+        re.compile(pattern=r"^interface ethernet1|^hostname", flags=re.I | re.M),
+        re.compile(pattern=r"^\s+description (\S+)", flags=re.M),
+        re.compile(pattern=r"^interface ethernet1", flags=re.I),
+    ],
+    ids=["unanchored", "alternation", "indented", "not_multiline"],
+)
+def test_section_index_resolve_full_scan(pattern):
+    expected = pattern.search(ETHERNET_CONFIG)
+    section_index = SectionIndex(config=ETHERNET_CONFIG)
+    assert section_index.resolve(pattern=pattern) == (
+        (expected.group(1) if pattern.groups else expected.group()) if expected else None
+    )
+
+
+def test_render_template():
+    assert (
+        render_template(
+            config_template="{{ taco }}\n\n{{ racecar }}\n{{ notreplaced }}",
+            replacements={"taco": "tacocat", "racecar": "racecar"},
+        )
+        == "tacocat\nracecar\n{{ notreplaced }}"
+    )
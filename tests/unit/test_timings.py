@@ -0,0 +1,46 @@
+import pytest
+
+from scrapli_cfg.timings import TimingStats, percentile
+
+
+def test_percentile():
+    values = [4.0, 1.0, 3.0, 2.0, 5.0]
+
+    assert percentile(values=values, pct=0) == 1.0
+    assert percentile(values=values, pct=50) == 3.0
+    assert percentile(values=values, pct=90) == pytest.approx(4.6)
+    assert percentile(values=values, pct=100) == 5.0
+    assert percentile(values=[7.0], pct=99) == 7.0
+
+
+def test_percentile_invalid():
+    with pytest.raises(ValueError):
+        percentile(values=[], pct=50)
+    with pytest.raises(ValueError):
+        percentile(values=[1.0], pct=101)
+
+
+def test_timing_stats():
+    timing_stats = TimingStats()
+    for elapsed_time in range(1, 11):
+        timing_stats.record(
+            platform="cisco_nxos",
+            timings={"transfer": float(elapsed_time), "total": float(elapsed_time) + 1},
+        )
+    timing_stats.record(platform="arista_eos", timings={"total": 0.5})
+
+    assert len(timing_stats) == 11
+
+    summary = timing_stats.percentiles(percentiles=(50, 99.9))
+    assert summary["cisco_nxos"]["transfer"] == {
+        "count": 10.0,
+        "p50": 5.5,
+        "p99.9": pytest.approx(9.991),
+        "max": 10.0,
+    }
+    assert summary["cisco_nxos"]["total"]["max"] == 11.0
+    assert summary["arista_eos"] == {"total": {"count": 1.0, "p50": 0.5, "p99.9": 0.5, "max": 0.5}}
+
+    timing_stats.clear()
+    assert len(timing_stats) == 0
+    assert timing_stats.percentiles() == {}
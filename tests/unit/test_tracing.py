@@ -0,0 +1,210 @@
+import pytest
+
+from scrapli.response import MultiResponse, Response
+from scrapli_cfg.tracing import (
+    InMemoryExporter,
+    OpenTelemetryExporter,
+    TracedConnection,
+    TraceEvent,
+    TraceExporter,
+    traced,
+)
+
+
+def _response(channel_input, result, failed=False):
+    response = Response(host="localhost", channel_input=channel_input)
+    response.record_response(result=result)
+    response.failed = failed
+    return response
+
+
+class DummyConn:
+    def __init__(self):
+        self.host = "localhost"
+        self.comms_return_char = "\n"
+
+    def send_command(self, command):
+        return _response(channel_input=command, result=b"tacocat")
+
+    def send_commands(self, commands):
+        multi_response = MultiResponse()
+        multi_response.extend(_response(channel_input=command, result=b"x") for command in commands)
+        return multi_response
+
+    def send_config(self, config, privilege_level=""):
+        raise ValueError("racecar")
+
+    def acquire_priv(self, desired_priv):
+        return None
+
+    def isalive(self):
+        return True
+
+
+class AsyncDummyConn(DummyConn):
+    async def send_command(self, command):
+        return _response(channel_input=command, result=b"tacocat", failed=True)
+
+
+class DummySpan:
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes)
+        self.ended = False
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def end(self):
+        self.ended = True
+
+
+class DummyTracer:
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, attributes):
+        span = DummySpan(name=name, attributes=attributes)
+        self.spans.append(span)
+        return span
+
+
+def test_trace_event():
+    event = TraceEvent(operation="send_commands", host="localhost", channel_inputs=["a", "bcd"])
+
+    assert event.command_count == 2
+    assert event.bytes_sent == 4
+
+    multi_response = MultiResponse()
+    multi_response.extend(
+        [_response(channel_input="a", result=b"12"), _response("bcd", b"345", failed=True)]
+    )
+    event.record_result(multi_response)
+    event.record_result(None)
+
+    assert event.bytes_received == 5
+    assert event.failed is True
+
+
+def test_traced():
+    exporter = InMemoryExporter()
+
+    with traced(
+        exporters=[exporter], operation="send_command", host="localhost", channel_inputs=["x"]
+    ) as event:
+        assert event.duration is None
+        assert len(exporter.events) == 0
+
+    assert list(exporter.events) == [event]
+    assert event.duration >= 0
+    assert event.failed is False
+
+
+def test_traced_exception():
+    exporter = InMemoryExporter()
+
+    with pytest.raises(ValueError):
+        with traced(
+            exporters=[exporter], operation="send_command", host="localhost", channel_inputs=[]
+        ):
+            raise ValueError
+
+    assert exporter.events[0].failed is True
+
+
+def test_traced_exporter_failure():
+    class BrokenExporter(TraceExporter):
+        def on_start(self, event):
+            raise RuntimeError
+
+    exporter = InMemoryExporter()
+
+    with traced(
+        exporters=[BrokenExporter(), exporter],
+        operation="send_command",
+        host="localhost",
+        channel_inputs=[],
+    ):
+        pass
+
+    assert len(exporter.events) == 1
+
+
+def test_in_memory_exporter_max_events():
+    exporter = InMemoryExporter(max_events=2)
+    for operation in ("one", "two", "three"):
+        with traced(exporters=[exporter], operation=operation, host="localhost", channel_inputs=[]):
+            pass
+
+    assert [event.operation for event in exporter.events] == ["two", "three"]
+
+    exporter.clear()
+    assert len(exporter.events) == 0
+
+
+def test_open_telemetry_exporter():
+    tracer = DummyTracer()
+    exporter = OpenTelemetryExporter(tracer=tracer)
+
+    with traced(
+        exporters=[exporter],
+        operation="send_config",
+        host="localhost",
+        channel_inputs=["interface Loopback0"],
+    ) as event:
+        event.record_result(_response(channel_input="interface Loopback0", result=b"ok"))
+
+    span = tracer.spans[0]
+    assert span.name == "scrapli_cfg.send_config"
+    assert span.ended is True
+    assert span.attributes == {
+        "net.peer.name": "localhost",
+        "scrapli_cfg.command_count": 1,
+        "scrapli_cfg.bytes_sent": 19,
+        "scrapli_cfg.bytes_received": 2,
+        "scrapli_cfg.failed": False,
+    }
+
+
+def test_traced_connection():
+    conn = DummyConn()
+    exporters = []
+    traced_conn = TracedConnection(conn=conn, exporters=exporters)
+
+    # no exporters, nothing is wrapped
+    assert traced_conn.send_command == conn.send_command
+
+    exporter = InMemoryExporter()
+    exporters.append(exporter)
+
+    response = traced_conn.send_command(command="show version")
+    traced_conn.send_commands(["show version", "show run"])
+    traced_conn.acquire_priv(desired_priv="configuration")
+    with pytest.raises(ValueError):
+        traced_conn.send_config(config="interface Loopback0\n description tacocat")
+    assert traced_conn.isalive() is True
+
+    traced_conn.comms_return_char = "\r"
+    assert conn.comms_return_char == "\r"
+
+    assert response.result == "tacocat"
+    assert [
+        (event.operation, event.command_count, event.bytes_received, event.failed)
+        for event in exporter.events
+    ] == [
+        ("send_command", 1, 7, False),
+        ("send_commands", 2, 2, False),
+        ("acquire_priv", 0, 0, False),
+        ("send_config", 2, 0, True),
+    ]
+
+
+async def test_traced_connection_async():
+    exporter = InMemoryExporter()
+    traced_conn = TracedConnection(conn=AsyncDummyConn(), exporters=[exporter])
+
+    response = await traced_conn.send_command(command="show version")
+
+    assert response.result == "tacocat"
+    assert exporter.events[0].bytes_sent == 12
+    assert exporter.events[0].failed is True
@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import socket
+import threading
+import urllib.error
+import urllib.request
+from types import SimpleNamespace
+
+import asyncssh
+import paramiko
+import pytest
+
+from scrapli_cfg.exceptions import FileTransferError, FileTransferNotSupported, ScrapliCfgException
+from scrapli_cfg.transfer import AsyncFileTransfer, CandidateFileServer, FileTransfer, PullTransfer
+
+CANDIDATE_CONFIG = "hostname tacocat\ninterface Loopback0\n description tacocat\n"
+
+
+class SSHServer(asyncssh.SSHServer):
+    def begin_auth(self, username):
+        return True
+
+    def password_auth_supported(self):
+        return True
+
+    def validate_password(self, username, password):
+        return True
+
+
+@pytest.fixture(scope="module")
+def ssh_server():
+    """Local asyncssh server w/ sftp and scp support, run in its own thread/loop"""
+    loop = asyncio.new_event_loop()
+    server_started = threading.Event()
+    state = {}
+
+    async def _start():
+        with socket.socket() as sock:
+            sock.bind(("localhost", 0))
+            state["port"] = sock.getsockname()[1]
+        state["server"] = await asyncssh.create_server(
+            SSHServer,
+            "localhost",
+            state["port"],
+            server_host_keys=[asyncssh.generate_private_key("ssh-ed25519")],
+            sftp_factory=True,
+            allow_scp=True,
+        )
+        server_started.set()
+
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(_start(), loop)
+    server_started.wait(timeout=10)
+
+    yield state["port"]
+
+    state["server"].close()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=10)
+
+
+def _conn(session, transport_name):
+    return SimpleNamespace(
+        host="localhost",
+        logger=logging.getLogger("scrapli_cfg.test"),
+        transport=SimpleNamespace(session=session),
+        transport_name=transport_name,
+    )
+
+
+def test_file_transfer_invalid_args():
+    with pytest.raises(ValueError):
+        FileTransfer(protocol="tftp")
+    with pytest.raises(ValueError):
+        FileTransfer(timeout=0)
+
+
+def test_file_transfer_not_supported():
+    with pytest.raises(FileTransferNotSupported):
+        FileTransfer().put(
+            conn=_conn(session=None, transport_name="system"),
+            config=CANDIDATE_CONFIG,
+            remote_path="flash:scrapli_cfg_candidate",
+        )
+
+
+def test_scp_header():
+    assert (
+        FileTransfer._scp_header(payload=b"tacocat", remote_path="flash:scrapli_cfg_candidate")
+        == b"C0644 7 scrapli_cfg_candidate\n"
+    )
+
+
+def test_scp_command():
+    assert FileTransfer._scp_command(remote_path="flash:scrapli_cfg_candidate") == (
+        "scp -t flash:scrapli_cfg_candidate"
+    )
+    assert FileTransfer._scp_command(remote_path="flash:cfg; reload") == (
+        "scp -t 'flash:cfg; reload'"
+    )
+
+
+class FakeSCPChannel:
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    def recv(self, size):
+        return self.chunks.pop(0) if self.chunks else b""
+
+
+@pytest.mark.parametrize(
+    "test_data",
+    (
+        ([b"\x00"], None),
+        ([b"\x02", b"scp: no space ", b"left\n"], "scp transfer refused: scp: no space left"),
+        ([b"\x01bad", b""], "scp transfer refused: bad"),
+        ([], "scp channel closed before acknowledging the message"),
+    ),
+    ids=["ok", "error_split", "eof_mid_message", "eof"],
+)
+def test_read_scp_ack(test_data):
+    chunks, expected_error = test_data
+    channel = FakeSCPChannel(chunks=chunks)
+
+    if expected_error is None:
+        FileTransfer()._read_scp_ack(channel=channel)
+        return
+
+    with pytest.raises(FileTransferError) as exc:
+        FileTransfer()._read_scp_ack(channel=channel)
+    assert str(exc.value) == expected_error
+
+
+@pytest.mark.parametrize("protocol", ["sftp", "scp"])
+def test_file_transfer_put(ssh_server, tmp_path, protocol):
+    (tmp_path / "scrapli cfg").mkdir()
+    remote_path = str(tmp_path / "scrapli cfg" / "scrapli_cfg_candidate")
+
+    session = paramiko.Transport(("localhost", ssh_server))
+    session.start_client()
+    session.auth_password(username="scrapli", password="scrapli")
+    try:
+        response = FileTransfer(protocol=protocol, timeout=10).put(
+            conn=_conn(session=session, transport_name="paramiko"),
+            config=CANDIDATE_CONFIG,
+            remote_path=remote_path,
+        )
+    finally:
+        session.close()
+
+    assert response.failed is False
+    assert (tmp_path / "scrapli cfg" / "scrapli_cfg_candidate").read_text() == CANDIDATE_CONFIG
+
+
+@pytest.mark.parametrize("protocol", ["sftp", "scp"])
+async def test_async_file_transfer_put(ssh_server, tmp_path, protocol):
+    (tmp_path / "scrapli cfg").mkdir()
+    remote_path = str(tmp_path / "scrapli cfg" / "scrapli_cfg_candidate")
+
+    async with asyncssh.connect(
+        "localhost",
+        ssh_server,
+        username="scrapli",
+        password="scrapli",
+        known_hosts=None,
+    ) as session:
+        response = await AsyncFileTransfer(protocol=protocol, timeout=10).put(
+            conn=_conn(session=session, transport_name="asyncssh"),
+            config=CANDIDATE_CONFIG,
+            remote_path=remote_path,
+        )
+
+    assert response.failed is False
+    assert (tmp_path / "scrapli cfg" / "scrapli_cfg_candidate").read_text() == CANDIDATE_CONFIG
+
+
+async def test_async_file_transfer_put_failed(ssh_server, tmp_path):
+    remote_path = str(tmp_path / "notadirectory" / "scrapli_cfg_candidate")
+
+    async with asyncssh.connect(
+        "localhost",
+        ssh_server,
+        username="scrapli",
+        password="scrapli",
+        known_hosts=None,
+    ) as session:
+        response = await AsyncFileTransfer(protocol="scp", timeout=10).put(
+            conn=_conn(session=session, transport_name="asyncssh"),
+            config=CANDIDATE_CONFIG,
+            remote_path=remote_path,
+        )
+
+    assert response.failed is True
+
+
+def test_candidate_file_server():
+    with CandidateFileServer(host="127.0.0.1") as server:
+        url = server.add(content=CANDIDATE_CONFIG)
+        # content addressed, the same golden config is only ever served once
+        assert server.add(content=CANDIDATE_CONFIG) == url
+        assert url.startswith(f"http://127.0.0.1:{server.port}/")
+
+        with urllib.request.urlopen(url, timeout=10) as http_response:
+            assert http_response.read().decode() == CANDIDATE_CONFIG
+
+        # still referenced by the second add
+        server.discard(url=url)
+        with urllib.request.urlopen(url, timeout=10) as http_response:
+            assert http_response.read().decode() == CANDIDATE_CONFIG
+
+        server.discard(url=url)
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(url, timeout=10)
+        # discarding more than was added is a no-op
+        server.discard(url=url)
+
+    with pytest.raises(ScrapliCfgException):
+        server.add(content=CANDIDATE_CONFIG)
+
+
+def test_pull_transfer_url():
+    with CandidateFileServer(host="127.0.0.1") as server:
+        transfer = PullTransfer(server=server, vrf="management")
+        assert transfer.url(config=CANDIDATE_CONFIG) == server.add(content=CANDIDATE_CONFIG)
+
+
+def test_candidate_file_server_default_host():
+    server = CandidateFileServer()
+    assert server.host == "127.0.0.1"
+    assert server.advertise_host == "127.0.0.1"
+
+
+def test_pull_transfer_discard():
+    with CandidateFileServer(host="127.0.0.1") as server:
+        transfer = PullTransfer(server=server)
+        url = transfer.url(config=CANDIDATE_CONFIG)
+        transfer.discard(url=url)
+        assert server._server.files == {}
+        assert server._server.references == {}